@@ -0,0 +1,89 @@
+"""
+Compare the memory used by 100k of the slotted collection models with the same models using an instance `__dict__`.
+
+Run from the root of the repository:
+
+    python benchmarks/slotted_models.py
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hypixelio.models.friends import FriendData  # noqa: E402
+from hypixelio.models.skyblock.auction import SkyblockAuction  # noqa: E402
+from hypixelio.models.skyblock.bazaar.bazaar_item import SkyblockBazaarItem  # noqa: E402
+
+COUNT = 100_000
+
+SAMPLES: Dict[type, Dict[str, Any]] = {
+    SkyblockAuction: {
+        "_id": "6e7e8b5dc7a64a6a9f1c5c8b9d0a1b2c",
+        "uuid": "6e7e8b5dc7a64a6a9f1c5c8b9d0a1b2c",
+        "auctioneer": "5e22209be5864a088761aa6bde56a090",
+        "item_name": "Aspect of the End",
+        "item_lore": "§9Sharpness V",
+        "category": "weapon",
+        "tier": "RARE",
+        "starting_bid": 100,
+        "bin": True,
+        "start": 1600000000000,
+        "end": 1600000600000,
+        "highest_bid_amount": 0,
+    },
+    FriendData: {
+        "_id": "5f2c1b3a9e8d7c6b5a4f3e2d",
+        "uuidSender": "5e22209be5864a088761aa6bde56a090",
+        "uuidReceiver": "2a13b3a34bf343fa9d8db0f87187da39",
+        "started": 1600000000000,
+    },
+    SkyblockBazaarItem: {
+        "productId": "ENCHANTED_DIAMOND",
+        "sellPrice": 1190.5,
+        "sellVolume": 300,
+        "sellMovingWeek": 100000,
+        "sellOrders": 4,
+        "buyPrice": 1250.0,
+        "buyVolume": 1000,
+        "buyMovingWeek": 90000,
+        "buyOrders": 10,
+    },
+}
+
+
+def with_dict(model: type) -> type:
+    """Copy a slotted model, storing its attributes in an instance `__dict__` instead."""
+    namespace = {
+        name: value
+        for name, value in vars(model).items()
+        if name not in model.__slots__ and name not in ("__slots__", "__dict__", "__weakref__")
+    }
+
+    return type(model.__name__, model.__bases__, namespace)
+
+
+def traced_memory(model: Callable[[Dict[str, Any]], Any], data: Dict[str, Any]) -> float:
+    """The memory in MiB allocated by `COUNT` objects of a model."""
+    tracemalloc.start()
+
+    objects = [model(data) for _ in range(COUNT)]
+    size = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    del objects
+
+    return size / 2 ** 20
+
+
+def main() -> None:
+    print(f"Traced memory for {COUNT:,} objects on Python {sys.version.split()[0]}:")
+
+    for model, data in SAMPLES.items():
+        before, after = traced_memory(with_dict(model), data), traced_memory(model, data)
+        print(f"  {model.__name__:<20}{before:5.1f} MiB -> {after:5.1f} MiB ({1 - after / before:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,11 @@ from typing import Tuple
 from . import constants
 from ._async import AsyncClient, AsyncConverters
 from ._async import Utils as AsyncUtils
+from .auctions import AuctionSearchIndex, AuctionTable, AuctionTracker, PriceIndex
+from .bazaar import BazaarArrays, BazaarRecorder
+from .cache import ResponseCache, SQLiteCache
 from .lib import Client, Converters, Utils
+from .retry import RetryPolicy
 
 __author__ = "Sunrit Jana"
 __email__ = "warriordefenderz@gmail.com"
@@ -20,8 +24,17 @@ __all__: Tuple[str, ...] = (
     "AsyncClient",
     "AsyncConverters",
     "AsyncUtils",
+    "AuctionSearchIndex",
+    "AuctionTable",
+    "AuctionTracker",
+    "BazaarArrays",
+    "BazaarRecorder",
     "Client",
     "Converters",
+    "PriceIndex",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteCache",
     "Utils",
     "constants",
 )
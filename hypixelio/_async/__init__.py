@@ -1,3 +1,4 @@
 from .client import AsyncClient
 from .converters import AsyncConverters
+from .session import SessionRegistry
 from .utils import Utils
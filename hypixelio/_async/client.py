@@ -1,12 +1,21 @@
 __all__ = ("AsyncClient",)
 
 import asyncio
+import functools
 import random
+import time
+from concurrent.futures import Executor
 from types import TracebackType
 from typing import (
     Any,
+    AsyncIterator,
+    Callable,
     Dict,
+    Iterable,
+    List,
     Optional,
+    Set,
+    Tuple,
     Type,
     Union,
     cast
@@ -15,8 +24,13 @@ from typing import (
 import aiohttp
 
 from .converters import AsyncConverters
+from .session import SESSIONS, SessionRegistry
+from .utils import Utils
+from .. import json_backend
+from ..auctions import AuctionTable
 from ..base import BaseClient
-from ..constants import HYPIXEL_API, TIMEOUT
+from ..cache import BaseCache, CacheEntry, SQLiteCache
+from ..constants import HYPIXEL_API, MAX_CONCURRENT_REQUESTS, MAX_RATELIMIT_WAIT, OFFLOAD_THRESHOLD, TIMEOUT
 from ..exceptions import (
     GuildNotFoundError,
     HypixelAPIError,
@@ -31,20 +45,26 @@ from ..models.games import Games
 from ..models.guild import Guild
 from ..models.key import Key
 from ..models.leaderboard import Leaderboard
-from ..models.player import Player
+from ..models.player import LazyPlayer, Player
 from ..models.player_status import PlayerStatus
 from ..models.recent_games import RecentGames
 from ..models.skyblock import (
     SkyblockActiveAuction,
     SkyblockBazaar,
+    SkyblockEndedAuctions,
     SkyblockNews,
     SkyblockProfile,
     SkyblockUserAuction,
 )
 from ..models.watchdog import Watchdog
+from ..retry import RetryPolicy
 from ..utils import form_url
 
 
+class _LargePayload(dict):
+    """The payload of a large response, whose models are built off the event loop too."""
+
+
 class AsyncClient(BaseClient):
     """
     The client for this wrapper that handles the requests, authentication, loading and usages of the end user.
@@ -62,31 +82,118 @@ class AsyncClient(BaseClient):
     You can use multiple API keys to authenticate too. (Better option for load balancing)
 
         >>> client = AsyncClient(api_key=["123-456", "789-000", "568-908"])
+
+    Requests made concurrently, e.g. using `asyncio.gather`, are sent in parallel up to `max_concurrency`.
+
+        >>> client = AsyncClient(api_key="123-456-789", max_concurrency=25)
+
+    To wait for the ratelimit to reset instead of raising `RateLimitError`, enable `wait_on_ratelimit`.
+
+        >>> client = AsyncClient(api_key="123-456-789", wait_on_ratelimit=True, max_ratelimit_wait=30)
+
+    Large responses, such as the auction pages, are decoded and their models built in an executor, so that the
+    other coroutines keep running meanwhile. The executor and the size threshold can be configured.
+
+        >>> client = AsyncClient(api_key="123-456-789", executor=ThreadPoolExecutor(4), offload_threshold=1024 ** 2)
+
+    To skip building the models, such as when storing the responses, enable `raw` to get the JSON payloads. The
+    undecoded response bodies can be fetched using `get_raw`.
+
+        >>> client = AsyncClient(api_key="123-456-789", raw=True)
+        >>> body = await client.get_raw("skyblock_bazaar", decode=False)
     """
 
-    def __init__(self, api_key: Union[str, list]) -> None:
+    def __init__(
+        self,
+        api_key: Union[str, list],
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        wait_on_ratelimit: bool = False,
+        max_ratelimit_wait: float = MAX_RATELIMIT_WAIT,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[BaseCache] = None,
+        cache_ttl: Optional[Dict[str, float]] = None,
+        sessions: Optional[SessionRegistry] = None,
+        raw: bool = False,
+        executor: Optional[Executor] = None,
+        offload_threshold: Optional[int] = OFFLOAD_THRESHOLD,
+    ) -> None:
         """
         Parameters
         ----------
         api_key: Union[str, list]
             The API key generated in Hypixel server using the `/api new` command.
-        """
-        super().__init__(api_key)
-
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._lock = asyncio.Lock()
+        max_concurrency: int
+            The maximum amount of requests to the Hypixel API in-flight at once. Defaults to 10.
+        wait_on_ratelimit: bool
+            Wait for a key to be available when all of them are ratelimited, instead of raising. Defaults to False.
+        max_ratelimit_wait: float
+            The maximum seconds to wait for a key before raising `RateLimitError`. Defaults to 60.
+        retry_policy: Optional[RetryPolicy]
+            The policy for retrying the failed requests. Defaults to retrying ratelimits, 5xx errors and timeouts.
+        cache: Optional[BaseCache]
+            The cache to store the responses in, such as `ResponseCache`. Defaults to None, which disables caching.
+        cache_ttl: Optional[Dict[str, float]]
+            The seconds to cache the responses for, by the endpoint names. Defaults to the TTLs in `CACHE_TTL`.
+        sessions: Optional[SessionRegistry]
+            The registry of the pooled sessions to use, for the `converters` and `utils` of the client too. Defaults
+            to the one shared with `AsyncConverters` and `Utils`.
+        raw: bool
+            Give the decoded JSON payloads from the `get_*` methods instead of building the models. Defaults to False.
+        executor: Optional[Executor]
+            The thread or process pool to decode the large responses and build their models in. Defaults to None,
+            which uses the default executor of the event loop.
+        offload_threshold: Optional[int]
+            The size in bytes from which the responses are handled in the executor, or None to never do so.
+            Defaults to 256 KiB.
+        """
+        super().__init__(
+            api_key,
+            wait_on_ratelimit=wait_on_ratelimit,
+            max_ratelimit_wait=max_ratelimit_wait,
+            retry_policy=retry_policy,
+            cache=cache,
+            cache_ttl=cache_ttl,
+            raw=raw,
+        )
+
+        if max_concurrency < 1:
+            raise InvalidArgumentError("The maximum concurrency must be atleast 1.")
+
+        self._sessions = sessions or SESSIONS
+
+        # The converters and utils using the same sessions, so they're closed along with the client
+        self.converters = AsyncConverters.with_sessions(self._sessions)
+        self.utils = Utils.with_sessions(self._sessions)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Handling of the large responses off the event loop
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+
+        # The requests in-flight by their route and parameters, to share their responses
+        self._in_flight: Dict[str, "asyncio.Future[Union[dict, bytes]]"] = {}
 
     async def close(self) -> None:
         """Close the AIOHTTP sessions to prevent memory leaks."""
-        if self._session is not None:
-            await self._session.close()
+        await self._sessions.close()
+
+    async def _acquire_key(self) -> str:
+        """Reserve a request from the least loaded key, waiting for one to be available if enabled."""
+        deadline = time.monotonic() + self.max_ratelimit_wait
+
+        while True:
+            try:
+                return self._select_key()
+            except RateLimitError:
+                await asyncio.sleep(self._ratelimit_delay(deadline))
 
     async def _fetch(
         self,
         url: str,
         data: Optional[Dict[str, Any]] = None,
         api_key: bool = True,
-    ) -> dict:
+        decode: bool = True,
+    ) -> Union[dict, bytes]:
         """
         Fetch the JSON response from the API along with the ability to include GET request parameters and support
         Authentication using API key too.
@@ -99,73 +206,157 @@ class AsyncClient(BaseClient):
             The GET Request's Key-Value Pair. Example: {"uuid": "abc"} is converted to `?uuid=abc`. Defaults to None.
         api_key: bool
             If key is needed for the endpoint.
+        decode: bool
+            Decode the JSON response, instead of giving the undecoded body. Defaults to True.
 
         Returns
         -------
-        Tuple[dict, bool]
+        Union[dict, bytes]
             The JSON response obtained after fetching the API, along with success value in the response.
         """
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-
-        # Check if ratelimit is hit
-        if self._is_ratelimit_hit():
-            raise RateLimitError(self.retry_after)
-
         if not data:
             data = {}
 
-        # Assign a random key
-        if api_key:
-            self.headers["API-Key"] = random.choice(self._api_key)
+        # Share the response of an identical request already in-flight, instead of sending it again
+        request_key = BaseCache.make_key(url, data) + ("" if decode else "#body")
+        task = self._in_flight.get(request_key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._request(url, data, api_key, decode))
+            self._in_flight[request_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(request_key, None))
+
+        # Shielded, so that a cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
 
-        url = form_url(HYPIXEL_API, url, data)
+    async def _request(self, url: str, data: Dict[str, Any], api_key: bool, decode: bool = True) -> Union[dict, bytes]:
+        """Send the request for `_fetch`, along with caching, retrying and ratelimit handling."""
+        # Use the cached response if there's one, or revalidate it once expired
+        cached = await self._cache_io(self._get_cached, url, data)
+        if cached is not None and not cached.expired:
+            return self._cached_payload(cached, decode)
 
-        async with self._lock:
-            async with self._session.get(
-                url, headers=self.headers, timeout=TIMEOUT
-            ) as response:
-                # 404 handling
-                if response.status == 429:
-                    raise HypixelAPIError("The route specified does not exis")
+        route, url = url, form_url(HYPIXEL_API, url, data)
 
-                # 429 status code handling
-                if response.status == 429:
-                    self._handle_ratelimit(cast(dict, response.headers))
+        attempt = 0
+        while True:
+            attempt += 1
 
-                # 403 Status code handling
-                if response.status == 403:
-                    raise HypixelAPIError("Invalid key specified!")
+            # Use a copy of the headers, since the requests run concurrently
+            headers = dict(self.headers)
+            if cached is not None:
+                headers.update(cached.revalidation_headers)
 
-                if api_key and "RateLimit-Limit" in response.headers:
-                    self._update_ratelimit(cast(dict, response.headers))
+            async with self._semaphore:
+                # Pick the least loaded key once a slot is free, as the budgets could've been spent while waiting
+                key = await self._acquire_key() if api_key else None
+                if key:
+                    headers["API-Key"] = key
 
                 try:
-                    json = await response.json()
-                except Exception as exception:
-                    raise HypixelAPIError(f"{exception}")
-                else:
-                    if not json["success"]:
-                        self._handle_api_failure(json)
+                    async with self._sessions.get("hypixel").get(
+                        url, headers=headers, timeout=TIMEOUT
+                    ) as response:
+                        resp_headers = cast(dict, response.headers)
+
+                        # The cached response hasn't changed
+                        if response.status == 304 and cached is not None:
+                            if key:
+                                self._update_ratelimit(key, resp_headers)
+
+                            return await self._cache_io(self._refresh_cached, route, data, cached, decode)
+
+                        delay = self._retry_delay(attempt, key, response.status, resp_headers)
+
+                        if delay is None:
+                            self._check_response(key, response.status, resp_headers)
+
+                            body = await response.read()
+                            payload = None
+
+                            if self._is_large(body) and self._needs_decoding(route, response.status, decode):
+                                payload = await self._decode(body)
+
+                            # Cached in a thread for the SQLite cache, as it writes the whole body to the disk
+                            return await self._cache_io(
+                                self._load_response, route, data, body, response.status, resp_headers, decode, payload
+                            )
+                except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as exception:
+                    delay = self._retry_delay(attempt)
+
+                    if delay is None:
+                        raise HypixelAPIError(f"{exception}") from exception
+
+            # Wait outside the semaphore, so the other requests can use the slot meanwhile
+            await asyncio.sleep(delay)
+
+    def _is_large(self, body: bytes) -> bool:
+        """Check if a response body is large enough to be handled off the event loop."""
+        return self.offload_threshold is not None and len(body) >= self.offload_threshold
+
+    async def _offload(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a function in the executor, keeping the event loop free for the other coroutines meanwhile."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(function, *args))
 
-                    return json
+    async def _cache_io(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a cache operation, in a thread for the SQLite cache as it reads, writes and deletes on the disk."""
+        if self.offload_threshold is None or not isinstance(self.cache, SQLiteCache):
+            return function(*args)
 
-    @staticmethod
-    async def _filter_name_uuid(name: Optional[str] = None, uuid: Optional[str] = None) -> str:
+        # The default executor of the loop is used, as the database connection can't be sent to other processes
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(function, *args))
+
+    def _cached_payload(  # type: ignore[override]
+        self, entry: CacheEntry, decode: bool = True
+    ) -> Union[Dict[str, Any], bytes]:
+        """Get the payload of a cached response, marking the large ones so that their models are built off the loop."""
+        payload = super()._cached_payload(entry, decode)
+
+        if decode and self.offload_threshold is not None and entry.size >= self.offload_threshold:
+            return _LargePayload(payload)
+
+        return payload
+
+    async def _decode(self, body: bytes) -> Dict[str, Any]:
+        """Decode a large response body in the executor, marking it so that its models are built there too."""
+        try:
+            return _LargePayload(await self._offload(json_backend.loads, body))
+        except Exception as exc:
+            raise HypixelAPIError(f"{exc}")
+
+    async def _build(self, data: Any, model: Callable[..., Any], *args: Any) -> Any:
+        """Build the model of a response, in the executor if the response, or one of its pages is large."""
+        pages = data if isinstance(data, list) else [data]
+
+        if any(isinstance(page, _LargePayload) for page in pages):
+            return await self._offload(model, *args)
+
+        return model(*args)
+
+    async def _model(self, data: Any, model: Callable[..., Any], *args: Any) -> Any:  # type: ignore[override]
+        """Build the model of a response like `_build`, or give the decoded payload in the raw mode."""
+        if self.raw:
+            return data
+
+        return await self._build(data, model, *args)
+
+    async def _filter_name_uuid(  # type: ignore[override]
+        self, name: Optional[str] = None, uuid: Optional[str] = None
+    ) -> str:
         if not name and not uuid:
             raise InvalidArgumentError(
                 "Named argument for player's either username or UUID not found."
             )
 
         if name:
-            uuid = await AsyncConverters.username_to_uuid(name)
+            uuid = await self.converters.username_to_uuid(name)
 
         return uuid  # type: ignore
 
     # Context managers
     async def __aenter__(self) -> "AsyncClient":
-        self._session = aiohttp.ClientSession()
-
         return self
 
     async def __aexit__(
@@ -174,8 +365,34 @@ class AsyncClient(BaseClient):
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        if self._session is not None:
-            await self._session.close()
+        await self.close()
+
+    async def get_raw(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None, decode: bool = True
+    ) -> Union[dict, bytes]:
+        """
+        Get the response of a Hypixel API endpoint without building any models, using the same caching, retrying
+        and ratelimit handling as the other methods.
+
+        Parameters
+        ----------
+        endpoint: str
+            The name of the endpoint in `API_PATH`, such as `skyblock_bazaar`.
+        params: Optional[Dict[str, Any]]
+            The query parameters of the request, such as `{"page": 2}`. Defaults to None.
+        decode: bool
+            Decode the JSON payload, instead of giving the undecoded response body. Defaults to True.
+
+        Returns
+        -------
+        Union[dict, bytes]
+            The decoded JSON payload, or the response body if not decoded.
+        """
+        if endpoint not in self.url:
+            raise InvalidArgumentError(f"Unknown endpoint specified: {endpoint}")
+
+        route = self.url[endpoint]
+        return await self._fetch(route, params, api_key=not route.startswith("/resources/"), decode=decode)
 
     # Hypixel API endpoint methods
     async def get_key_info(self, api_key: Optional[str] = None) -> Key:
@@ -196,7 +413,7 @@ class AsyncClient(BaseClient):
             api_key = random.choice(self._api_key)
 
         json = await self._fetch(self.url["api_key"], {"key": api_key})
-        return Key(json["record"])
+        return await self._model(json, Key, json["record"])
 
     async def get_boosters(self) -> Boosters:
         """
@@ -209,10 +426,10 @@ class AsyncClient(BaseClient):
         """
         json = await self._fetch(self.url["boosters"])
 
-        return Boosters(json["boosters"], json)
+        return await self._model(json, Boosters, json["boosters"], json)
 
     async def get_player(
-        self, name: Optional[str] = None, uuid: Optional[str] = None
+        self, name: Optional[str] = None, uuid: Optional[str] = None, lazy: bool = False
     ) -> Player:
         """
         Get all info about a Hypixel player using his username or his player UUID.
@@ -223,6 +440,8 @@ class AsyncClient(BaseClient):
             The Optional string value for the Username. Defaults to None.
         uuid: Optional[str]
             The Optional string Value to the UUID. Defaults to None.
+        lazy: bool
+            Parse the fields of the player on their first access, instead of upfront. Defaults to False.
 
         Returns
         -------
@@ -235,7 +454,86 @@ class AsyncClient(BaseClient):
         if not json["player"]:
             raise PlayerNotFoundError("Null is returned", name)
 
-        return Player(json["player"])
+        return await self._model(json, LazyPlayer if lazy else Player, json["player"])
+
+    async def iter_players(
+        self, uuids: Iterable[str], concurrency: int = MAX_CONCURRENT_REQUESTS, lazy: bool = False
+    ) -> AsyncIterator[Tuple[str, Union[Player, Exception]]]:
+        """
+        Get many players concurrently, yielding them as soon as they're fetched.
+
+        The errors for a player, such as `PlayerNotFoundError`, `RateLimitError` or a connection error, are yielded in
+        the place of the player instead of stopping the others.
+
+        Parameters
+        ----------
+        uuids: Iterable[str]
+            The UUIDs of the players to get.
+        concurrency: int
+            The maximum amount of players fetched at once. Defaults to 10.
+        lazy: bool
+            Parse the fields of the players on their first access, instead of upfront. Defaults to False.
+
+        Returns
+        -------
+        AsyncIterator[Tuple[str, Union[Player, Exception]]]
+            The UUID of every player along with the player object, or the error raised while getting it.
+        """
+        async def fetch(uuid: str) -> Tuple[str, Union[Player, Exception]]:
+            try:
+                return uuid, await self.get_player(uuid=uuid, lazy=lazy)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                return uuid, exception
+
+        remaining = iter(uuids)
+        pending: Set["asyncio.Future[Tuple[str, Union[Player, Exception]]]"] = set()
+
+        try:
+            while True:
+                # Keep the tasks running, without creating them for all the players at once
+                for uuid in remaining:
+                    pending.add(asyncio.ensure_future(fetch(uuid)))
+
+                    if len(pending) >= concurrency:
+                        break
+
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # Stop the remaining tasks, if the iteration is stopped early
+            for task in pending:
+                task.cancel()
+
+    async def get_players(
+        self, uuids: Iterable[str], concurrency: int = MAX_CONCURRENT_REQUESTS, lazy: bool = False
+    ) -> Dict[str, Union[Player, Exception]]:
+        """
+        Get many players concurrently.
+
+        Parameters
+        ----------
+        uuids: Iterable[str]
+            The UUIDs of the players to get.
+        concurrency: int
+            The maximum amount of players fetched at once. Defaults to 10.
+        lazy: bool
+            Parse the fields of the players on their first access, instead of upfront. Defaults to False.
+
+        Returns
+        -------
+        Dict[str, Union[Player, Exception]]
+            The UUIDs mapped to their player object, or the error raised while getting it, in the order given.
+        """
+        uuids = list(uuids)
+        players = {uuid: player async for uuid, player in self.iter_players(uuids, concurrency, lazy)}
+
+        return {uuid: players[uuid] for uuid in uuids}
 
     async def get_friends(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -258,7 +556,7 @@ class AsyncClient(BaseClient):
         uuid = await self._filter_name_uuid(name, uuid)
         json = await self._fetch(self.url["friends"], {"uuid": uuid})
 
-        return Friends(json["records"])
+        return await self._model(json, Friends, json["records"])
 
     async def get_watchdog_info(self) -> Watchdog:
         """
@@ -271,7 +569,7 @@ class AsyncClient(BaseClient):
         """
         json = await self._fetch(self.url["watchdog"])
 
-        return Watchdog(json)
+        return await self._model(json, Watchdog, json)
 
     async def get_guild(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -303,7 +601,7 @@ class AsyncClient(BaseClient):
         if not json["guild"]:
             raise GuildNotFoundError("Value returned is null")
 
-        return Guild(json["guild"])
+        return await self._model(json, Guild, json["guild"])
 
     async def get_games_info(self) -> Games:
         """
@@ -316,7 +614,7 @@ class AsyncClient(BaseClient):
         """
         json = await self._fetch(self.url["game_info"])
 
-        return Games(json["games"], json["playerCount"])
+        return await self._model(json, Games, json["games"], json["playerCount"])
 
     async def get_leaderboards(self) -> Leaderboard:
         """
@@ -329,7 +627,7 @@ class AsyncClient(BaseClient):
         """
         json = await self._fetch(self.url["leaderboards"])
 
-        return Leaderboard(json["leaderboards"])
+        return await self._model(json, Leaderboard, json["leaderboards"])
 
     async def find_guild(
         self, guild_name: Optional[str] = None, player_uuid: Optional[str] = None
@@ -358,7 +656,7 @@ class AsyncClient(BaseClient):
                 "Named argument for guild's name or UUID not found."
             )
 
-        return FindGuild(json)
+        return await self._model(json, FindGuild, json)
 
     async def get_player_status(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -381,7 +679,7 @@ class AsyncClient(BaseClient):
         uuid = await self._filter_name_uuid(name, uuid)
         json = await self._fetch(self.url["status"], {"uuid": uuid})
 
-        return PlayerStatus(json)
+        return await self._model(json, PlayerStatus, json)
 
     async def get_player_recent_games(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -404,12 +702,12 @@ class AsyncClient(BaseClient):
         uuid = await self._filter_name_uuid(name, uuid)
         json = await self._fetch(self.url["recent_games"], {"uuid": uuid})
 
-        return RecentGames(json)
+        return await self._model(json, RecentGames, json)
 
     async def get_skyblock_news(self) -> SkyblockNews:
         json = await self._fetch(self.url["skyblock_news"])
 
-        return SkyblockNews(json)
+        return await self._model(json, SkyblockNews, json)
 
     async def get_skyblock_profile(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -435,7 +733,7 @@ class AsyncClient(BaseClient):
         if not json["profile"]:
             raise PlayerNotFoundError("The skyblock player does not exist", uuid)
 
-        return SkyblockProfile(json)
+        return await self._model(json, SkyblockProfile, json)
 
     async def get_skyblock_user_auctions(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -461,7 +759,7 @@ class AsyncClient(BaseClient):
         if not json["auctions"]:
             raise PlayerNotFoundError("The skyblock player does not exist!", uuid)
 
-        return SkyblockUserAuction(json)
+        return await self._model(json, SkyblockUserAuction, json)
 
     async def get_skyblock_active_auctions(
         self, page: int = 0
@@ -480,7 +778,113 @@ class AsyncClient(BaseClient):
             The active auction model.
         """
         json = await self._fetch(self.url["skyblock_active_auctions"], {"page": page})
-        return SkyblockActiveAuction(json)
+        return await self._model(json, SkyblockActiveAuction, json)
+
+    async def fetch_all_active_auctions(
+        self, concurrency: int = MAX_CONCURRENT_REQUESTS, max_restarts: int = 3
+    ) -> SkyblockActiveAuction:
+        """
+        Get the active auctions in skyblock from all the pages as one consistent snapshot, fetching the pages
+        concurrently.
+
+        Every page is checked to be from the same update of the auction house, and the crawl is restarted if the
+        auction house is updated partway through.
+
+        Parameters
+        ----------
+        concurrency: int
+            The maximum amount of pages fetched at once. Defaults to 10.
+        max_restarts: int
+            The times to restart the crawl if the auction house is updated during it. Defaults to 3.
+
+        Returns
+        -------
+        SkyblockActiveAuction
+            The active auction model, with the auctions from all the pages.
+        """
+        pages = await self._crawl_active_auctions(concurrency, max_restarts)
+        return await self._model(pages, SkyblockActiveAuction.from_pages, pages)
+
+    async def fetch_auction_table(
+        self, concurrency: int = MAX_CONCURRENT_REQUESTS, max_restarts: int = 3
+    ) -> AuctionTable:
+        """
+        Get the active auctions in skyblock from all the pages as one consistent snapshot, stored in a compact
+        columnar table instead of an object for every auction.
+
+        Parameters
+        ----------
+        concurrency: int
+            The maximum amount of pages fetched at once. Defaults to 10.
+        max_restarts: int
+            The times to restart the crawl if the auction house is updated during it. Defaults to 3.
+
+        Returns
+        -------
+        AuctionTable
+            The table with the auctions from all the pages.
+        """
+        pages = await self._crawl_active_auctions(concurrency, max_restarts)
+        return await self._build(pages, AuctionTable.from_pages, pages)
+
+    async def _crawl_active_auctions(
+        self, concurrency: int = MAX_CONCURRENT_REQUESTS, max_restarts: int = 3
+    ) -> List[Dict[str, Any]]:
+        """Fetch the pages of the auction house from the same snapshot, for the auction crawlers."""
+        route = self.url["skyblock_active_auctions"]
+
+        for _ in range(max_restarts + 1):
+            first = await self._fetch(route, {"page": 0})
+            pages = [first]
+
+            remaining = iter(range(1, first["totalPages"]))
+            changed = False
+            pending: Set["asyncio.Future[Dict[str, Any]]"] = set()
+
+            try:
+                while True:
+                    # Stop sending the remaining pages once the snapshot has changed
+                    if not changed:
+                        for page in remaining:
+                            pending.add(asyncio.ensure_future(self._fetch(route, {"page": page})))
+
+                            if len(pending) >= concurrency:
+                                break
+
+                    if not pending:
+                        break
+
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        json = task.result()
+                        pages.append(json)
+
+                        changed = changed or json.get("lastUpdated") != first.get("lastUpdated")
+            finally:
+                # Stop the remaining pages, if a page failed
+                for task in pending:
+                    task.cancel()
+
+            if not changed:
+                return sorted(pages, key=lambda json: json["page"])
+
+            # Drop the cached pages from the older snapshot, so that they're fetched again
+            for page in self._outdated_pages(pages):
+                await self._cache_io(self._uncache, route, {"page": page})
+
+        raise HypixelAPIError("The auction house kept updating while fetching all of its pages")
+
+    async def get_skyblock_ended_auctions(self) -> SkyblockEndedAuctions:
+        """
+        Get the auctions in skyblock which ended within the last minute.
+
+        Returns
+        -------
+        SkyblockEndedAuctions
+            The ended auctions model.
+        """
+        json = await self._fetch(self.url["skyblock_ended_auctions"])
+        return await self._model(json, SkyblockEndedAuctions, json)
 
     async def get_skyblock_bazaar(self) -> SkyblockBazaar:
         """
@@ -492,26 +896,46 @@ class AsyncClient(BaseClient):
             The bazaar model object representing each produc
         """
         json = await self._fetch(self.url["skyblock_bazaar"])
-        return SkyblockBazaar(json)
+        return await self._model(json, SkyblockBazaar, json)
 
     async def get_resources_achievements(self) -> dict:
         data = await self._fetch(self.url["achievements"], api_key=False)
+
+        if self.raw:
+            return data
+
         return data["achievements"]
 
     async def get_resources_challenges(self) -> dict:
         data = await self._fetch(self.url["challenges"], api_key=False)
+
+        if self.raw:
+            return data
+
         return data["challenges"]
 
     async def get_resources_quests(self) -> dict:
         data = await self._fetch(self.url["quests"], api_key=False)
+
+        if self.raw:
+            return data
+
         return data["quests"]
 
     async def get_resources_guild_achievements(self) -> dict:
         data = await self._fetch(self.url["guild_achievements"], api_key=False)
+
+        if self.raw:
+            return data
+
         return {"one_time": data["one_time"], "tiered": data["tiered"]}
 
     async def get_skyblock_skills(self) -> dict:
         data = await self._fetch(self.url["skyblock_skills"], api_key=False)
+
+        if self.raw:
+            return data
+
         return {
             "skills": data["skills"],
             "collections": data["collections"],
@@ -519,4 +943,8 @@ class AsyncClient(BaseClient):
 
     async def get_skyblock_collections(self) -> dict:
         data = await self._fetch(self.url["skyblock_collections"], api_key=False)
+
+        if self.raw:
+            return data
+
         return data["collections"]
@@ -1,10 +1,13 @@
 __all__ = ("AsyncConverters",)
 
-from typing import Any, Dict, Union, cast
+import asyncio
+from typing import Any, Dict, List, Optional, Type, Union, cast
 
 import aiohttp
 
-from ..constants import MOJANG_API, TIMEOUT
+from .session import SESSIONS, SessionRegistry
+from ..cache import UUID_CACHE
+from ..constants import MOJANG_API, MOJANG_BATCH_SIZE, MOJANG_CONCURRENCY, TIMEOUT
 from ..endpoints import API_PATH
 from ..exceptions import MojangAPIError, PlayerNotFoundError
 
@@ -12,8 +15,34 @@ from ..exceptions import MojangAPIError, PlayerNotFoundError
 class AsyncConverters:
     url = API_PATH["MOJANG"]
 
+    # Cache of the conversions, shared with the other converters
+    cache = UUID_CACHE
+
+    # The pooled sessions, shared with the async client and utils
+    sessions = SESSIONS
+
     @classmethod
-    async def _fetch(cls, url: str) -> Union[dict, list]:
+    def with_sessions(cls, sessions: SessionRegistry) -> Type["AsyncConverters"]:
+        """
+        Get the converters using another registry of the pooled sessions, such as the one of an async client.
+
+        Parameters
+        ----------
+        sessions: SessionRegistry
+            The registry of the sessions to send the requests using.
+
+        Returns
+        -------
+        Type[AsyncConverters]
+            The converters bound to the registry, sharing the conversions cache with the others.
+        """
+        if sessions is cls.sessions:
+            return cls
+
+        return cast(Type["AsyncConverters"], type(cls.__name__, (cls,), {"sessions": sessions}))
+
+    @classmethod
+    async def _fetch(cls, url: str, data: Optional[list] = None) -> Union[dict, list]:
         """
         The internal function for fetching info from the Mojang API.
 
@@ -21,15 +50,19 @@ class AsyncConverters:
         ----------
         url: str
             The Mojang URL, whose JSON is supposed to be fetched.
+        data: Optional[list]
+            The JSON body to send using a POST request, instead of a GET request. Defaults to None.
 
         Returns
         -------
         Union[dict, list]
             The JSON response from the Mojang API.
         """
-        session = aiohttp.ClientSession()
+        session = cls.sessions.get("mojang")
 
-        async with session.get(f"{MOJANG_API}{url}", timeout=TIMEOUT) as response:
+        async with session.request(
+            "GET" if data is None else "POST", f"{MOJANG_API}{url}", json=data, timeout=TIMEOUT
+        ) as response:
             if response.status == 204:
                 raise PlayerNotFoundError(
                     "Error code 204 returned during conversion to UUID.", None
@@ -63,15 +96,77 @@ class AsyncConverters:
         str
             returns the converted UUID for the respective username.
         """
-        json = cast(
-            Dict[str, Any],
-            await AsyncConverters._fetch(
-                AsyncConverters.url["username_to_uuid"].format(username)
-            ),
-        )
-
+        uuid = cls.cache.get_uuid(username)
+        if uuid is not None:
+            return uuid
+
+        try:
+            json = cast(
+                Dict[str, Any],
+                await cls._fetch(
+                    cls.url["username_to_uuid"].format(username)
+                ),
+            )
+        except PlayerNotFoundError:
+            cls.cache.set_missing(username)
+            raise
+
+        cls.cache.set(json.get("name", username), json["id"])
         return json["id"]
 
+    @classmethod
+    async def usernames_to_uuids(
+        cls, usernames: List[str], max_concurrency: int = MOJANG_CONCURRENCY
+    ) -> Dict[str, str]:
+        """
+        Convert many usernames to their UUIDs at once, using the Mojang bulk endpoint which resolves 10 usernames per
+        request. The batches are sent concurrently.
+
+        Parameters
+        ----------
+        usernames: List[str]
+            The minecraft usernames to convert.
+        max_concurrency: int
+            The maximum amount of batches requested at once. Defaults to 4.
+
+        Returns
+        -------
+        Dict[str, str]
+            The usernames mapped to their UUIDs. The usernames which don't exist, or couldn't be resolved such as when
+            ratelimited, are left out.
+        """
+        uuids, pending = cls.cache.split_cached(usernames)
+        batches = [pending[i:i + MOJANG_BATCH_SIZE] for i in range(0, len(pending), MOJANG_BATCH_SIZE)]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def resolve_batch(batch: List[str]) -> Dict[str, str]:
+            try:
+                async with semaphore:
+                    profiles = cast(
+                        list,
+                        await cls._fetch(cls.url["usernames_to_uuids"], batch),
+                    )
+            except PlayerNotFoundError:
+                # A badly formed username fails the whole batch, so the halves are resolved until it's found
+                if len(batch) == 1:
+                    cls.cache.set_missing(batch[0])
+                    return {}
+
+                middle = len(batch) // 2
+                first, second = await asyncio.gather(resolve_batch(batch[:middle]), resolve_batch(batch[middle:]))
+                return {**first, **second}
+            except (MojangAPIError, aiohttp.ClientError, asyncio.TimeoutError):
+                # Such as when ratelimited, the usernames might exist so they aren't cached as not found
+                return {}
+
+            return cls.cache.set_profiles(batch, profiles)
+
+        for batch_uuids in await asyncio.gather(*(resolve_batch(batch) for batch in batches)):
+            uuids.update(batch_uuids)
+
+        return uuids
+
     @classmethod
     async def uuid_to_username(cls, uuid: str) -> str:
         """
@@ -87,8 +182,13 @@ class AsyncConverters:
         str
             The username for the respective minecraft UUID is returned.
         """
-        json = await AsyncConverters._fetch(
-            AsyncConverters.url["uuid_to_username"].format(uuid)
+        username = cls.cache.get_username(uuid)
+        if username is not None:
+            return username
+
+        json = await cls._fetch(
+            cls.url["uuid_to_username"].format(uuid)
         )
 
+        cls.cache.set(json[-1]["name"], uuid)
         return json[-1]["name"]
@@ -0,0 +1,96 @@
+__all__ = ("SessionRegistry", "SESSIONS")
+
+import asyncio
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+
+# The default connection pool sizes of the sessions for every API.
+SESSION_LIMITS = {"hypixel": 100, "mojang": 10, "crafatar": 10}
+
+
+class SessionRegistry:
+    """
+    Registry of the pooled aiohttp sessions for every API, reusing the keep-alive connections across the requests.
+
+    The sessions are created lazily once needed, and closed together using `close`. A closed registry can be used
+    again, which creates new sessions. A single instance, `SESSIONS`, is shared by the async client, converters
+    and utils by default.
+
+    Examples
+    --------
+    Use bigger connection pools for the Hypixel API.
+
+        >>> sessions = SessionRegistry(limits={"hypixel": 200})
+        >>> client = AsyncClient(api_key="123-456-789", sessions=sessions)
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        keepalive_timeout: float = 30,
+        ttl_dns_cache: Optional[int] = 300,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        limits: Optional[Dict[str, int]]
+            The maximum connections of the session for every API, by its name. Defaults to `SESSION_LIMITS`.
+        keepalive_timeout: float
+            The seconds to keep the idle connections open for. Defaults to 30.
+        ttl_dns_cache: Optional[int]
+            The seconds to cache the resolved hostnames for, or None to cache them forever. Defaults to 300.
+        """
+        self.limits = {**SESSION_LIMITS, **(limits or {})}
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+
+        # The sessions by the API name, along with the event loop they belong to.
+        self._sessions: Dict[str, Tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} sessions={list(self._sessions)} limits={self.limits}>"
+
+    def get(self, name: str) -> aiohttp.ClientSession:
+        """
+        Get the session for an API, creating it if it doesn't exist yet, has been closed, or belongs to another
+        event loop. Needs to be called from a coroutine.
+
+        Parameters
+        ----------
+        name: str
+            The name of the API, such as `hypixel`, `mojang` or `crafatar`.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            The pooled session for the API.
+        """
+        loop = asyncio.get_running_loop()
+        session, session_loop = self._sessions.get(name, (None, None))
+
+        if session is None or session.closed or session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.limits.get(name, 100),
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=True,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[name] = (session, loop)
+
+        return session
+
+    async def close(self) -> None:
+        """Close all the sessions, to release their connections."""
+        loop = asyncio.get_running_loop()
+        sessions, self._sessions = self._sessions, {}
+
+        # The sessions of the other event loops can't be closed from this one.
+        for session, session_loop in sessions.values():
+            if not session.closed and session_loop is loop:
+                await session.close()
+
+
+# The registry shared by the async client, converters and utils.
+SESSIONS = SessionRegistry()
@@ -1,10 +1,9 @@
 __all__ = ("Utils",)
 
-from typing import Optional, Union
-
-import aiohttp
+from typing import Optional, Type, Union, cast
 
 from .converters import AsyncConverters as Converters
+from .session import SESSIONS, SessionRegistry
 from ..constants import TIMEOUT
 from ..endpoints import API_PATH
 from ..exceptions import CrafatarAPIError, InvalidArgumentError
@@ -14,6 +13,31 @@ class Utils:
     mojang_url = API_PATH["MOJANG"]
     url = API_PATH["CRAFATAR"]
 
+    # The pooled sessions, shared with the async client and converters
+    sessions = SESSIONS
+    converters = Converters
+
+    @classmethod
+    def with_sessions(cls, sessions: SessionRegistry) -> Type["Utils"]:
+        """
+        Get the utils using another registry of the pooled sessions, such as the one of an async client.
+
+        Parameters
+        ----------
+        sessions: SessionRegistry
+            The registry of the sessions to send the requests using, for the converters too.
+
+        Returns
+        -------
+        Type[Utils]
+            The utils bound to the registry.
+        """
+        if sessions is cls.sessions:
+            return cls
+
+        attributes = {"sessions": sessions, "converters": cls.converters.with_sessions(sessions)}
+        return cast(Type["Utils"], type(cls.__name__, (cls,), attributes))
+
     @classmethod
     async def _crafatar_fetch(cls, url: str) -> str:
         """
@@ -29,7 +53,7 @@ class Utils:
         ClientResponse
             The JSON response from the Crafatar API.
         """
-        session = aiohttp.ClientSession()
+        session = cls.sessions.get("crafatar")
 
         async with session.get(
             f"https://crafatar.com/{url}", timeout=TIMEOUT
@@ -44,9 +68,9 @@ class Utils:
             except Exception:
                 raise CrafatarAPIError()
 
-    @staticmethod
+    @classmethod
     async def _filter_name_uuid(
-        name: Optional[str] = None, uuid: Optional[str] = None
+        cls, name: Optional[str] = None, uuid: Optional[str] = None
     ) -> str:
         if not name and not uuid:
             raise InvalidArgumentError(
@@ -54,7 +78,7 @@ class Utils:
             )
 
         if name:
-            uuid = await Converters.username_to_uuid(name)
+            uuid = await cls.converters.username_to_uuid(name)
 
         return uuid  # type: ignore
 
@@ -100,7 +124,7 @@ class Utils:
             The list or dictionary with the name history and records.
         """
         uuid = await cls._filter_name_uuid(name, uuid)
-        json = await Converters._fetch(Utils.mojang_url["name_history"].format(uuid))
+        json = await cls.converters._fetch(cls.mojang_url["name_history"].format(uuid))
 
         if changed_at:
             return json
@@ -131,9 +155,9 @@ class Utils:
             The URL containing the image of the avatar.
         """
         uuid = await cls._filter_name_uuid(name, uuid)
-        await Utils._crafatar_fetch(Utils.url["avatar"].format(uuid))
+        await cls._crafatar_fetch(cls.url["avatar"].format(uuid))
 
-        return Utils._form_crafatar_url(Utils.url["avatar"].format(uuid))
+        return cls._form_crafatar_url(cls.url["avatar"].format(uuid))
 
     @classmethod
     async def get_head(
@@ -155,9 +179,9 @@ class Utils:
             The URL containing the image of the head.
         """
         uuid = await cls._filter_name_uuid(name, uuid)
-        await Utils._crafatar_fetch(Utils.url["head"].format(uuid))
+        await cls._crafatar_fetch(cls.url["head"].format(uuid))
 
-        return Utils._form_crafatar_url(Utils.url["head"].format(uuid))
+        return cls._form_crafatar_url(cls.url["head"].format(uuid))
 
     @classmethod
     async def get_body(
@@ -179,6 +203,6 @@ class Utils:
             The URL containing the image of the whole body.
         """
         uuid = await cls._filter_name_uuid(name, uuid)
-        await Utils._crafatar_fetch(Utils.url["body"].format(uuid))
+        await cls._crafatar_fetch(cls.url["body"].format(uuid))
 
-        return Utils._form_crafatar_url(Utils.url["body"].format(uuid))
+        return cls._form_crafatar_url(cls.url["body"].format(uuid))
@@ -0,0 +1,895 @@
+"""Storage of the skyblock auction house snapshots, and tracking of the changes between them."""
+__all__ = ("AuctionDiff", "AuctionSearchIndex", "AuctionTable", "AuctionTracker", "PriceIndex")
+
+import math
+import re
+import sys
+from array import array
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from .models.skyblock.auction import SkyblockAuction
+from .models.skyblock.ended_auctions import SkyblockEndedAuction
+from .utils import normalize_item_name, strip_formatting
+
+# The words of the item names and lores, as indexed for searching
+WORD = re.compile(r"[0-9a-z]+")
+
+
+def _import_numpy() -> Any:
+    """Import NumPy if it's installed, to filter the auction tables, as it's optional and slow to import."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+class _DictionaryColumn:
+    """Column of strings, stored as the codes of the distinct values."""
+
+    __slots__ = ("codes", "values", "_lookup", "_intern")
+
+    def __init__(
+        self,
+        values: Optional[List[str]] = None,
+        lookup: Optional[Dict[str, int]] = None,
+        intern: bool = True,
+    ) -> None:
+        self.codes = array("I")
+
+        # The distinct values are shared by the tables taken from this one
+        self.values = values if values is not None else []
+        self._lookup = lookup if lookup is not None else {}
+        self._intern = intern
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+    def append(self, value: str) -> None:
+        code = self._lookup.get(value)
+
+        if code is None:
+            # Interned, so that the values are shared by the snapshots too
+            code = self._lookup[value] = len(self.values)
+            self.values.append(sys.intern(value) if self._intern else value)
+
+        self.codes.append(code)
+
+    def code(self, value: str) -> Optional[int]:
+        return self._lookup.get(value)
+
+    def take(self, rows: Iterable[int]) -> "_DictionaryColumn":
+        column = _DictionaryColumn(self.values, self._lookup, self._intern)
+        column.codes = array("I", [self.codes[row] for row in rows])
+
+        return column
+
+
+class _UUIDColumn:
+    """Column of UUIDs, stored as 16 bytes each."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes = b"") -> None:
+        self.data = bytearray(data)
+
+    def __getitem__(self, row: int) -> str:
+        return self.data[row * 16:row * 16 + 16].hex()
+
+    def append(self, uuid: str) -> None:
+        self.data += bytes.fromhex(uuid.replace("-", ""))
+
+    def take(self, rows: Iterable[int]) -> "_UUIDColumn":
+        return _UUIDColumn(b"".join(self.data[row * 16:row * 16 + 16] for row in rows))
+
+
+class AuctionTable:
+    """
+    Compact columnar storage for a snapshot of the active auctions, built straight from the pages of the auction
+    house without creating an object for every auction.
+
+    The numbers are stored in typed arrays, the UUIDs as bytes, and the item names, lores, tiers and categories as
+    the codes of their distinct values. The `SkyblockAuction` objects are only created when accessed, without the
+    list of bids, and using the UUID as their id. The filters mask the columns using NumPy when it's installed, and
+    loop over the rows otherwise.
+
+    Examples
+    --------
+    Find the cheapest legendary BIN auctions.
+
+        >>> table = client.fetch_auction_table()
+        >>> cheapest = table.filter(tier="LEGENDARY", bin=True).sort("price")
+        >>> for auction in cheapest[:10]:
+        ...     print(auction.item_name, cheapest.price(0))
+    """
+
+    # The columns which can be used to sort the table
+    NUMERIC_COLUMNS = ("starting_bid", "highest_bid", "start", "end", "bid_count")
+
+    def __init__(self) -> None:
+        self.uuid = _UUIDColumn()
+        self.auctioneer = _UUIDColumn()
+        self.profile_id = _UUIDColumn()
+
+        self.item_name = _DictionaryColumn()
+        self.item_lore = _DictionaryColumn(intern=False)
+        self.tier = _DictionaryColumn()
+        self.category = _DictionaryColumn()
+
+        self.starting_bid = array("q")
+        self.highest_bid = array("q")
+        self.start = array("q")
+        self.end = array("q")
+        self.bid_count = array("I")
+        self.bin = array("b")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} auctions={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.starting_bid)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[SkyblockAuction, "AuctionTable"]:
+        if isinstance(key, slice):
+            return self.take(range(*key.indices(len(self))))
+
+        if key < 0:
+            key += len(self)
+
+        return SkyblockAuction(self.to_dict(key))
+
+    def __iter__(self) -> Iterator[SkyblockAuction]:
+        return (SkyblockAuction(self.to_dict(row)) for row in range(len(self)))
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Dict[str, Any]]) -> "AuctionTable":
+        """
+        Build the table from the pages of the auction house.
+
+        Parameters
+        ----------
+        pages: Iterable[Dict[str, Any]]
+            The data of every page from the Hypixel API endpoint.
+
+        Returns
+        -------
+        AuctionTable
+            The table holding the auctions of all the pages.
+        """
+        table = cls()
+
+        for page in pages:
+            table.extend(page["auctions"])
+
+        return table
+
+    def append(self, auction: Dict[str, Any]) -> None:
+        """Add an auction, in the format returned by the Hypixel API."""
+        self.uuid.append(auction["uuid"])
+        self.auctioneer.append(auction["auctioneer"])
+        self.profile_id.append(auction.get("profile_id") or auction["auctioneer"])
+
+        self.item_name.append(auction["item_name"])
+        self.item_lore.append(auction["item_lore"])
+        self.tier.append(auction["tier"])
+        self.category.append(auction["category"])
+
+        self.starting_bid.append(auction["starting_bid"])
+        self.highest_bid.append(auction.get("highest_bid_amount") or 0)
+        self.start.append(auction.get("start", 0))
+        self.end.append(auction.get("end", 0))
+        self.bid_count.append(len(auction.get("bids") or ()))
+        self.bin.append(bool(auction.get("bin")))
+
+    def extend(self, auctions: Iterable[Dict[str, Any]]) -> None:
+        """Add many auctions, in the format returned by the Hypixel API."""
+        for auction in auctions:
+            self.append(auction)
+
+    def to_dict(self, row: int) -> Dict[str, Any]:
+        """Get an auction in the format returned by the Hypixel API, without the bids."""
+        uuid = self.uuid[row]
+
+        return {
+            "_id": uuid,
+            "uuid": uuid,
+            "auctioneer": self.auctioneer[row],
+            "profile_id": self.profile_id[row],
+            "item_name": self.item_name[row],
+            "item_lore": self.item_lore[row],
+            "tier": self.tier[row],
+            "category": self.category[row],
+            "starting_bid": self.starting_bid[row],
+            "highest_bid_amount": self.highest_bid[row],
+            "start": self.start[row],
+            "end": self.end[row],
+            "bin": bool(self.bin[row]),
+        }
+
+    def price(self, row: int) -> int:
+        """The current price of an auction, which is the highest bid, or the starting bid if there are none."""
+        return self.highest_bid[row] or self.starting_bid[row]
+
+    @property
+    def prices(self) -> "array[int]":
+        """The current price of every auction."""
+        return array("q", [bid or start for bid, start in zip(self.highest_bid, self.starting_bid)])
+
+    def take(self, rows: Iterable[int]) -> "AuctionTable":
+        """
+        Form a new table with the auctions at the rows given, in that order.
+
+        Parameters
+        ----------
+        rows: Iterable[int]
+            The rows of the auctions to take.
+
+        Returns
+        -------
+        AuctionTable
+            The table with the auctions taken.
+        """
+        rows = rows if isinstance(rows, (list, range, array)) else list(rows)
+        table = self.__class__.__new__(self.__class__)
+
+        for name, column in vars(self).items():
+            if isinstance(column, array):
+                setattr(table, name, array(column.typecode, [column[row] for row in rows]))
+            else:
+                setattr(table, name, column.take(rows))
+
+        return table
+
+    def rows(
+        self,
+        item_name: Optional[str] = None,
+        tier: Optional[str] = None,
+        category: Optional[str] = None,
+        bin: Optional[bool] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        ending_before: Optional[int] = None,
+    ) -> Sequence[int]:
+        """
+        Find the rows of the auctions matching all the criteria given. The parameters are the same as `filter`.
+
+        Returns
+        -------
+        Sequence[int]
+            The matching rows, in the order of the table.
+        """
+        np = _import_numpy()
+        if np is not None:
+            return self._masked_rows(np, item_name, tier, category, bin, min_price, max_price, ending_before)
+
+        # Without NumPy, the matching rows are narrowed down by every criterion in turn
+        rows: Sequence[int] = range(len(self))
+
+        # The string columns are compared using the code of the value
+        for column, value in ((self.item_name, item_name), (self.tier, tier), (self.category, category)):
+            if value is None:
+                continue
+
+            code, codes = column.code(value), column.codes
+            if code is None:
+                return []
+
+            rows = [row for row in rows if codes[row] == code]
+
+        if bin is not None:
+            rows = [row for row in rows if bool(self.bin[row]) is bin]
+
+        if min_price is not None or max_price is not None:
+            low = min_price if min_price is not None else 0
+            high = max_price if max_price is not None else sys.maxsize
+            rows = [row for row in rows if low <= (self.highest_bid[row] or self.starting_bid[row]) <= high]
+
+        if ending_before is not None:
+            rows = [row for row in rows if self.end[row] < ending_before]
+
+        return rows
+
+    def _masked_rows(
+        self,
+        np: Any,
+        item_name: Optional[str],
+        tier: Optional[str],
+        category: Optional[str],
+        bin: Optional[bool],
+        min_price: Optional[int],
+        max_price: Optional[int],
+        ending_before: Optional[int],
+    ) -> Sequence[int]:
+        """Find the matching rows using NumPy masks over the columns, which are viewed without copying them."""
+
+        def view(column: array) -> Any:
+            return np.frombuffer(column, dtype=column.typecode)
+
+        mask = np.ones(len(self), dtype=bool)
+
+        # The string columns are compared using the code of the value
+        for column, value in ((self.item_name, item_name), (self.tier, tier), (self.category, category)):
+            if value is None:
+                continue
+
+            code = column.code(value)
+            if code is None:
+                return []
+
+            mask &= view(column.codes) == code
+
+        if bin is not None:
+            mask &= view(self.bin).astype(bool) == bin
+
+        if min_price is not None or max_price is not None:
+            highest_bid = view(self.highest_bid)
+            prices = np.where(highest_bid != 0, highest_bid, view(self.starting_bid))
+
+            if min_price is not None:
+                mask &= prices >= min_price
+            if max_price is not None:
+                mask &= prices <= max_price
+
+        if ending_before is not None:
+            mask &= view(self.end) < ending_before
+
+        return np.flatnonzero(mask).tolist()
+
+    def filter(
+        self,
+        item_name: Optional[str] = None,
+        tier: Optional[str] = None,
+        category: Optional[str] = None,
+        bin: Optional[bool] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        ending_before: Optional[int] = None,
+    ) -> "AuctionTable":
+        """
+        Form a new table with the auctions matching all the criteria given.
+
+        Parameters
+        ----------
+        item_name: Optional[str]
+            The exact name of the item, including its reforge. Defaults to None.
+        tier: Optional[str]
+            The rarity of the item, such as `LEGENDARY`. Defaults to None.
+        category: Optional[str]
+            The category of the item, such as `weapon`. Defaults to None.
+        bin: Optional[bool]
+            If the auctions should be, or not be, BIN auctions. Defaults to None.
+        min_price: Optional[int]
+            The minimum current price. Defaults to None.
+        max_price: Optional[int]
+            The maximum current price. Defaults to None.
+        ending_before: Optional[int]
+            The timestamp in milliseconds the auctions should end before. Defaults to None.
+
+        Returns
+        -------
+        AuctionTable
+            The table with the matching auctions.
+        """
+        return self.take(self.rows(item_name, tier, category, bin, min_price, max_price, ending_before))
+
+    def sort(self, by: str = "price", reverse: bool = False) -> "AuctionTable":
+        """
+        Form a new table with the auctions sorted by a column.
+
+        Parameters
+        ----------
+        by: str
+            The column to sort by, which is `price` or one of the `NUMERIC_COLUMNS`. Defaults to `price`.
+        reverse: bool
+            Sort in the descending order. Defaults to False.
+
+        Returns
+        -------
+        AuctionTable
+            The sorted table.
+        """
+        if by == "price":
+            column = self.prices
+        elif by in self.NUMERIC_COLUMNS:
+            column = getattr(self, by)
+        else:
+            raise ValueError(f"Can't sort the auctions by {by}")
+
+        return self.take(sorted(range(len(self)), key=column.__getitem__, reverse=reverse))
+
+
+@dataclass
+class AuctionDiff:
+    """The changes to the auction house since the previous snapshot."""
+
+    added: List[SkyblockAuction] = field(default_factory=list)
+    updated: List[SkyblockAuction] = field(default_factory=list)
+    ended: List[str] = field(default_factory=list)
+
+    # The ended auctions reported by the ended auctions feed, along with their buyer and price
+    sold: List[SkyblockEndedAuction] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.ended)
+
+
+class AuctionTracker:
+    """
+    Incremental tracker of the auction house, reporting the auctions which were added, received bids or ended
+    between its snapshots.
+
+    Only a version of every auction is kept between the snapshots, instead of the snapshots themselves. The version
+    is the highest bid of the auction, since it goes up with every bid. The ended auctions feed is used to find the
+    auctions which were bought, and can be applied between the crawls using `apply_ended`.
+
+    Examples
+    --------
+    Report the changes on every crawl of the auction house.
+
+        >>> tracker = AuctionTracker()
+        >>> while True:
+        ...     diff = tracker.update(client.fetch_all_active_auctions(), client.get_skyblock_ended_auctions())
+        ...     print(len(diff.added), len(diff.updated), len(diff.ended))
+    """
+
+    def __init__(self) -> None:
+        # Mapping of the UUIDs of the active auctions to their version
+        self._versions: Dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} auctions={len(self._versions)}>"
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._versions
+
+    @staticmethod
+    def _version(auction: SkyblockAuction) -> int:
+        return auction.highest_bid or 0
+
+    def update(
+        self,
+        auctions: Union[Iterable[SkyblockAuction], AuctionTable],
+        ended: Optional[Iterable[SkyblockEndedAuction]] = None,
+    ) -> AuctionDiff:
+        """
+        Compare a new snapshot of the auction house to the previous one.
+
+        Parameters
+        ----------
+        auctions: Union[Iterable[SkyblockAuction], AuctionTable]
+            All the active auctions, such as from `fetch_all_active_auctions` or `fetch_auction_table`.
+        ended: Optional[Iterable[SkyblockEndedAuction]]
+            The auctions from the ended auctions feed, fetched after the snapshot. Defaults to None.
+
+        Returns
+        -------
+        AuctionDiff
+            The auctions added, updated and ended since the previous snapshot. Every auction is added on the first
+            snapshot.
+        """
+        diff = AuctionDiff()
+        previous, self._versions = self._versions, {}
+
+        if isinstance(auctions, AuctionTable):
+            # Only create the auction objects for the changes
+            versions = zip(map(auctions.uuid.__getitem__, range(len(auctions))), auctions.highest_bid)
+        else:
+            auctions = list(auctions)
+            versions = ((auction.uuid, self._version(auction)) for auction in auctions)
+
+        for row, (uuid, version) in enumerate(versions):
+            self._versions[uuid] = version
+
+            # Move the auctions over, so that only the ended ones are left in the previous versions
+            previous_version = previous.pop(uuid, None)
+
+            if previous_version is None:
+                diff.added.append(auctions[row])
+            elif previous_version != version:
+                diff.updated.append(auctions[row])
+
+        # The auctions missing from the snapshot have ended since the previous one
+        diff.ended.extend(previous)
+
+        if ended is not None:
+            ended_since = set()
+
+            for auction in ended:
+                if auction.auction_id in previous:
+                    diff.sold.append(auction)
+                elif self._versions.pop(auction.auction_id, None) is not None:
+                    # Ended after the snapshot was taken
+                    diff.ended.append(auction.auction_id)
+                    diff.sold.append(auction)
+                    ended_since.add(auction.auction_id)
+
+            # Only report them as ended, so that the indexes applying the diff don't add them back
+            if ended_since:
+                diff.added = [auction for auction in diff.added if auction.uuid not in ended_since]
+                diff.updated = [auction for auction in diff.updated if auction.uuid not in ended_since]
+
+        return diff
+
+    def apply_ended(self, ended: Iterable[SkyblockEndedAuction]) -> AuctionDiff:
+        """
+        Remove the auctions which have ended using the ended auctions feed, without a new snapshot.
+
+        Parameters
+        ----------
+        ended: Iterable[SkyblockEndedAuction]
+            The auctions from the ended auctions feed.
+
+        Returns
+        -------
+        AuctionDiff
+            The tracked auctions which have ended.
+        """
+        diff = AuctionDiff()
+
+        for auction in ended:
+            if self._versions.pop(auction.auction_id, None) is not None:
+                diff.ended.append(auction.auction_id)
+                diff.sold.append(auction)
+
+        return diff
+
+    def clear(self) -> None:
+        """Forget all the tracked auctions, so that the next snapshot is reported as added."""
+        self._versions.clear()
+
+
+class PriceIndex:
+    """
+    Index of the prices of the active auctions by their item, answering the lowest BIN, cheapest and percentile
+    queries without scanning all the auctions.
+
+    The prices are kept in sorted lists for every normalized item name, along with every tier of it. The index can
+    be updated incrementally, using the diffs from `AuctionTracker`.
+
+    Examples
+    --------
+    Keep the lowest BINs up to date on every crawl.
+
+        >>> tracker, index = AuctionTracker(), PriceIndex()
+        >>> index.apply(tracker.update(client.fetch_auction_table()))
+        >>> index.lowest("Hyperion", tier="LEGENDARY")
+    """
+
+    def __init__(self, bin_only: bool = True) -> None:
+        """
+        Parameters
+        ----------
+        bin_only: bool
+            Only index the BIN auctions, whose price is fixed. Otherwise the auctions are indexed by their highest
+            bid, or their starting bid if there are none. Defaults to True.
+        """
+        self.bin_only = bin_only
+
+        # The sorted prices and UUIDs by the item name and tier, where the tier is None for all the tiers
+        self._prices: Dict[Tuple[str, Optional[str]], List[Tuple[int, str]]] = {}
+
+        # The price and the keys of every indexed auction by its UUID, to remove it
+        self._auctions: Dict[str, Tuple[int, str, str]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} auctions={len(self._auctions)} bin_only={self.bin_only}>"
+
+    def __len__(self) -> int:
+        return len(self._auctions)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._auctions
+
+    @classmethod
+    def from_auctions(
+        cls, auctions: Union[Iterable[SkyblockAuction], AuctionTable], bin_only: bool = True
+    ) -> "PriceIndex":
+        """
+        Build the index from a snapshot of the auction house.
+
+        Parameters
+        ----------
+        auctions: Union[Iterable[SkyblockAuction], AuctionTable]
+            The active auctions, such as from `fetch_all_active_auctions` or `fetch_auction_table`.
+        bin_only: bool
+            Only index the BIN auctions. Defaults to True.
+
+        Returns
+        -------
+        PriceIndex
+            The index of the auctions.
+        """
+        index = cls(bin_only)
+
+        if isinstance(auctions, AuctionTable):
+            # Read the columns directly, without creating the auction objects
+            for row in auctions.rows(bin=True if bin_only else None):
+                index._add(auctions.uuid[row], auctions.price(row), auctions.item_name[row], auctions.tier[row])
+        else:
+            for auction in auctions:
+                index.add(auction)
+
+        return index
+
+    def _add(self, uuid: str, price: int, item_name: str, tier: str) -> None:
+        if uuid in self._auctions:
+            self.remove(uuid)
+
+        name = normalize_item_name(item_name)
+        self._auctions[uuid] = (price, name, tier)
+
+        for key in ((name, None), (name, tier)):
+            insort(self._prices.setdefault(key, []), (price, uuid))
+
+    def add(self, auction: SkyblockAuction) -> None:
+        """Add an auction to the index, or update its price if it is already indexed."""
+        if self.bin_only and not auction.bin:
+            return
+
+        self._add(auction.uuid, auction.highest_bid or auction.starting_big, auction.item_name, auction.tier)
+
+    def remove(self, uuid: str) -> None:
+        """Remove an auction from the index, if it is indexed."""
+        item = self._auctions.pop(uuid, None)
+        if item is None:
+            return
+
+        price, name, tier = item
+
+        for key in ((name, None), (name, tier)):
+            prices = self._prices[key]
+            del prices[bisect_left(prices, (price, uuid))]
+
+            if not prices:
+                del self._prices[key]
+
+    def apply(self, diff: AuctionDiff) -> None:
+        """Update the index with the changes from `AuctionTracker`."""
+        for uuid in diff.ended:
+            self.remove(uuid)
+
+        for auction in diff.added + diff.updated:
+            self.add(auction)
+
+    def _get_prices(self, item_name: str, tier: Optional[str]) -> List[Tuple[int, str]]:
+        return self._prices.get((normalize_item_name(item_name), tier), [])
+
+    def lowest(self, item_name: str, tier: Optional[str] = None) -> Optional[int]:
+        """
+        Get the lowest price of an item.
+
+        Parameters
+        ----------
+        item_name: str
+            The name of the item, which is normalized to ignore the formatting, stars and case.
+        tier: Optional[str]
+            The rarity of the item, or None for any rarity. Defaults to None.
+
+        Returns
+        -------
+        Optional[int]
+            The lowest price, or None if there are no auctions for the item.
+        """
+        prices = self._get_prices(item_name, tier)
+        return prices[0][0] if prices else None
+
+    def cheapest(self, item_name: str, k: int = 10, tier: Optional[str] = None) -> List[Tuple[int, str]]:
+        """
+        Get the cheapest auctions of an item.
+
+        Parameters
+        ----------
+        item_name: str
+            The name of the item, which is normalized to ignore the formatting, stars and case.
+        k: int
+            The amount of auctions to get. Defaults to 10.
+        tier: Optional[str]
+            The rarity of the item, or None for any rarity. Defaults to None.
+
+        Returns
+        -------
+        List[Tuple[int, str]]
+            The price and UUID of the cheapest auctions, from the cheapest.
+        """
+        return self._get_prices(item_name, tier)[:k]
+
+    def percentile(self, item_name: str, percent: float, tier: Optional[str] = None) -> Optional[int]:
+        """
+        Get a percentile of the prices of an item, using the nearest rank.
+
+        Parameters
+        ----------
+        item_name: str
+            The name of the item, which is normalized to ignore the formatting, stars and case.
+        percent: float
+            The percentile between 0 and 100, such as 50 for the median.
+        tier: Optional[str]
+            The rarity of the item, or None for any rarity. Defaults to None.
+
+        Returns
+        -------
+        Optional[int]
+            The price at the percentile, or None if there are no auctions for the item.
+        """
+        prices = self._get_prices(item_name, tier)
+        if not prices:
+            return None
+
+        rank = min(len(prices), max(1, math.ceil(percent / 100 * len(prices))))
+        return prices[rank - 1][0]
+
+    def count(self, item_name: str, tier: Optional[str] = None) -> int:
+        """Get the amount of indexed auctions for an item."""
+        return len(self._get_prices(item_name, tier))
+
+
+def _tokenize(text: str) -> FrozenSet[str]:
+    return frozenset(WORD.findall(strip_formatting(text).lower()))
+
+
+class AuctionSearchIndex:
+    """
+    Inverted index of the words in the item names and lores of the active auctions, for searching them without
+    scanning every lore.
+
+    The formatting codes are stripped and the words are case-insensitive. The index can be updated incrementally,
+    using the diffs from `AuctionTracker`.
+
+    Examples
+    --------
+    Find the legendary auctions with Ultimate Wise or Ultimate Legion.
+
+        >>> index = AuctionSearchIndex.from_auctions(client.fetch_auction_table())
+        >>> index.search("ultimate wise legion", match_all=False, tier="LEGENDARY")
+    """
+
+    def __init__(self) -> None:
+        # The UUIDs of the auctions containing every word, tier and category
+        self._words: Dict[str, Set[str]] = {}
+        self._tiers: Dict[str, Set[str]] = {}
+        self._categories: Dict[str, Set[str]] = {}
+
+        # The words, tier and category of every indexed auction by its UUID, to remove it
+        self._auctions: Dict[str, Tuple[FrozenSet[str], str, str]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} auctions={len(self._auctions)} words={len(self._words)}>"
+
+    def __len__(self) -> int:
+        return len(self._auctions)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._auctions
+
+    @classmethod
+    def from_auctions(cls, auctions: Union[Iterable[SkyblockAuction], AuctionTable]) -> "AuctionSearchIndex":
+        """
+        Build the index from a snapshot of the auction house.
+
+        Parameters
+        ----------
+        auctions: Union[Iterable[SkyblockAuction], AuctionTable]
+            The active auctions, such as from `fetch_all_active_auctions` or `fetch_auction_table`.
+
+        Returns
+        -------
+        AuctionSearchIndex
+            The index of the auctions.
+        """
+        index = cls()
+
+        # Many auctions share their item name or lore, which only need to be tokenized once
+        tokens: Dict[str, FrozenSet[str]] = {}
+
+        def tokenize(text: str) -> FrozenSet[str]:
+            words = tokens.get(text)
+            if words is None:
+                words = tokens[text] = _tokenize(text)
+
+            return words
+
+        if isinstance(auctions, AuctionTable):
+            for row in range(len(auctions)):
+                words = tokenize(auctions.item_name[row]) | tokenize(auctions.item_lore[row])
+                index._add(auctions.uuid[row], words, auctions.tier[row], auctions.category[row])
+        else:
+            for auction in auctions:
+                words = tokenize(auction.item_name) | tokenize(auction.item_lore)
+                index._add(auction.uuid, words, auction.tier, auction.category)
+
+        return index
+
+    def _add(self, uuid: str, words: FrozenSet[str], tier: str, category: str) -> None:
+        if uuid in self._auctions:
+            self.remove(uuid)
+
+        self._auctions[uuid] = (words, tier, category)
+
+        for word in words:
+            self._words.setdefault(word, set()).add(uuid)
+
+        self._tiers.setdefault(tier, set()).add(uuid)
+        self._categories.setdefault(category, set()).add(uuid)
+
+    def add(self, auction: SkyblockAuction) -> None:
+        """Add an auction to the index, or update it if it is already indexed."""
+        words = _tokenize(auction.item_name) | _tokenize(auction.item_lore)
+        self._add(auction.uuid, words, auction.tier, auction.category)
+
+    def remove(self, uuid: str) -> None:
+        """Remove an auction from the index, if it is indexed."""
+        item = self._auctions.pop(uuid, None)
+        if item is None:
+            return
+
+        words, tier, category = item
+
+        for postings, keys in ((self._words, words), (self._tiers, (tier,)), (self._categories, (category,))):
+            for key in keys:
+                uuids = postings[key]
+                uuids.discard(uuid)
+
+                if not uuids:
+                    del postings[key]
+
+    def apply(self, diff: AuctionDiff) -> None:
+        """Update the index with the changes from `AuctionTracker`."""
+        for uuid in diff.ended:
+            self.remove(uuid)
+
+        # The names and lores of the updated auctions don't change
+        for auction in diff.added:
+            self.add(auction)
+
+    def search(
+        self,
+        query: str,
+        match_all: bool = True,
+        tier: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Set[str]:
+        """
+        Search the auctions by the words in their item name or lore.
+
+        Parameters
+        ----------
+        query: str
+            The words to search for, which are case-insensitive.
+        match_all: bool
+            Find the auctions containing all the words, or any of them. Defaults to True.
+        tier: Optional[str]
+            Only find the auctions with the rarity, such as `LEGENDARY`. Defaults to None.
+        category: Optional[str]
+            Only find the auctions in the category, such as `weapon`. Defaults to None.
+
+        Returns
+        -------
+        Set[str]
+            The UUIDs of the matching auctions.
+        """
+        postings = [self._words.get(word, set()) for word in _tokenize(query)]
+
+        filters = []
+        if tier is not None:
+            filters.append(self._tiers.get(tier, set()))
+        if category is not None:
+            filters.append(self._categories.get(category, set()))
+
+        if match_all:
+            postings += filters
+            if not postings:
+                return set()
+
+            # Intersect starting with the smallest set, so that the result is never bigger than it
+            postings.sort(key=len)
+            return postings[0].intersection(*postings[1:])
+
+        matches = set().union(*postings)
+
+        return matches.intersection(*filters) if filters else matches
@@ -1,25 +1,59 @@
+import random
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from dataclasses import replace
+from datetime import datetime
+from email.utils import formatdate
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
-from .endpoints import API_PATH
+from . import json_backend
+from .cache import BaseCache, CacheEntry
+from .constants import MAX_RATELIMIT_WAIT
+from .endpoints import API_PATH, CACHE_TTL
 from .exceptions import HypixelAPIError, RateLimitError
+from .ratelimit import KeyRatelimit, NEVER, get_retry_after
+from .retry import RetryPolicy
+
+T = TypeVar("T")
 
 
 # TODO: Move to `requests.session` for better performance and avoid creating a new session for every request.
 class BaseClient(ABC):
-    def __init__(self, api_key: Union[str, list]):
+    def __init__(
+        self,
+        api_key: Union[str, list],
+        wait_on_ratelimit: bool = False,
+        max_ratelimit_wait: float = MAX_RATELIMIT_WAIT,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[BaseCache] = None,
+        cache_ttl: Optional[Dict[str, float]] = None,
+        raw: bool = False,
+    ):
         self.url = API_PATH["HYPIXEL"]
 
-        if not isinstance(api_key, list):
-            self._api_key = [api_key]
+        self._api_key = list(api_key) if isinstance(api_key, list) else [api_key]
+
+        # Ratelimiting config, tracked separately for every key. Locked, as the sync client can be used by threads.
+        self._ratelimits = {key: KeyRatelimit(key) for key in self._api_key}
+        self._ratelimit_lock = threading.RLock()
+
+        # Wait for a key to be available instead of raising, up to the maximum wait in seconds
+        self.wait_on_ratelimit = wait_on_ratelimit
+        self.max_ratelimit_wait = max_ratelimit_wait
+
+        # Retrying of the failed requests
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        # Response caching, with the TTLs of the endpoints mapped to their routes
+        self.cache = cache
+        self._cache_ttl = {
+            self.url[endpoint]: ttl for endpoint, ttl in {**CACHE_TTL, **(cache_ttl or {})}.items()
+        }
 
-        # Ratelimiting config
-        self.requests_remaining = -1
-        self.total_requests = 0
-        self._ratelimit_reset = datetime(1998, 1, 1)
-        self.retry_after = datetime(1998, 1, 1)
+        # Give the decoded payloads instead of building the models
+        self.raw = raw
 
         # Headers
         from hypixelio import __version__ as hypixelio_version
@@ -37,37 +71,253 @@ class BaseClient(ABC):
             f"{self.total_requests} retry_after={self.retry_after}>"
         )
 
-    def _update_ratelimit(self, resp_headers: Dict[str, Any]) -> None:
-        """Utility to update ratelimiting variables"""
+    @property
+    def requests_remaining(self) -> int:
+        """The requests remaining across all the keys, or -1 if it isn't known yet."""
+        with self._ratelimit_lock:
+            known = [
+                ratelimit.requests_remaining
+                for ratelimit in self._ratelimits.values()
+                if ratelimit.requests_remaining != -1
+            ]
 
-        if "RateLimit-Limit" in resp_headers:
-            if self.total_requests == 0:
-                self.total_requests = int(resp_headers["RateLimit-Limit"])
+        return sum(known) if known else -1
 
-            self.requests_remaining = int(resp_headers["RateLimit-Remaining"])
-            self._ratelimit_reset = datetime.now() + timedelta(
-                seconds=int(resp_headers["RateLimit-Reset"])
-            )
+    @property
+    def total_requests(self) -> int:
+        """The requests allowed per window across all the keys."""
+        with self._ratelimit_lock:
+            return sum(ratelimit.total_requests for ratelimit in self._ratelimits.values())
 
-    def _is_ratelimit_hit(self) -> bool:
-        """Utility to check if ratelimit has been hit"""
+    @property
+    def retry_after(self) -> datetime:
+        """When the next key will be available to use again, if all of them are ratelimited."""
+        with self._ratelimit_lock:
+            if not self._ratelimits:
+                return NEVER
+
+            return min(ratelimit.available_at for ratelimit in self._ratelimits.values())
+
+    def _update_ratelimit(self, api_key: str, resp_headers: Dict[str, Any]) -> None:
+        """Utility to update ratelimiting variables for the key used"""
+
+        with self._ratelimit_lock:
+            if "RateLimit-Limit" in resp_headers and api_key in self._ratelimits:
+                self._ratelimits[api_key].update(resp_headers)
+
+    def _select_key(self) -> str:
+        """
+        Utility to pick the key with the most remaining budget, and reserve a request from it.
+
+        Raises `RateLimitError` if every key has been ratelimited.
+        """
+        with self._ratelimit_lock:
+            budgets = {key: ratelimit.budget() for key, ratelimit in self._ratelimits.items()}
+            best_budget = max(budgets.values(), default=0)
+
+            if best_budget <= 0:
+                raise RateLimitError(self.retry_after)
+
+            # Pick randomly among the least loaded keys, to spread the requests when they're equal.
+            key = random.choice([key for key, budget in budgets.items() if budget == best_budget])
+            self._ratelimits[key].reserve()
+
+            return key
+
+    def _ratelimit_delay(self, deadline: float) -> float:
+        """
+        Utility to get the seconds to wait until a key is available again, when all of them are ratelimited.
 
-        is_ratelimit_hit = self.requests_remaining != -1 \
-            and (self.requests_remaining == 0 and self._ratelimit_reset > datetime.now()) \
-            or self.retry_after \
-            and (self.retry_after > datetime.now())
+        Raises `RateLimitError` if waiting is disabled, or the wait would exceed the `deadline` in monotonic time.
+        """
+        delay = max((self.retry_after - datetime.now()).total_seconds(), 0)
+
+        if not self.wait_on_ratelimit or time.monotonic() + delay > deadline:
+            raise RateLimitError(self.retry_after)
+
+        return delay
+
+    def _is_ratelimit_hit(self) -> bool:
+        """Utility to check if ratelimit has been hit for all the keys"""
 
-        return is_ratelimit_hit
+        with self._ratelimit_lock:
+            return all(ratelimit.budget() <= 0 for ratelimit in self._ratelimits.values())
 
-    def _handle_ratelimit(self, resp_headers: Dict[str, Any]) -> None:
+    def _handle_ratelimit(self, api_key: str, resp_headers: Dict[str, Any]) -> None:
         """Raise error if ratelimit has been hit"""
 
-        self.requests_remaining = 0
-        self.retry_after = datetime.now() + timedelta(
-            seconds=int(resp_headers["Retry-After"])
-        )
+        with self._ratelimit_lock:
+            ratelimit = self._ratelimits[api_key]
+            ratelimit.hit(get_retry_after(resp_headers) or 0)
+
+        raise RateLimitError(ratelimit.retry_after)
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        api_key: Optional[str] = None,
+        status: Optional[int] = None,
+        resp_headers: Optional[Dict[str, Any]] = None,
+    ) -> Optional[float]:
+        """
+        Utility to get the seconds to wait before retrying a failed request, or None if it shouldn't be retried.
+
+        A missing `status` means that the request timed out or the connection failed.
+        """
+        if not self.retry_policy.should_retry(attempt, status):
+            return None
+
+        retry_after = get_retry_after(resp_headers) if resp_headers is not None else None
+
+        # Requests without a key have no other key to switch to, so they're backed off instead
+        if status == 429 and api_key in self._ratelimits:
+            with self._ratelimit_lock:
+                self._ratelimits[api_key].hit(retry_after or 0)
+
+                # Retry right away using another key if there's one available, or wait for a key in `_acquire_key`
+                # which gives up after `max_ratelimit_wait`.
+                if self.wait_on_ratelimit or not self._is_ratelimit_hit():
+                    return 0.0
+
+        return self.retry_policy.backoff(attempt, retry_after)
+
+    def _check_response(self, api_key: Optional[str], status: int, resp_headers: Dict[str, Any]) -> None:
+        """Utility to raise the errors for a failed response, and update the ratelimit of the key used"""
+
+        # 404 handling
+        if status == 404:
+            raise HypixelAPIError("The route specified does not exist")
+
+        # 429 status code handling
+        if api_key and status == 429:
+            self._handle_ratelimit(api_key, resp_headers)
+
+        # 403 status code handling
+        if status == 403:
+            raise HypixelAPIError("Invalid key specified!")
+
+        if api_key:
+            self._update_ratelimit(api_key, resp_headers)
+
+    def _get_cached(self, route: str, params: Dict[str, Any]) -> Optional[CacheEntry]:
+        """Utility to get the cached response for a route including the expired ones, if caching is enabled"""
+
+        if self.cache is None or not self._cache_ttl.get(route):
+            return None
+
+        return self.cache.get(self.cache.make_key(route, params), allow_stale=True)
+
+    def _set_cached(
+        self,
+        route: str,
+        params: Dict[str, Any],
+        data: Dict[str, Any],
+        body: bytes,
+        resp_headers: Dict[str, Any],
+    ) -> None:
+        """Utility to cache the response for a route, if caching is enabled and the route is cacheable"""
+
+        ttl = self._cache_ttl.get(route)
+        if self.cache is None or not ttl:
+            return
+
+        # Resources report when they were last updated, which can be used to revalidate them
+        last_modified = resp_headers.get("Last-Modified")
+        if last_modified is None and isinstance(data.get("lastUpdated"), int):
+            last_modified = formatdate(data["lastUpdated"] / 1000, usegmt=True)
+
+        now = time.time()
+        entry = CacheEntry(data, len(body), now, now + ttl, body, resp_headers.get("ETag"), last_modified)
+
+        self.cache.set(self.cache.make_key(route, params), entry)
+
+    def _refresh_cached(
+        self, route: str, params: Dict[str, Any], entry: CacheEntry, decode: bool = True
+    ) -> Union[Dict[str, Any], bytes]:
+        """Utility to extend the expiry of a cached response, once the API confirmed it hasn't changed"""
+
+        if self.cache is not None:
+            now = time.time()
+            entry = replace(entry, fetched_at=now, expires_at=now + self._cache_ttl[route])
+
+            self.cache.set(self.cache.make_key(route, params), entry)
+
+        return self._cached_payload(entry, decode)
+
+    @staticmethod
+    def _cached_payload(entry: CacheEntry, decode: bool = True) -> Union[Dict[str, Any], bytes]:
+        """Utility to get the decoded payload of a cached response, or its body"""
+
+        if decode:
+            return entry.data
+
+        # The in-memory caches only keep the decoded data
+        return entry.body if entry.body is not None else json_backend.dumps(entry.data)
+
+    def _uncache(self, route: str, params: Dict[str, Any]) -> None:
+        """Utility to remove the cached response for a route, if caching is enabled"""
+
+        if self.cache is not None:
+            self.cache.delete(self.cache.make_key(route, params))
+
+    @staticmethod
+    def _outdated_pages(pages: List[Dict[str, Any]]) -> List[int]:
+        """Utility to find the auction pages fetched from an older snapshot than the newest page"""
+
+        newest = max(page.get("lastUpdated", 0) for page in pages)
+
+        return [page["page"] for page in pages if page.get("lastUpdated", 0) != newest]
+
+    def _parse_response(self, body: bytes, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Utility to decode the response body unless done already, and raise if the API response is not successful"""
+
+        if data is None:
+            try:
+                data = json_backend.loads(body)
+            except Exception as exc:
+                raise HypixelAPIError(f"{exc}")
+
+        if not data["success"]:
+            self._handle_api_failure(data)
+
+        return data
+
+    def _load_response(
+        self,
+        route: str,
+        params: Dict[str, Any],
+        body: bytes,
+        status: int,
+        resp_headers: Dict[str, Any],
+        decode: bool = True,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        Utility to decode and cache the body of a response, giving the payload or the undecoded body.
+
+        The body is only left undecoded if it isn't cached, and the response didn't fail. The `data` is the body
+        decoded already, if any.
+        """
+        if not self._needs_decoding(route, status, decode):
+            return body
+
+        data = self._parse_response(body, data)
+        self._set_cached(route, params, data, body, resp_headers)
+
+        return data if decode else body
+
+    def _needs_decoding(self, route: str, status: int, decode: bool = True) -> bool:
+        """Utility to check if a response body has to be decoded, to return, cache or raise the error in it"""
+
+        return decode or status >= 400 or (self.cache is not None and bool(self._cache_ttl.get(route)))
+
+    def _model(self, data: Any, model: Callable[..., T], *args: Any) -> Union[T, Any]:
+        """Utility to build the model of a response, or give the decoded payload in the raw mode"""
+
+        if self.raw:
+            return data
 
-        raise RateLimitError(self.retry_after)
+        return model(*args)
 
     @staticmethod
     def _handle_api_failure(json: Dict[str, Any]) -> None:
@@ -101,7 +351,9 @@ class BaseClient(ABC):
             if key in self._api_key:
                 continue
 
-            self._api_key.append(key)
+            with self._ratelimit_lock:
+                self._api_key.append(key)
+                self._ratelimits[key] = KeyRatelimit(key)
 
     def remove_key(self, api_key: Union[str, list]) -> None:
         """
@@ -123,4 +375,6 @@ class BaseClient(ABC):
             if key not in self._api_key:
                 continue
 
-            self._api_key.remove(key)
+            with self._ratelimit_lock:
+                self._api_key.remove(key)
+                del self._ratelimits[key]
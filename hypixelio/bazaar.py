@@ -0,0 +1,583 @@
+"""Recording of the skyblock bazaar prices over time."""
+__all__ = ("BazaarArrays", "BazaarRecorder")
+
+import asyncio
+import math
+import struct
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING, Tuple, Union
+
+from .constants import BAZAAR_TAX
+from .exceptions import HypixelAPIError, RateLimitError
+from .models.skyblock import SkyblockBazaar
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from ._async import AsyncClient
+    from .lib import Client
+
+# The columns of the bazaar arrays, mapped to their key in the quick status of the products
+ARRAY_COLUMNS = {
+    "buy_price": "buyPrice",
+    "sell_price": "sellPrice",
+    "buy_volume": "buyVolume",
+    "sell_volume": "sellVolume",
+    "buy_moving_week": "buyMovingWeek",
+    "sell_moving_week": "sellMovingWeek",
+    "buy_orders": "buyOrders",
+    "sell_orders": "sellOrders",
+}
+
+# The values recorded for every product, from the quick status of the product
+FIELDS = ("buy_price", "sell_price", "buy_volume", "sell_volume")
+
+# The header of the files saved by the recorder, and its version
+MAGIC = b"HXBZ"
+VERSION = 1
+HEADER = struct.Struct("<4sBcIIIdqd")
+PRODUCT_COUNT = struct.Struct("<I")
+NAME_LENGTH = struct.Struct("<H")
+
+
+class _Series:
+    """The ring buffers of the values of a single product."""
+
+    __slots__ = FIELDS
+
+    def __init__(self, capacity: int) -> None:
+        for field in FIELDS:
+            setattr(self, field, array("f", [math.nan]) * capacity)
+
+    def __getitem__(self, field: str) -> "array[float]":
+        return getattr(self, field)
+
+
+def _import_numpy() -> Any:
+    """Import NumPy once the bazaar arrays are used, as it's optional and slow to import."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is needed for the bazaar arrays, install it using `HypixelIO[numpy]`") from None
+
+    return numpy
+
+
+class BazaarArrays:
+    """
+    Snapshot of the bazaar as aligned NumPy arrays, with a row for every product sorted by the product ID, to score
+    and rank all the products without looping over them.
+
+    Every column of `ARRAY_COLUMNS` is an array of floats, such as `buy_price` or `sell_moving_week`. Needs NumPy,
+    which is installed using the `numpy` extra.
+
+    Examples
+    --------
+    Find the products with the best margins after the tax, weighted by their volume.
+
+        >>> arrays = BazaarArrays(client.get_skyblock_bazaar())
+        >>> score = arrays.margin() * np.minimum(arrays.buy_moving_week, arrays.sell_moving_week)
+        >>> arrays.top(10, by=score)
+    """
+
+    def __init__(self, bazaar: SkyblockBazaar) -> None:
+        """
+        Parameters
+        ----------
+        bazaar: SkyblockBazaar
+            The snapshot of the bazaar, from `get_skyblock_bazaar`.
+        """
+        np = _import_numpy()
+
+        statuses = sorted(bazaar.products.quick_statuses(), key=lambda status: status["productId"])
+
+        self.last_updated = bazaar.last_updated
+        self.product_ids = np.array([status["productId"] for status in statuses])
+
+        for column, key in ARRAY_COLUMNS.items():
+            setattr(
+                self, column, np.fromiter((status[key] for status in statuses), dtype=np.float64, count=len(statuses))
+            )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} products={len(self)} last_updated={self.last_updated}>"
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    @property
+    def spread(self) -> "np.ndarray":
+        """The difference between the instant buy and the instant sell price of every product."""
+        return self.buy_price - self.sell_price
+
+    def margin(self, tax: float = BAZAAR_TAX) -> "np.ndarray":
+        """
+        Get the profit per unit of flipping every product, by buying it using a buy order and selling it using a
+        sell offer.
+
+        Parameters
+        ----------
+        tax: float
+            The share of the coins taken from the filled sell offers. Defaults to 1.25%.
+
+        Returns
+        -------
+        np.ndarray
+            The margin of every product after the tax.
+        """
+        return self.buy_price * (1 - tax) - self.sell_price
+
+    def change(self, previous: "BazaarArrays", column: str = "buy_price") -> "np.ndarray":
+        """
+        Get the relative change of a column since a previous snapshot, such as from a week ago for the
+        week-over-week change.
+
+        Parameters
+        ----------
+        previous: BazaarArrays
+            The previous snapshot of the bazaar.
+        column: str
+            The column to compare, which is one of `ARRAY_COLUMNS`. Defaults to `buy_price`.
+
+        Returns
+        -------
+        np.ndarray
+            The change of every product as a fraction, or NaN if the product is missing from the previous snapshot.
+        """
+        np = _import_numpy()
+
+        current, before = self._column(column), previous._column(column)
+        change = np.full(len(self), np.nan)
+
+        if not len(previous):
+            return change
+
+        # Both the snapshots are sorted by the product ID, so the products are matched by bisecting
+        positions = np.minimum(np.searchsorted(previous.product_ids, self.product_ids), len(previous) - 1)
+        found = previous.product_ids[positions] == self.product_ids
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change[found] = current[found] / before[positions[found]] - 1
+
+        return change
+
+    def top(
+        self, n: int = 10, by: Union[str, "np.ndarray"] = "spread", ascending: bool = False
+    ) -> List[Tuple[str, float]]:
+        """
+        Get the products with the highest values of a column or a score, without sorting all of them.
+
+        Parameters
+        ----------
+        n: int
+            The amount of products to get. Defaults to 10.
+        by: Union[str, np.ndarray]
+            The column to rank by, `spread`, or an array of scores aligned with the products. Defaults to `spread`.
+        ascending: bool
+            Get the products with the lowest values instead. Defaults to False.
+
+        Returns
+        -------
+        List[Tuple[str, float]]
+            The product IDs along with their values, from the best.
+        """
+        np = _import_numpy()
+
+        if isinstance(by, str):
+            values = self.spread if by == "spread" else self._column(by)
+        else:
+            values = np.asarray(by, dtype=np.float64)
+
+        # Rank the missing values last
+        keys = np.where(np.isnan(values), np.inf, values if ascending else -values)
+
+        n = min(n, len(keys))
+        if n <= 0:
+            return []
+
+        rows = np.argpartition(keys, n - 1)[:n]
+        rows = rows[np.argsort(keys[rows], kind="stable")]
+
+        return [(str(self.product_ids[row]), float(values[row])) for row in rows]
+
+    def _column(self, column: str) -> "np.ndarray":
+        if column not in ARRAY_COLUMNS:
+            raise ValueError(f"Unknown column {column}, which should be one of {', '.join(ARRAY_COLUMNS)}")
+
+        return getattr(self, column)
+
+
+class BazaarRecorder:
+    """
+    Recorder of the prices and volumes of the bazaar products over time, using a fixed amount of memory.
+
+    Every snapshot of the bazaar is appended to preallocated ring buffers, which overwrite the oldest snapshots once
+    full. The unchanged snapshots, and the ones within `interval` seconds of the previous one are skipped, so that
+    the history covers `capacity * interval` seconds. The values are stored as 32-bit floats, taking
+    `capacity * 16` bytes for every product.
+
+    Examples
+    --------
+    Record two weeks of history at 5 minute intervals, saving it on exit.
+
+        >>> recorder = BazaarRecorder(capacity=4032, interval=300)
+        >>> try:
+        ...     recorder.run(client)
+        ... finally:
+        ...     recorder.save("bazaar.bin")
+
+    Get the average buy price of the last hour.
+
+        >>> recorder.average("ENCHANTED_DIAMOND", "buy_price", window=3600)
+    """
+
+    def __init__(self, capacity: int = 4032, interval: float = 300, cadence: float = 20) -> None:
+        """
+        Parameters
+        ----------
+        capacity: int
+            The amount of snapshots kept, after which the oldest ones are overwritten. Defaults to 4032.
+        interval: float
+            The minimum seconds between the recorded snapshots. Defaults to 5 minutes.
+        cadence: float
+            The seconds between the updates of the bazaar, used to time the polls until it is seen from the
+            updates. Defaults to 20.
+        """
+        if capacity <= 0:
+            raise ValueError("The capacity should be positive")
+
+        self.capacity = capacity
+        self.interval = interval
+        self.cadence = cadence
+
+        # When the bazaar was last updated, in milliseconds like the API
+        self.last_updated = 0
+
+        # The timestamps of the snapshots in milliseconds, and the ring buffers of every product
+        self._timestamps = array("q", [0]) * capacity
+        self._series: Dict[str, _Series] = {}
+
+        # The slot the next snapshot is written to, and the amount of snapshots stored
+        self._next = 0
+        self._size = 0
+
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__qualname__} products={len(self._series)} snapshots={self._size} "
+            f"capacity={self.capacity}>"
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, product_id: str) -> bool:
+        return product_id in self._series
+
+    @property
+    def products(self) -> List[str]:
+        """The IDs of the recorded products."""
+        return list(self._series)
+
+    def record(self, bazaar: SkyblockBazaar) -> bool:
+        """
+        Append a snapshot of the bazaar, unless it is unchanged or within `interval` seconds of the previous one.
+
+        Parameters
+        ----------
+        bazaar: SkyblockBazaar
+            The snapshot of the bazaar, from `get_skyblock_bazaar`.
+
+        Returns
+        -------
+        bool
+            If the snapshot was recorded.
+        """
+        with self._lock:
+            if bazaar.last_updated <= self.last_updated:
+                return False
+
+            # Learn how often the bazaar is updated, to time the polls
+            if self.last_updated:
+                self.cadence = min(self.cadence, (bazaar.last_updated - self.last_updated) / 1000)
+
+            self.last_updated = bazaar.last_updated
+
+            if self._size and bazaar.last_updated - self._timestamps[self._newest()] < self.interval * 1000:
+                return False
+
+            slot = self._next
+            self._timestamps[slot] = bazaar.last_updated
+
+            # The products missing from the snapshot are recorded as unknown
+            missing = set(self._series)
+
+            # The raw quick statuses are read, so that the product models aren't built on every poll
+            for status in bazaar.products.quick_statuses():
+                product_id = status["productId"]
+
+                series = self._series.get(product_id)
+                if series is None:
+                    series = self._series[product_id] = _Series(self.capacity)
+
+                missing.discard(product_id)
+                series.buy_price[slot] = status["buyPrice"]
+                series.sell_price[slot] = status["sellPrice"]
+                series.buy_volume[slot] = status["buyVolume"]
+                series.sell_volume[slot] = status["sellVolume"]
+
+            for product_id in missing:
+                for field in FIELDS:
+                    self._series[product_id][field][slot] = math.nan
+
+            self._next = (slot + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+        return True
+
+    def next_poll_in(self) -> float:
+        """
+        The seconds until the bazaar is expected to be updated with a snapshot to record, which is when it should be
+        polled again. The updates within `interval` seconds of the newest snapshot recorded are skipped.
+        """
+        with self._lock:
+            if not self.last_updated:
+                return 0.0
+
+            last_updated = self.last_updated / 1000
+            updates = 1
+
+            if self._size:
+                # The first update once the interval since the newest snapshot has passed
+                due = self._timestamps[self._newest()] / 1000 + self.interval
+                updates = max(1, math.ceil((due - last_updated) / self.cadence))
+
+            # Poll slightly after the update, so that the API has it
+            return max(1.0, last_updated + updates * self.cadence + 1 - time.time())
+
+    def poll(self, client: "Client") -> bool:
+        """
+        Fetch the bazaar using a client, and record it.
+
+        Parameters
+        ----------
+        client: Client
+            The client to fetch the bazaar with.
+
+        Returns
+        -------
+        bool
+            If the snapshot was recorded.
+        """
+        return self.record(client.get_skyblock_bazaar())
+
+    async def poll_async(self, client: "AsyncClient") -> bool:
+        """
+        Fetch the bazaar using an async client, and record it.
+
+        Parameters
+        ----------
+        client: AsyncClient
+            The client to fetch the bazaar with.
+
+        Returns
+        -------
+        bool
+            If the snapshot was recorded.
+        """
+        return self.record(await client.get_skyblock_bazaar())
+
+    def run(self, client: "Client", stop: Optional[threading.Event] = None) -> None:
+        """
+        Keep polling the bazaar whenever it is expected to be updated, until stopped. The failed polls are retried
+        on the next update.
+
+        Parameters
+        ----------
+        client: Client
+            The client to fetch the bazaar with.
+        stop: Optional[threading.Event]
+            The event to set to stop recording. Defaults to None, recording forever.
+        """
+        stop = stop or threading.Event()
+
+        while not stop.is_set():
+            try:
+                self.poll(client)
+            except (HypixelAPIError, RateLimitError):
+                pass
+
+            stop.wait(self.next_poll_in())
+
+    async def run_async(self, client: "AsyncClient") -> None:
+        """
+        Keep polling the bazaar whenever it is expected to be updated, until cancelled. The failed polls are retried
+        on the next update.
+
+        Parameters
+        ----------
+        client: AsyncClient
+            The client to fetch the bazaar with.
+        """
+        while True:
+            try:
+                await self.poll_async(client)
+            except (HypixelAPIError, RateLimitError):
+                pass
+
+            await asyncio.sleep(self.next_poll_in())
+
+    def _newest(self) -> int:
+        return (self._next - 1) % self.capacity
+
+    def _slots(self, window: Optional[float] = None) -> Iterator[int]:
+        """The slots of the snapshots within the window, from the oldest."""
+        oldest = (self._next - self._size) % self.capacity
+        slots = (slot % self.capacity for slot in range(oldest, oldest + self._size))
+
+        if window is None or not self._size:
+            return slots
+
+        since = self._timestamps[self._newest()] - window * 1000
+        return (slot for slot in slots if self._timestamps[slot] >= since)
+
+    def history(
+        self, product_id: str, field: str = "buy_price", window: Optional[float] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Get the recorded values of a product.
+
+        Parameters
+        ----------
+        product_id: str
+            The ID of the product, such as `ENCHANTED_DIAMOND`.
+        field: str
+            The value to get, which is one of `buy_price`, `sell_price`, `buy_volume` and `sell_volume`. Defaults
+            to `buy_price`.
+        window: Optional[float]
+            The seconds of history to get, up to the newest snapshot. Defaults to None, for all of it.
+
+        Returns
+        -------
+        List[Tuple[int, float]]
+            The timestamps of the snapshots in milliseconds along with the values, from the oldest.
+        """
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field {field}, which should be one of {', '.join(FIELDS)}")
+
+        series = self._series.get(product_id)
+        if series is None:
+            return []
+
+        with self._lock:
+            values = series[field]
+
+            return [
+                (self._timestamps[slot], values[slot])
+                for slot in self._slots(window)
+                if not math.isnan(values[slot])
+            ]
+
+    def average(self, product_id: str, field: str = "buy_price", window: Optional[float] = None) -> Optional[float]:
+        """Get the average of a value over the window, or None if nothing is recorded. See `history`."""
+        values = [value for _, value in self.history(product_id, field, window)]
+        return sum(values) / len(values) if values else None
+
+    def minimum(self, product_id: str, field: str = "buy_price", window: Optional[float] = None) -> Optional[float]:
+        """Get the minimum of a value over the window, or None if nothing is recorded. See `history`."""
+        return min((value for _, value in self.history(product_id, field, window)), default=None)
+
+    def maximum(self, product_id: str, field: str = "buy_price", window: Optional[float] = None) -> Optional[float]:
+        """Get the maximum of a value over the window, or None if nothing is recorded. See `history`."""
+        return max((value for _, value in self.history(product_id, field, window)), default=None)
+
+    def delta(self, product_id: str, field: str = "buy_price", window: Optional[float] = None) -> Optional[float]:
+        """Get the change of a value over the window, or None if nothing is recorded. See `history`."""
+        history = self.history(product_id, field, window)
+        return history[-1][1] - history[0][1] if history else None
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the recorded history to a compact binary file.
+
+        Parameters
+        ----------
+        path: Union[str, Path]
+            The path of the file to save to.
+        """
+        byteorder = b"<" if sys.byteorder == "little" else b">"
+
+        with self._lock, open(path, "wb") as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC, VERSION, byteorder, self.capacity, self._size, self._next,
+                    self.interval, self.last_updated, self.cadence,
+                )
+            )
+            self._timestamps.tofile(file)
+
+            file.write(PRODUCT_COUNT.pack(len(self._series)))
+            for product_id, series in self._series.items():
+                name = product_id.encode()
+                file.write(NAME_LENGTH.pack(len(name)) + name)
+
+                for field in FIELDS:
+                    series[field].tofile(file)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BazaarRecorder":
+        """
+        Load the history saved using `save`, to continue recording it.
+
+        Parameters
+        ----------
+        path: Union[str, Path]
+            The path of the file to load.
+
+        Returns
+        -------
+        BazaarRecorder
+            The recorder with the saved history.
+        """
+        with open(path, "rb") as file:
+            magic, version, byteorder, capacity, size, next_slot, interval, last_updated, cadence = HEADER.unpack(
+                file.read(HEADER.size)
+            )
+
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} isn't a bazaar history saved by this version")
+
+            # The arrays are saved in the byte order of the machine which saved them
+            swap = byteorder != (b"<" if sys.byteorder == "little" else b">")
+
+            recorder = cls(capacity, interval, cadence)
+            recorder.last_updated = last_updated
+            recorder._size, recorder._next = size, next_slot
+
+            recorder._timestamps = array("q")
+            recorder._timestamps.fromfile(file, capacity)
+
+            arrays = [recorder._timestamps]
+
+            (products,) = PRODUCT_COUNT.unpack(file.read(PRODUCT_COUNT.size))
+            for _ in range(products):
+                (length,) = NAME_LENGTH.unpack(file.read(NAME_LENGTH.size))
+                series = recorder._series[file.read(length).decode()] = _Series.__new__(_Series)
+
+                for field in FIELDS:
+                    values = array("f")
+                    values.fromfile(file, capacity)
+
+                    setattr(series, field, values)
+                    arrays.append(values)
+
+        if swap:
+            for values in arrays:
+                values.byteswap()
+
+        return recorder
@@ -0,0 +1,423 @@
+"""Caching of the responses from the Hypixel API."""
+__all__ = ("BaseCache", "CacheEntry", "ResponseCache", "SQLiteCache", "UUIDCache", "UUID_CACHE")
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import json_backend
+from .exceptions import PlayerNotFoundError
+
+
+@dataclass
+class CacheEntry:
+    data: Any
+    size: int
+    fetched_at: float
+    expires_at: float
+
+    # The raw response, and the validators to revalidate it once expired
+    body: Optional[bytes] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at <= time.time()
+
+    @property
+    def revalidation_headers(self) -> Dict[str, str]:
+        """The conditional request headers to check if the response has changed."""
+        headers = {}
+
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class BaseCache(ABC):
+    """The interface for the backends caching the API responses."""
+
+    @staticmethod
+    def make_key(route: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Form the cache key for a route and its parameters, independent of the order of the parameters."""
+        if not params:
+            return route
+
+        return route + "?" + "&".join(f"{key}={value}" for key, value in sorted(params.items()))
+
+    @abstractmethod
+    def get(self, key: str, allow_stale: bool = False) -> Optional[CacheEntry]:
+        """Get the entry cached for the key, if it exists and hasn't expired unless `allow_stale` is set."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Cache the entry for the key."""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry cached for the key, if any."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all the cached entries."""
+        ...
+
+
+class ResponseCache(BaseCache):
+    """
+    In-memory LRU cache for the API responses, evicting the least recently used entries once the entry count or the
+    size in bytes goes beyond the limits.
+
+    Examples
+    --------
+    Cache up to 2048 responses, taking at most 128 MB.
+
+        >>> cache = ResponseCache(max_entries=2048, max_bytes=128 * 1024 * 1024)
+        >>> client = hypixelio.Client(api_key="123-456-789", cache=cache)
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = 64 * 1024 * 1024) -> None:
+        """
+        Parameters
+        ----------
+        max_entries: int
+            The maximum amount of responses to cache. Defaults to 1024.
+        max_bytes: Optional[int]
+            The maximum total size of the cached responses in bytes, or None for no limit. Defaults to 64 MB.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.total_bytes = 0
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__qualname__} entries={len(self._entries)} max_entries={self.max_entries} "
+            f"total_bytes={self.total_bytes} max_bytes={self.max_bytes}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry.expired and not allow_stale:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # Entries which can never fit aren't cached.
+            if self.max_bytes is not None and entry.size > self.max_bytes:
+                return
+
+            # The decoded data is kept in memory, so the raw body isn't needed.
+            entry = replace(entry, body=None)
+
+            self._entries[key] = entry
+            self.total_bytes += entry.size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.total_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        self.total_bytes -= self._entries.pop(key).size
+
+
+class SQLiteCache(BaseCache):
+    """
+    Persistent cache storing the raw responses in an SQLite database, so that they are shared across processes and
+    survive restarts.
+
+    Only the routes starting with one of the `prefixes` are stored, which are the rarely changing `/resources`
+    routes by default. Expired entries are kept, and revalidated using conditional requests.
+
+    The database uses write-ahead logging, so that the workers sharing it can read while another one writes. Failing
+    to read or write an entry, such as when the database stays locked, is treated as a cache miss.
+
+    Examples
+    --------
+    Share the resources across the workers using a database on the local disk.
+
+        >>> client = hypixelio.Client(api_key="123-456-789", cache=SQLiteCache("/var/cache/hypixelio.sqlite3"))
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "hypixelio-cache.sqlite3",
+        prefixes: Optional[Tuple[str, ...]] = ("/resources/",),
+        timeout: float = 5,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path: Union[str, Path]
+            The path of the SQLite database file. Defaults to `hypixelio-cache.sqlite3`.
+        prefixes: Optional[Tuple[str, ...]]
+            The route prefixes to cache, or None to cache all the routes. Defaults to the `/resources` routes.
+        timeout: float
+            The seconds to wait for the other workers to release the database when it's locked. Defaults to 5.
+        """
+        self.path = str(path)
+        self.prefixes = prefixes
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL, expires_at REAL NOT NULL, "
+                "etag TEXT, last_modified TEXT)"
+            )
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__qualname__} path="{self.path}" prefixes={self.prefixes}>'
+
+    def _is_cached(self, key: str) -> bool:
+        return self.prefixes is None or key.startswith(self.prefixes)
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[CacheEntry]:
+        if not self._is_cached(key):
+            return None
+
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT body, fetched_at, expires_at, etag, last_modified FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        body, fetched_at, expires_at, etag, last_modified = row
+        entry = CacheEntry(json_backend.loads(body), len(body), fetched_at, expires_at, body, etag, last_modified)
+
+        if entry.expired and not allow_stale:
+            return None
+
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if not self._is_cached(key) or entry.body is None:
+            return
+
+        # The response has been fetched already, so failing to cache it shouldn't fail the request
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, entry.body, entry.fetched_at, entry.expires_at, entry.etag, entry.last_modified),
+                )
+        except sqlite3.Error:
+            pass
+
+    def delete(self, key: str) -> None:
+        if not self._is_cached(key):
+            return
+
+        try:
+            with self._lock, self._connection:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        try:
+            with self._lock, self._connection:
+                self._connection.execute("DELETE FROM responses")
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        self._connection.close()
+
+
+class UUIDCache:
+    """
+    Bounded cache of the username and UUID conversions in both directions, which also remembers the usernames that
+    weren't found for a shorter time.
+
+    The usernames are case-insensitive, like they are in Minecraft. A single instance, `UUID_CACHE`, is shared
+    by the sync and async converters, which the clients and utils use to resolve usernames.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 3600, negative_ttl: float = 60) -> None:
+        """
+        Parameters
+        ----------
+        max_entries: int
+            The maximum amount of conversions cached in each direction. Defaults to 10000.
+        ttl: float
+            The seconds to cache the conversions for. Defaults to an hour.
+        negative_ttl: float
+            The seconds to remember the usernames that weren't found. Defaults to a minute.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+        # Mapping of the keys to their value, and when they expire. A missing player has None as the UUID.
+        self._uuids: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._names: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__qualname__} usernames={len(self._uuids)} uuids={len(self._names)}>"
+
+    @staticmethod
+    def _normalize_uuid(uuid: str) -> str:
+        return uuid.replace("-", "").lower()
+
+    def _get(self, mapping: "OrderedDict[str, Any]", key: str) -> Optional[Tuple[Any, float]]:
+        item = mapping.get(key)
+
+        if item is None:
+            return None
+
+        if item[1] <= time.time():
+            del mapping[key]
+            return None
+
+        mapping.move_to_end(key)
+        return item
+
+    def _set(self, mapping: "OrderedDict[str, Any]", key: str, value: Any, ttl: float) -> None:
+        mapping[key] = (value, time.time() + ttl)
+        mapping.move_to_end(key)
+
+        while len(mapping) > self.max_entries:
+            mapping.popitem(last=False)
+
+    def get_uuid(self, username: str) -> Optional[str]:
+        """
+        Get the cached UUID of a username, or None if it isn't cached.
+
+        Raises `PlayerNotFoundError` if the username is cached as not found.
+        """
+        with self._lock:
+            item = self._get(self._uuids, username.lower())
+
+        if item is None:
+            return None
+
+        if item[0] is None:
+            raise PlayerNotFoundError("Username not found, as cached", username)
+
+        return item[0]
+
+    def get_username(self, uuid: str) -> Optional[str]:
+        """Get the cached username of a UUID, or None if it isn't cached."""
+        with self._lock:
+            item = self._get(self._names, self._normalize_uuid(uuid))
+
+        return item[0] if item is not None else None
+
+    def set(self, username: str, uuid: str) -> None:
+        """Cache the conversion of a username and its UUID, in both directions."""
+        with self._lock:
+            self._set(self._uuids, username.lower(), uuid, self.ttl)
+            self._set(self._names, self._normalize_uuid(uuid), username, self.ttl)
+
+    def split_cached(self, usernames: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Split the usernames into the UUIDs which are cached, and the usernames which need to be resolved.
+
+        The duplicate usernames, and the ones cached as not found are left out.
+        """
+        uuids = {}
+        pending = []
+
+        for username in dict.fromkeys(usernames):
+            try:
+                uuid = self.get_uuid(username)
+            except PlayerNotFoundError:
+                continue
+
+            if uuid is None:
+                pending.append(username)
+            else:
+                uuids[username] = uuid
+
+        return uuids, pending
+
+    def set_profiles(self, usernames: List[str], profiles: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Cache the profiles returned by Mojang for the usernames requested, and map the usernames to their UUIDs.
+
+        The usernames without a profile are cached as not found.
+        """
+        found = {profile["name"].lower(): profile for profile in profiles}
+        uuids = {}
+
+        for username in usernames:
+            profile = found.get(username.lower())
+
+            if profile is None:
+                self.set_missing(username)
+            else:
+                self.set(profile["name"], profile["id"])
+                uuids[username] = profile["id"]
+
+        return uuids
+
+    def set_missing(self, username: str) -> None:
+        """Remember that a username doesn't exist, for `negative_ttl` seconds."""
+        with self._lock:
+            self._set(self._uuids, username.lower(), None, self.negative_ttl)
+
+    def clear(self) -> None:
+        """Remove all the cached conversions."""
+        with self._lock:
+            self._uuids.clear()
+            self._names.clear()
+
+
+# The conversions cache shared by the converters.
+UUID_CACHE = UUIDCache()
@@ -10,12 +10,24 @@ __all__ = (
     "SKYWARS_PRESTIGES_RANKS",
     "SKYWARS_PRESTIGE_COLOR",
     "TIMEOUT",
+    "MAX_CONCURRENT_REQUESTS",
+    "MAX_RATELIMIT_WAIT",
+    "OFFLOAD_THRESHOLD",
+    "MOJANG_BATCH_SIZE",
+    "MOJANG_CONCURRENCY",
+    "BAZAAR_TAX",
 )
 
 HYPIXEL_API = "https://api.hypixel.net"
 MOJANG_API = "https://api.mojang.com"
 
 TIMEOUT = 10
+MAX_CONCURRENT_REQUESTS = 10  # Requests allowed in-flight at once by the async client
+MAX_RATELIMIT_WAIT = 60  # Seconds to wait for a ratelimit to reset, when waiting is enabled
+OFFLOAD_THRESHOLD = 256 * 1024  # Bytes from which the async client decodes responses off the event loop
+MOJANG_BATCH_SIZE = 10  # Usernames allowed per request to the Mojang bulk profiles endpoint
+MOJANG_CONCURRENCY = 4  # Bulk profile requests sent at once, to stay within the Mojang ratelimits
+BAZAAR_TAX = 0.0125  # Share of the coins taken by the bazaar from the filled sell offers
 DEFAULT_HEADERS = {
     "Accept-Encoding": "gzip, deflate"  # To enable gzip compression and reduce bandwidth
 }
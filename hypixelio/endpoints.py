@@ -15,6 +15,7 @@ API_PATH = {
         "recent_games": "/recentgames",
         "skyblock_auctions": "/skyblock/auction",
         "skyblock_active_auctions": "/skyblock/auctions",
+        "skyblock_ended_auctions": "/skyblock/auctions_ended",
         "skyblock_bazaar": "/skyblock/bazaar",
         "skyblock_profile": "/skyblock/profile",
         "skyblock_news": "/skyblock/news",
@@ -27,6 +28,7 @@ API_PATH = {
     },
     "MOJANG": {
         "username_to_uuid": "/users/profiles/minecraft/{}",
+        "usernames_to_uuids": "/profiles/minecraft",
         "uuid_to_username": "/user/profiles/{}/names",
         "name_history": "/user/profiles/{}/names",
     },
@@ -37,3 +39,29 @@ API_PATH = {
         "skins": "/skins/{}",
     },
 }
+
+# The default seconds the responses of the Hypixel endpoints are cached for, when caching is enabled.
+CACHE_TTL = {
+    "boosters": 60,
+    "player": 60,
+    "friends": 300,
+    "watchdog": 60,
+    "guild": 300,
+    "game_info": 60,
+    "leaderboards": 3600,
+    "find_guild": 300,
+    "status": 30,
+    "recent_games": 60,
+    "skyblock_auctions": 60,
+    "skyblock_active_auctions": 30,
+    "skyblock_ended_auctions": 30,
+    "skyblock_bazaar": 20,
+    "skyblock_profile": 60,
+    "skyblock_news": 3600,
+    "skyblock_skills": 6 * 3600,
+    "skyblock_collections": 6 * 3600,
+    "achievements": 6 * 3600,
+    "challenges": 6 * 3600,
+    "quests": 6 * 3600,
+    "guild_achievements": 6 * 3600,
+}
@@ -0,0 +1,70 @@
+"""The JSON backend decoding the API responses, using the fastest library installed."""
+__all__ = ("BACKENDS", "backend", "dumps", "loads", "set_backend")
+
+import json
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# The backends supported, from the fastest
+BACKENDS = ("orjson", "ujson", "json")
+
+# The functions decoding from bytes, and encoding to bytes for the backends installed
+_FUNCTIONS: Dict[str, Tuple[Callable[[Union[bytes, str]], Any], Callable[[Any], bytes]]] = {
+    "json": (json.loads, lambda data: json.dumps(data).encode()),
+}
+
+if ujson is not None:
+    _FUNCTIONS["ujson"] = (ujson.loads, lambda data: ujson.dumps(data).encode())
+
+if orjson is not None:
+    _FUNCTIONS["orjson"] = (orjson.loads, orjson.dumps)
+
+# The backend in use, along with its functions
+backend = "json"
+loads, dumps = _FUNCTIONS["json"]
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+    Set the library used to decode and encode JSON, which defaults to the fastest one installed.
+
+    orjson is installed using the `orjson` extra, and decodes the responses a few times faster than the `json`
+    module of the standard library.
+
+    Parameters
+    ----------
+    name: Optional[str]
+        The backend to use, out of `BACKENDS`. Defaults to None, which picks the fastest one installed.
+
+    Returns
+    -------
+    str
+        The name of the backend used.
+    """
+    global backend, loads, dumps
+
+    if name is None:
+        name = next(option for option in BACKENDS if option in _FUNCTIONS)
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name}, expected one of {', '.join(BACKENDS)}")
+
+    if name not in _FUNCTIONS:
+        raise ImportError(f"The {name} JSON backend isn't installed")
+
+    backend = name
+    loads, dumps = _FUNCTIONS[name]
+
+    return name
+
+
+set_backend()
@@ -1,14 +1,26 @@
 __all__ = ("Client",)
 
 import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from types import TracebackType
-from typing import Any, Dict, Optional, Type, Union, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .converters import Converters
+from ..auctions import AuctionTable
 from ..base import BaseClient
-from ..constants import DEFAULT_HEADERS, HYPIXEL_API, TIMEOUT
+from ..cache import BaseCache
+from ..constants import (
+    DEFAULT_HEADERS,
+    HYPIXEL_API,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_RATELIMIT_WAIT,
+    TIMEOUT,
+)
 from ..exceptions import (
     GuildNotFoundError,
     HypixelAPIError,
@@ -23,17 +35,19 @@ from ..models.games import Games
 from ..models.guild import Guild
 from ..models.key import Key
 from ..models.leaderboard import Leaderboard
-from ..models.player import Player
+from ..models.player import LazyPlayer, Player
 from ..models.player_status import PlayerStatus
 from ..models.recent_games import RecentGames
 from ..models.skyblock import (
     SkyblockActiveAuction,
     SkyblockBazaar,
+    SkyblockEndedAuctions,
     SkyblockNews,
     SkyblockProfile,
     SkyblockUserAuction,
 )
 from ..models.watchdog import Watchdog
+from ..retry import RetryPolicy
 from ..utils import form_url
 
 
@@ -51,27 +65,94 @@ class Client(BaseClient):
     You can use multiple API keys to authenticate too. (Better option for load balancing)
 
         >>> client = hypixelio.Client(api_key=["123-456", "789-000", "568-908"])
+
+    To wait for the ratelimit to reset instead of raising `RateLimitError`, enable `wait_on_ratelimit`.
+
+        >>> client = hypixelio.Client(api_key="123-456-789", wait_on_ratelimit=True, max_ratelimit_wait=30)
+
+    To skip building the models, such as when storing the responses, enable `raw` to get the JSON payloads. The
+    undecoded response bodies can be fetched using `get_raw`.
+
+        >>> client = hypixelio.Client(api_key="123-456-789", raw=True)
+        >>> body = client.get_raw("skyblock_bazaar", decode=False)
+
+    The client is thread-safe, so a single one can be shared by all the threads. Size its connection pool to match
+    the amount of threads using it.
+
+        >>> client = hypixelio.Client(api_key="123-456-789", pool_size=32)
     """
 
-    def __init__(self, api_key: Union[str, list]) -> None:
+    def __init__(
+        self,
+        api_key: Union[str, list],
+        wait_on_ratelimit: bool = False,
+        max_ratelimit_wait: float = MAX_RATELIMIT_WAIT,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[BaseCache] = None,
+        cache_ttl: Optional[Dict[str, float]] = None,
+        pool_size: int = MAX_CONCURRENT_REQUESTS,
+        raw: bool = False,
+    ) -> None:
         """
         Parameters
         ----------
         api_key: Union[str, list]
             The API key generated in Hypixel server using the `/api new` command.
-        """
-        super().__init__(api_key)
+        wait_on_ratelimit: bool
+            Wait for a key to be available when all of them are ratelimited, instead of raising. Defaults to False.
+        max_ratelimit_wait: float
+            The maximum seconds to wait for a key before raising `RateLimitError`. Defaults to 60.
+        retry_policy: Optional[RetryPolicy]
+            The policy for retrying the failed requests. Defaults to retrying ratelimits, 5xx errors and timeouts.
+        cache: Optional[BaseCache]
+            The cache to store the responses in, such as `ResponseCache`. Defaults to None, which disables caching.
+        cache_ttl: Optional[Dict[str, float]]
+            The seconds to cache the responses for, by the endpoint names. Defaults to the TTLs in `CACHE_TTL`.
+        pool_size: int
+            The maximum connections kept open to the API, which should match the threads using it. Defaults to 10.
+        raw: bool
+            Give the decoded JSON payloads from the `get_*` methods instead of building the models. Defaults to False.
+        """
+        super().__init__(
+            api_key,
+            wait_on_ratelimit=wait_on_ratelimit,
+            max_ratelimit_wait=max_ratelimit_wait,
+            retry_policy=retry_policy,
+            cache=cache,
+            cache_ttl=cache_ttl,
+            raw=raw,
+        )
 
         self._session = requests.Session()
         self._session.headers.update(DEFAULT_HEADERS)
 
+        # Keep a connection open for every thread sharing the client
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # The requests in-flight by their route and parameters, to share their responses
+        self._in_flight: Dict[str, "Future[Union[Dict[str, Any], bytes]]"] = {}
+        self._in_flight_lock = threading.Lock()
+
+    def _acquire_key(self) -> str:
+        """Reserve a request from the least loaded key, waiting for one to be available if enabled."""
+        deadline = time.monotonic() + self.max_ratelimit_wait
+
+        while True:
+            try:
+                return self._select_key()
+            except RateLimitError:
+                time.sleep(self._ratelimit_delay(deadline))
+
     def _fetch(
         self,
         url: str,
         data: Optional[Dict[str, Any]] = None,
         *,
         api_key: bool = True,
-    ) -> Dict[str, Any]:
+        decode: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
         """
         Fetch the JSON response from the API along with the ability to include GET request parameters and support
         Authentication using API key too.
@@ -84,54 +165,96 @@ class Client(BaseClient):
             The GET request's key-value pair. eg: `{"uuid": "abc"}` is converted to `?uuid=abc`. Defaults to None.
         api_key: bool
             If key is needed for the endpoin
+        decode: bool
+            Decode the JSON response, instead of giving the undecoded body. Defaults to True.
 
         Returns
         -------
-        Dict[str, Any]
+        Union[Dict[str, Any], bytes]
             The JSON response obtained after fetching the API, along with success value in the response.
         """
-        # Check if ratelimit is hit
-        if self._is_ratelimit_hit():
-            raise RateLimitError(self.retry_after)
-
         # If no data for JSON
         if not data:
             data = {}
 
-        # Assign a random key if the Key parameter exists.
-        if api_key:
-            self.headers["API-Key"] = random.choice(self._api_key)
+        # Share the response of an identical request already in-flight, instead of sending it again
+        request_key = BaseCache.make_key(url, data) + ("" if decode else "#body")
 
-        # Form the URL to fetch
-        url = form_url(HYPIXEL_API, url, data)
+        with self._in_flight_lock:
+            future = self._in_flight.get(request_key)
+            is_leader = future is None
+
+            if future is None:
+                future = self._in_flight[request_key] = Future()
+
+        if not is_leader:
+            return future.result()
 
-        # Core fetch logic
-        with self._session.get(url, timeout=TIMEOUT, headers=self.headers) as response:
-            # 404 handling
-            if response.status_code == 404:
-                raise HypixelAPIError("The route specified does not exis")
+        try:
+            json = self._request(url, data, api_key, decode)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(json)
+            return json
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[request_key]
+
+    def _request(
+        self, url: str, data: Dict[str, Any], api_key: bool, decode: bool = True
+    ) -> Union[Dict[str, Any], bytes]:
+        """Send the request for `_fetch`, along with caching, retrying and ratelimit handling."""
+        # Use the cached response if there's one, or revalidate it once expired
+        cached = self._get_cached(url, data)
+        if cached is not None and not cached.expired:
+            return self._cached_payload(cached, decode)
+
+        # Form the URL to fetch
+        route, url = url, form_url(HYPIXEL_API, url, data)
 
-            # 429 Code handle
-            if response.status_code == 429:
-                self._handle_ratelimit(cast(dict, response.headers))
+        attempt = 0
+        while True:
+            attempt += 1
 
-            # 403 Code handle
-            if response.status_code == 403:
-                raise HypixelAPIError("Invalid key specified!")
+            # Use a copy of the headers, since the client can be shared by threads
+            headers = dict(self.headers)
+            if cached is not None:
+                headers.update(cached.revalidation_headers)
 
-            # Ratelimit handling
-            if api_key and "RateLimit-Limit" in response.headers:
-                self._update_ratelimit(cast(dict, response.headers))
+            # Assign the least loaded key if the Key parameter exists.
+            key = self._acquire_key() if api_key else None
+            if key:
+                headers["API-Key"] = key
 
+            # Core fetch logic
             try:
-                json = response.json()
-            except Exception as exc:
-                raise HypixelAPIError(f"{exc}")
-            else:
-                if not json["success"]:
-                    self._handle_api_failure(json)
+                with self._session.get(url, timeout=TIMEOUT, headers=headers) as response:
+                    resp_headers = cast(dict, response.headers)
 
-                return json
+                    # The cached response hasn't changed
+                    if response.status_code == 304 and cached is not None:
+                        if key:
+                            self._update_ratelimit(key, resp_headers)
+
+                        return self._refresh_cached(route, data, cached, decode)
+
+                    delay = self._retry_delay(attempt, key, response.status_code, resp_headers)
+
+                    if delay is None:
+                        self._check_response(key, response.status_code, resp_headers)
+
+                        return self._load_response(
+                            route, data, response.content, response.status_code, resp_headers, decode
+                        )
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                delay = self._retry_delay(attempt)
+
+                if delay is None:
+                    raise HypixelAPIError(f"{exc}") from exc
+
+            time.sleep(delay)
 
     def __enter__(self) -> "Client":
         return self
@@ -160,6 +283,33 @@ class Client(BaseClient):
 
         return uuid  # type: ignore
 
+    def get_raw(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None, decode: bool = True
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        Get the response of a Hypixel API endpoint without building any models, using the same caching, retrying
+        and ratelimit handling as the other methods.
+
+        Parameters
+        ----------
+        endpoint: str
+            The name of the endpoint in `API_PATH`, such as `skyblock_bazaar`.
+        params: Optional[Dict[str, Any]]
+            The query parameters of the request, such as `{"page": 2}`. Defaults to None.
+        decode: bool
+            Decode the JSON payload, instead of giving the undecoded response body. Defaults to True.
+
+        Returns
+        -------
+        Union[Dict[str, Any], bytes]
+            The decoded JSON payload, or the response body if not decoded.
+        """
+        if endpoint not in self.url:
+            raise InvalidArgumentError(f"Unknown endpoint specified: {endpoint}")
+
+        route = self.url[endpoint]
+        return self._fetch(route, params, api_key=not route.startswith("/resources/"), decode=decode)
+
     # Hypixel API endpoint methods.
     def get_key_info(self, api_key: Optional[str] = None) -> Key:
         """
@@ -178,7 +328,7 @@ class Client(BaseClient):
         api_key = api_key or random.choice(self._api_key)
 
         json = self._fetch(self.url["api_key"], {"key": api_key})
-        return Key(json["record"])
+        return self._model(json, Key, json["record"])
 
     def get_boosters(self) -> Boosters:
         """
@@ -191,10 +341,10 @@ class Client(BaseClient):
         """
         json = self._fetch(self.url["boosters"])
 
-        return Boosters(json["boosters"], json)
+        return self._model(json, Boosters, json["boosters"], json)
 
     def get_player(
-        self, name: Optional[str] = None, uuid: Optional[str] = None
+        self, name: Optional[str] = None, uuid: Optional[str] = None, lazy: bool = False
     ) -> Player:
         """
         Get all info about a Hypixel player using his username or his player UUID.
@@ -205,6 +355,8 @@ class Client(BaseClient):
             The Optional string value for the Username. Defaults to None.
         uuid: Optional[str]
             The Optional string value to the UUID. Defaults to None.
+        lazy: bool
+            Parse the fields of the player on their first access, instead of upfront. Defaults to False.
 
         Returns
         -------
@@ -217,7 +369,81 @@ class Client(BaseClient):
         if not json["player"]:
             raise PlayerNotFoundError("Null is returned", name)
 
-        return Player(json["player"])
+        return self._model(json, LazyPlayer if lazy else Player, json["player"])
+
+    def iter_players(
+        self, uuids: Iterable[str], concurrency: int = MAX_CONCURRENT_REQUESTS, lazy: bool = False
+    ) -> Iterator[Tuple[str, Union[Player, Exception]]]:
+        """
+        Get many players concurrently using a thread pool, yielding them as soon as they're fetched.
+
+        The errors for a player, such as `PlayerNotFoundError`, `RateLimitError` or a connection error, are yielded in
+        the place of the player instead of stopping the others.
+
+        Parameters
+        ----------
+        uuids: Iterable[str]
+            The UUIDs of the players to get.
+        concurrency: int
+            The maximum amount of players fetched at once. Defaults to 10.
+        lazy: bool
+            Parse the fields of the players on their first access, instead of upfront. Defaults to False.
+
+        Returns
+        -------
+        Iterator[Tuple[str, Union[Player, Exception]]]
+            The UUID of every player along with the player object, or the error raised while getting it.
+        """
+        def fetch(uuid: str) -> Union[Player, Exception]:
+            try:
+                return self.get_player(uuid=uuid, lazy=lazy)
+            except Exception as exc:
+                return exc
+
+        remaining = iter(uuids)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending: Dict["Future[Union[Player, Exception]]", str] = {}
+
+            while True:
+                # Keep the pool busy, without queueing all the players at once
+                for uuid in remaining:
+                    pending[executor.submit(fetch, uuid)] = uuid
+
+                    if len(pending) >= concurrency:
+                        break
+
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+    def get_players(
+        self, uuids: Iterable[str], concurrency: int = MAX_CONCURRENT_REQUESTS, lazy: bool = False
+    ) -> Dict[str, Union[Player, Exception]]:
+        """
+        Get many players concurrently using a thread pool.
+
+        Parameters
+        ----------
+        uuids: Iterable[str]
+            The UUIDs of the players to get.
+        concurrency: int
+            The maximum amount of players fetched at once. Defaults to 10.
+        lazy: bool
+            Parse the fields of the players on their first access, instead of upfront. Defaults to False.
+
+        Returns
+        -------
+        Dict[str, Union[Player, Exception]]
+            The UUIDs mapped to their player object, or the error raised while getting it, in the order given.
+        """
+        uuids = list(uuids)
+        players = dict(self.iter_players(uuids, concurrency, lazy))
+
+        return {uuid: players[uuid] for uuid in uuids}
 
     def get_friends(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -240,7 +466,7 @@ class Client(BaseClient):
         uuid = self._filter_name_uuid(name, uuid)
         json = self._fetch(self.url["friends"], {"uuid": uuid})
 
-        return Friends(json["records"])
+        return self._model(json, Friends, json["records"])
 
     def get_watchdog_info(self) -> Watchdog:
         """
@@ -253,7 +479,7 @@ class Client(BaseClient):
         """
         json = self._fetch(self.url["watchdog"])
 
-        return Watchdog(json)
+        return self._model(json, Watchdog, json)
 
     def get_guild(
         self,
@@ -292,7 +518,7 @@ class Client(BaseClient):
         if not json["guild"]:
             raise GuildNotFoundError("Value returned is null")
 
-        return Guild(json["guild"])
+        return self._model(json, Guild, json["guild"])
 
     def get_games_info(self) -> Games:
         """
@@ -305,7 +531,7 @@ class Client(BaseClient):
         """
         json = self._fetch(self.url["game_info"])
 
-        return Games(json["games"], json["playerCount"])
+        return self._model(json, Games, json["games"], json["playerCount"])
 
     def get_leaderboards(self) -> Leaderboard:
         """
@@ -318,7 +544,7 @@ class Client(BaseClient):
         """
         json = self._fetch(self.url["leaderboards"])
 
-        return Leaderboard(json["leaderboards"])
+        return self._model(json, Leaderboard, json["leaderboards"])
 
     def find_guild(
         self, guild_name: Optional[str] = None, player_uuid: Optional[str] = None
@@ -347,7 +573,7 @@ class Client(BaseClient):
                 "Named argument for guild's name or UUID not found."
             )
 
-        return FindGuild(json)
+        return self._model(json, FindGuild, json)
 
     def get_player_status(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -370,7 +596,7 @@ class Client(BaseClient):
         uuid = self._filter_name_uuid(name, uuid)
         json = self._fetch(self.url["status"], {"uuid": uuid})
 
-        return PlayerStatus(json)
+        return self._model(json, PlayerStatus, json)
 
     def get_player_recent_games(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -393,12 +619,12 @@ class Client(BaseClient):
         uuid = self._filter_name_uuid(name, uuid)
         json = self._fetch(self.url["recent_games"], {"uuid": uuid})
 
-        return RecentGames(json)
+        return self._model(json, RecentGames, json)
 
     def get_skyblock_news(self) -> SkyblockNews:
         json = self._fetch(self.url["skyblock_news"])
 
-        return SkyblockNews(json)
+        return self._model(json, SkyblockNews, json)
 
     def get_skyblock_profile(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -424,7 +650,7 @@ class Client(BaseClient):
         if not json["profile"]:
             raise PlayerNotFoundError("The skyblock player does not exist!", uuid)
 
-        return SkyblockProfile(json)
+        return self._model(json, SkyblockProfile, json)
 
     def get_skyblock_user_auctions(
         self, name: Optional[str] = None, uuid: Optional[str] = None
@@ -450,7 +676,7 @@ class Client(BaseClient):
         if not json["auctions"]:
             raise PlayerNotFoundError("The skyblock player does not exist!", uuid)
 
-        return SkyblockUserAuction(json)
+        return self._model(json, SkyblockUserAuction, json)
 
     def get_skyblock_active_auctions(self, page: int = 0) -> SkyblockActiveAuction:
         """
@@ -467,7 +693,110 @@ class Client(BaseClient):
             The active auction model.
         """
         json = self._fetch(self.url["skyblock_active_auctions"], {"page": page})
-        return SkyblockActiveAuction(json)
+        return self._model(json, SkyblockActiveAuction, json)
+
+    def fetch_all_active_auctions(
+        self, concurrency: int = MAX_CONCURRENT_REQUESTS, max_restarts: int = 3
+    ) -> SkyblockActiveAuction:
+        """
+        Get the active auctions in skyblock from all the pages as one consistent snapshot, fetching the pages
+        concurrently using a thread pool.
+
+        Every page is checked to be from the same update of the auction house, and the crawl is restarted if the
+        auction house is updated partway through.
+
+        Parameters
+        ----------
+        concurrency: int
+            The maximum amount of pages fetched at once. Defaults to 10.
+        max_restarts: int
+            The times to restart the crawl if the auction house is updated during it. Defaults to 3.
+
+        Returns
+        -------
+        SkyblockActiveAuction
+            The active auction model, with the auctions from all the pages.
+        """
+        pages = self._crawl_active_auctions(concurrency, max_restarts)
+        return self._model(pages, SkyblockActiveAuction.from_pages, pages)
+
+    def fetch_auction_table(
+        self, concurrency: int = MAX_CONCURRENT_REQUESTS, max_restarts: int = 3
+    ) -> AuctionTable:
+        """
+        Get the active auctions in skyblock from all the pages as one consistent snapshot, stored in a compact
+        columnar table instead of an object for every auction.
+
+        Parameters
+        ----------
+        concurrency: int
+            The maximum amount of pages fetched at once. Defaults to 10.
+        max_restarts: int
+            The times to restart the crawl if the auction house is updated during it. Defaults to 3.
+
+        Returns
+        -------
+        AuctionTable
+            The table with the auctions from all the pages.
+        """
+        pages = self._crawl_active_auctions(concurrency, max_restarts)
+        return AuctionTable.from_pages(pages)
+
+    def _crawl_active_auctions(
+        self, concurrency: int = MAX_CONCURRENT_REQUESTS, max_restarts: int = 3
+    ) -> List[Dict[str, Any]]:
+        """Fetch the pages of the auction house from the same snapshot, for the auction crawlers."""
+        route = self.url["skyblock_active_auctions"]
+
+        for _ in range(max_restarts + 1):
+            first = self._fetch(route, {"page": 0})
+            pages = [first]
+
+            remaining = iter(range(1, first["totalPages"]))
+            changed = False
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                pending: Set["Future[Dict[str, Any]]"] = set()
+
+                while True:
+                    # Stop sending the remaining pages once the snapshot has changed
+                    if not changed:
+                        for page in remaining:
+                            pending.add(executor.submit(self._fetch, route, {"page": page}))
+
+                            if len(pending) >= concurrency:
+                                break
+
+                    if not pending:
+                        break
+
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        json = future.result()
+                        pages.append(json)
+
+                        changed = changed or json.get("lastUpdated") != first.get("lastUpdated")
+
+            if not changed:
+                return sorted(pages, key=lambda json: json["page"])
+
+            # Drop the cached pages from the older snapshot, so that they're fetched again
+            for page in self._outdated_pages(pages):
+                self._uncache(route, {"page": page})
+
+        raise HypixelAPIError("The auction house kept updating while fetching all of its pages")
+
+    def get_skyblock_ended_auctions(self) -> SkyblockEndedAuctions:
+        """
+        Get the auctions in skyblock which ended within the last minute.
+
+        Returns
+        -------
+        SkyblockEndedAuctions
+            The ended auctions model.
+        """
+        json = self._fetch(self.url["skyblock_ended_auctions"])
+        return self._model(json, SkyblockEndedAuctions, json)
 
     def get_skyblock_bazaar(self) -> SkyblockBazaar:
         """
@@ -479,26 +808,46 @@ class Client(BaseClient):
             The bazaar model object representing each produc
         """
         json = self._fetch(self.url["skyblock_bazaar"])
-        return SkyblockBazaar(json)
+        return self._model(json, SkyblockBazaar, json)
 
     def get_resources_achievements(self) -> dict:
         data = self._fetch(self.url["achievements"], api_key=False)
+
+        if self.raw:
+            return data
+
         return data["achievements"]
 
     def get_resources_challenges(self) -> dict:
         data = self._fetch(self.url["challenges"], api_key=False)
+
+        if self.raw:
+            return data
+
         return data["challenges"]
 
     def get_resources_quests(self) -> dict:
         data = self._fetch(self.url["quests"], api_key=False)
+
+        if self.raw:
+            return data
+
         return data["quests"]
 
     def get_resources_guild_achievements(self) -> dict:
         data = self._fetch(self.url["guild_achievements"], api_key=False)
+
+        if self.raw:
+            return data
+
         return {"one_time": data["one_time"], "tiered": data["tiered"]}
 
     def get_skyblock_skills(self) -> dict:
         data = self._fetch(self.url["skyblock_skills"], api_key=False)
+
+        if self.raw:
+            return data
+
         return {
             "skills": data["skills"],
             "collections": data["collections"],
@@ -506,4 +855,8 @@ class Client(BaseClient):
 
     def get_skyblock_collections(self) -> dict:
         data = self._fetch(self.url["skyblock_collections"], api_key=False)
+
+        if self.raw:
+            return data
+
         return data["collections"]
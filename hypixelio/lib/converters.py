@@ -1,10 +1,12 @@
 __all__ = ("Converters",)
 
-from typing import Any, Dict, Union, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union, cast
 
 import requests
 
-from ..constants import MOJANG_API, TIMEOUT
+from ..cache import UUID_CACHE
+from ..constants import MOJANG_API, MOJANG_BATCH_SIZE, MOJANG_CONCURRENCY, TIMEOUT
 from ..endpoints import API_PATH
 from ..exceptions import MojangAPIError, PlayerNotFoundError
 
@@ -12,8 +14,11 @@ from ..exceptions import MojangAPIError, PlayerNotFoundError
 class Converters:
     url = API_PATH["MOJANG"]
 
+    # Cache of the conversions, shared with the other converters
+    cache = UUID_CACHE
+
     @classmethod
-    def _fetch(cls, url: str) -> Union[dict, list]:
+    def _fetch(cls, url: str, data: Optional[list] = None) -> Union[dict, list]:
         """
         The internal function for fetching info from the Mojang API.
 
@@ -21,6 +26,8 @@ class Converters:
         ----------
         url: str
             The Mojang URL, whose JSON is supposed to be fetched.
+        data: Optional[list]
+            The JSON body to send using a POST request, instead of a GET request. Defaults to None.
 
         Returns
         -------
@@ -28,7 +35,9 @@ class Converters:
             The JSON response from the Mojang API.
         """
         with requests.Session() as session:
-            with session.get(MOJANG_API + url, timeout=TIMEOUT) as response:
+            with session.request(
+                "GET" if data is None else "POST", MOJANG_API + url, json=data, timeout=TIMEOUT
+            ) as response:
                 if response.status_code == 204:
                     raise PlayerNotFoundError(
                         "Error code 204 returned during conversion to UUID", None
@@ -62,14 +71,71 @@ class Converters:
         str
             returns the converted UUID for the respective username.
         """
-        json = cast(
-            Dict[str, Any],
-            Converters._fetch(Converters.url["username_to_uuid"].format(username)),
-        )
-        print(json)
-
+        uuid = cls.cache.get_uuid(username)
+        if uuid is not None:
+            return uuid
+
+        try:
+            json = cast(
+                Dict[str, Any],
+                cls._fetch(cls.url["username_to_uuid"].format(username)),
+            )
+        except PlayerNotFoundError:
+            cls.cache.set_missing(username)
+            raise
+
+        cls.cache.set(json.get("name", username), json["id"])
         return json["id"]
 
+    @classmethod
+    def usernames_to_uuids(
+        cls, usernames: List[str], max_concurrency: int = MOJANG_CONCURRENCY
+    ) -> Dict[str, str]:
+        """
+        Convert many usernames to their UUIDs at once, using the Mojang bulk endpoint which resolves 10 usernames per
+        request. The batches are sent concurrently.
+
+        Parameters
+        ----------
+        usernames: List[str]
+            The minecraft usernames to convert.
+        max_concurrency: int
+            The maximum amount of batches requested at once. Defaults to 4.
+
+        Returns
+        -------
+        Dict[str, str]
+            The usernames mapped to their UUIDs. The usernames which don't exist, or couldn't be resolved such as when
+            ratelimited, are left out.
+        """
+        uuids, pending = cls.cache.split_cached(usernames)
+        batches = [pending[i:i + MOJANG_BATCH_SIZE] for i in range(0, len(pending), MOJANG_BATCH_SIZE)]
+
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+                for batch_uuids in executor.map(cls._resolve_batch, batches):
+                    uuids.update(batch_uuids)
+
+        return uuids
+
+    @classmethod
+    def _resolve_batch(cls, usernames: List[str]) -> Dict[str, str]:
+        try:
+            profiles = cast(list, cls._fetch(cls.url["usernames_to_uuids"], usernames))
+        except PlayerNotFoundError:
+            # A badly formed username fails the whole batch, so the halves are resolved until it's found
+            if len(usernames) == 1:
+                cls.cache.set_missing(usernames[0])
+                return {}
+
+            middle = len(usernames) // 2
+            return {**cls._resolve_batch(usernames[:middle]), **cls._resolve_batch(usernames[middle:])}
+        except (MojangAPIError, requests.RequestException):
+            # Such as when ratelimited, the usernames might exist so they aren't cached as not found
+            return {}
+
+        return cls.cache.set_profiles(usernames, profiles)
+
     @classmethod
     def uuid_to_username(cls, uuid: str) -> str:
         """
@@ -85,6 +151,11 @@ class Converters:
         str
             The username for the respective minecraft UUID is returned.
         """
-        json = Converters._fetch(Converters.url["uuid_to_username"].format(uuid))
+        username = cls.cache.get_username(uuid)
+        if username is not None:
+            return username
+
+        json = cls._fetch(cls.url["uuid_to_username"].format(uuid))
 
+        cls.cache.set(json[-1]["name"], uuid)
         return json[-1]["name"]
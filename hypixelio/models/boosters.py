@@ -4,6 +4,17 @@ from hypixelio.utils import unix_time_to_datetime
 
 
 class BoosterInfo:
+    __slots__ = (
+        "id",
+        "purchaser_uuid",
+        "amount",
+        "original_length",
+        "length",
+        "game_type_code",
+        "date_activated",
+        "stacked",
+    )
+
     def __init__(self, info: Dict[str, Any]) -> None:
         """
         Parameters
@@ -4,6 +4,8 @@ from hypixelio.utils import unix_time_to_datetime
 
 
 class FriendData:
+    __slots__ = ("request_id", "sender_id", "receiver_id", "sent_at")
+
     def __init__(self, friend: dict) -> None:
         """
         Parameters
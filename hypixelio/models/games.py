@@ -1,4 +1,6 @@
 class GameCount:
+    __slots__ = ("players", "modes")
+
     def __init__(self, game: dict) -> None:
         """
         Parameters
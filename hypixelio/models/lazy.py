@@ -0,0 +1,97 @@
+import typing as t
+from operator import itemgetter
+
+
+class LazyField:
+    """
+    Field of a model parsed from the raw data of the model on the first access, and cached in the instance.
+
+    Works like `functools.cached_property`, which isn't available on Python 3.7. The raw data is read from the
+    `_data` attribute of the instance.
+    """
+
+    def __init__(
+        self,
+        source: t.Union[str, t.Callable[[dict], t.Any]],
+        convert: t.Optional[t.Callable[[t.Any], t.Any]] = None,
+        optional: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        source: t.Union[str, t.Callable[[dict], t.Any]]
+            The key of the field in the raw data, or a function parsing the field from the raw data.
+        convert: t.Optional[t.Callable[[t.Any], t.Any]]
+            The function converting the value of the key, if any. Defaults to None.
+        optional: bool
+            If the key can be missing, giving None instead of raising. Defaults to False.
+        """
+        self.key = None if callable(source) else source
+        self.convert = convert
+        self.optional = optional
+
+        if callable(source):
+            self.parse = source
+        elif optional:
+            self.parse = lambda data: data.get(source)
+        elif convert is not None:
+            self.parse = lambda data: convert(data[source])
+        else:
+            self.parse = itemgetter(source)
+
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: t.Any, owner: t.Optional[type] = None) -> t.Any:
+        if instance is None:
+            return self
+
+        # Cached in the instance, which takes precedence over this descriptor from now on
+        value = instance.__dict__[self.name] = self.parse(instance._data)
+        return value
+
+
+def eager_init(fields: t.Dict[str, LazyField], doc: t.Optional[str] = None) -> t.Callable[[t.Any, dict], None]:
+    """
+    Create the `__init__` of a model parsing all the fields upfront from its raw data, such as the eager version of a
+    model with a lazy one.
+
+    The fields are assigned one by one like in a handwritten `__init__`, which is faster than reading them in a loop.
+    """
+    namespace: t.Dict[str, t.Any] = {}
+    lines = ["def __init__(self, data: dict) -> None:"]
+
+    for name, field in fields.items():
+        if field.key is None:
+            namespace[f"_parse_{name}"] = field.parse
+            value = f"_parse_{name}(data)"
+        elif field.optional:
+            value = f"data.get({field.key!r})"
+        elif field.convert is not None:
+            namespace[f"_convert_{name}"] = field.convert
+            value = f"_convert_{name}(data[{field.key!r}])"
+        else:
+            value = f"data[{field.key!r}]"
+
+        lines.append(f"    self.{name} = {value}")
+
+    exec("\n".join(lines), namespace)
+
+    init = namespace["__init__"]
+    init.__doc__ = doc
+    return init
+
+
+def lazy_fields(fields: t.Dict[str, LazyField]) -> t.Callable[[type], type]:
+    """Add the fields to the lazy version of a model, as the class decorator."""
+
+    def decorator(klass: type) -> type:
+        for name, field in fields.items():
+            setattr(klass, name, field)
+            field.__set_name__(klass, name)
+
+        return klass
+
+    return decorator
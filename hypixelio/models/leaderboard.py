@@ -1,4 +1,6 @@
 class LeaderboardData:
+    __slots__ = ("path", "prefix", "title", "location", "count", "leaders_uuid")
+
     def __init__(self, data: dict) -> None:
         """
         Parameters
@@ -1,6 +1,8 @@
 import typing as t
 from dataclasses import dataclass
+from datetime import datetime
 
+from hypixelio.models.lazy import LazyField, eager_init, lazy_fields
 from hypixelio.utils import get_rank, unix_time_to_datetime
 
 
@@ -29,64 +31,100 @@ class PlayerSocialMedia:
         )
 
 
-class Player:
-    def __init__(self, data: dict) -> None:
-        """
-        Parameters
-        ----------
-        data: dict
-            The JSON data received from the Hypixel API.
-        """
-        self.hypixel_id = data["_id"]
-        self.uuid = data["uuid"]
-
-        self.name = data["displayname"]
-        self.known_aliases = data["knownAliases"]
-
-        self.first_login = unix_time_to_datetime(data["firstLogin"])
-        self.last_login = unix_time_to_datetime(data["lastLogin"])
-        self.last_logout = unix_time_to_datetime(data["lastLogout"])
-
-        self.one_time_achievements = data["achievementsOneTime"]
-        self.achievement_points = data["achievementPoints"]
-        self.achievements = data["achievements"]
-
-        self.experience = data["networkExp"]
-        self.level = self._calc_player_level(self.experience)
-
-        self.karma = data["karma"]
-        self.mc_version_rp = data.get("mcVersionRp")
-
-        self.challenges = data["challenges"]["all_time"]
-        self.most_recent_game = data["mostRecentGameType"]
-
-        self.total_rewards = data.get("totalRewards")
-        self.total_daily_rewards = data.get("totalDailyRewards")
-        self.reward_streak = data.get("rewardStreak")
-        self.reward_score = data.get("rewardScore")
-        self.reward_high_score = data.get("rewardHighScore")
+def _calc_player_level(xp: t.Union[float, int]) -> float:
+    return 1 + (-8750.0 + (8750**2 + 5000 * xp) ** 0.5) / 2500
+
+
+def _get_rank(data: dict) -> t.Optional[str]:
+    return get_rank(
+        data.get("rank"),
+        data.get("prefix"),
+        data.get("monthlyPackageRank"),
+        data.get("newPackageRank"),
+        data.get("packageRank"),
+    )
+
+
+# The fields of the players, parsed upfront by `Player` and on their first access by `LazyPlayer`
+FIELDS = {
+    "hypixel_id": LazyField("_id"),
+    "uuid": LazyField("uuid"),
+    "name": LazyField("displayname"),
+    "known_aliases": LazyField("knownAliases"),
+    "first_login": LazyField("firstLogin", unix_time_to_datetime),
+    "last_login": LazyField("lastLogin", unix_time_to_datetime),
+    "last_logout": LazyField("lastLogout", unix_time_to_datetime),
+    "one_time_achievements": LazyField("achievementsOneTime"),
+    "achievement_points": LazyField("achievementPoints"),
+    "achievements": LazyField("achievements"),
+    "experience": LazyField("networkExp"),
+    "level": LazyField("networkExp", _calc_player_level),
+    "karma": LazyField("karma"),
+    "mc_version_rp": LazyField("mcVersionRp", optional=True),
+    "challenges": LazyField(lambda data: data["challenges"]["all_time"]),
+    "most_recent_game": LazyField("mostRecentGameType"),
+    "total_rewards": LazyField("totalRewards", optional=True),
+    "total_daily_rewards": LazyField("totalDailyRewards", optional=True),
+    "reward_streak": LazyField("rewardStreak", optional=True),
+    "reward_score": LazyField("rewardScore", optional=True),
+    "reward_high_score": LazyField("rewardHighScore", optional=True),
+    "pet_stats": LazyField("petStats", optional=True),
+    "current_gadget": LazyField("currentGadget", optional=True),
+    "social_media": LazyField(lambda data: PlayerSocialMedia.from_json(data.get("socialMedia", {}).get("links"))),
+    "rank": LazyField(_get_rank),
+}
 
-        self.pet_stats = data.get("petStats")
-        self.current_gadget = data.get("currentGadget")
 
-        self.social_media = PlayerSocialMedia.from_json(
-            data.get("socialMedia", {}).get("links")
-        )
-
-        self.rank = self._get_rank(data)
-
-    @staticmethod
-    def _calc_player_level(xp: t.Union[float, int]) -> float:
-        return 1 + (-8750.0 + (8750**2 + 5000 * xp) ** 0.5) / 2500
-
-    @staticmethod
-    def _get_rank(data: dict) -> t.Optional[str]:
-        return get_rank(
-            data.get("rank"),
-            data.get("prefix"),
-            data.get("monthlyPackageRank"),
-            data.get("newPackageRank"),
-            data.get("packageRank"),
+class Player:
+    hypixel_id: str
+    uuid: str
+
+    name: str
+    known_aliases: t.List[str]
+
+    first_login: datetime
+    last_login: datetime
+    last_logout: datetime
+
+    one_time_achievements: t.List[str]
+    achievement_points: int
+    achievements: t.Dict[str, int]
+
+    experience: float
+    level: float
+
+    karma: int
+    mc_version_rp: t.Optional[str]
+
+    challenges: t.Dict[str, int]
+    most_recent_game: str
+
+    total_rewards: t.Optional[int]
+    total_daily_rewards: t.Optional[int]
+    reward_streak: t.Optional[int]
+    reward_score: t.Optional[int]
+    reward_high_score: t.Optional[int]
+
+    pet_stats: t.Optional[dict]
+    current_gadget: t.Optional[str]
+
+    social_media: t.Optional[PlayerSocialMedia]
+
+    rank: t.Optional[str]
+
+    # Assigns every field from the JSON data, generated from the fields to parse them the same way as `LazyPlayer`
+    if t.TYPE_CHECKING:
+        def __init__(self, data: dict) -> None:
+            ...
+    else:
+        __init__ = eager_init(
+            FIELDS,
+            """
+            Parameters
+            ----------
+            data: dict
+                The JSON data received from the Hypixel API.
+            """,
         )
 
     def __str__(self) -> str:
@@ -100,3 +138,17 @@ class Player:
 
     def __eq__(self, other: "Player") -> bool:
         return self.uuid == other.uuid
+
+
+@lazy_fields(FIELDS)
+class LazyPlayer(Player):
+    """Player parsing every field on its first access instead of upfront, keeping the JSON data until then."""
+
+    def __init__(self, data: dict) -> None:
+        """
+        Parameters
+        ----------
+        data: dict
+            The JSON data received from the Hypixel API.
+        """
+        self._data = data
@@ -4,6 +4,8 @@ from hypixelio.utils import unix_time_to_datetime
 
 
 class RecentGameInfo:
+    __slots__ = ("date", "end_datetime", "game_type", "mode", "map")
+
     def __init__(self, game: dict) -> None:
         """
         Parameters
@@ -1,5 +1,6 @@
 from .active_auctions import SkyblockActiveAuction
 from .bazaar import SkyblockBazaar
+from .ended_auctions import SkyblockEndedAuctions
 from .news import SkyblockNews
 from .profile import SkyblockProfile
 from .user_auction import SkyblockUserAuction
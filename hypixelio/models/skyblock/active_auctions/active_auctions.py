@@ -14,9 +14,37 @@ class SkyblockActiveAuction:
         self.page_number = data["page"]
         self.total_pages = data["totalPages"]
         self.total_auctions = data["totalAuctions"]
+        self.last_updated = data.get("lastUpdated")
 
         self.auctions = [SkyblockAuction(auction) for auction in data["auctions"]]
 
+    @classmethod
+    def from_pages(cls, pages: t.List[dict]) -> "SkyblockActiveAuction":
+        """
+        Combine all the pages of the auction house into a single model.
+
+        Parameters
+        ----------
+        pages: t.List[dict]
+            The data of every page from the Hypixel API endpoint, from the same snapshot.
+
+        Returns
+        -------
+        SkyblockActiveAuction
+            The model containing the auctions of all the pages.
+        """
+        first = pages[0]
+
+        return cls(
+            {
+                "page": first["page"],
+                "totalPages": first["totalPages"],
+                "totalAuctions": first["totalAuctions"],
+                "lastUpdated": first.get("lastUpdated"),
+                "auctions": [auction for page in pages for auction in page["auctions"]],
+            }
+        )
+
     def __len__(self) -> int:
         return len(self.auctions)
 
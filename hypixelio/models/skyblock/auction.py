@@ -1,4 +1,21 @@
 class SkyblockAuction:
+    __slots__ = (
+        "id",
+        "uuid",
+        "auctioneer",
+        "item_name",
+        "item_lore",
+        "category",
+        "tier",
+        "starting_big",
+        "bin",
+        "start",
+        "end",
+        "claimed_bidders",
+        "bids",
+        "highest_bid",
+    )
+
     def __init__(self, auction_data: dict) -> None:
         """
         Parameters
@@ -17,6 +34,10 @@ class SkyblockAuction:
         self.category = auction_data["category"]
         self.tier = auction_data["tier"]
         self.starting_big = auction_data["starting_bid"]
+        self.bin = auction_data.get("bin", False)
+
+        self.start = auction_data.get("start")
+        self.end = auction_data.get("end")
 
         self.claimed_bidders = auction_data.get("claimed_bidders")
         self.bids = auction_data.get("bids")
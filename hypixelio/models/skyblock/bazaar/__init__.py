@@ -1 +1,3 @@
-from .skyblock_bazaar import SkyblockBazaar
+from .bazaar_item import SkyblockBazaarItem
+from .order_book import BazaarOrderBook
+from .skyblock_bazaar import BazaarProducts, SkyblockBazaar
@@ -1,10 +1,40 @@
+import typing as t
+
+from .order_book import BazaarOrderBook
+
+
 class SkyblockBazaarItem:
-    def __init__(self, data: dict) -> None:
+    __slots__ = (
+        "product_id",
+        "sell_price",
+        "sell_volume",
+        "sell_moving_week",
+        "sell_orders",
+        "buy_price",
+        "buy_volume",
+        "buy_moving_week",
+        "buy_orders",
+        "_buy_summary",
+        "_sell_summary",
+        "_buy_book",
+        "_sell_book",
+    )
+
+    def __init__(
+        self,
+        data: dict,
+        buy_summary: t.Optional[t.List[dict]] = None,
+        sell_summary: t.Optional[t.List[dict]] = None,
+    ) -> None:
         """
         Parameters
         ----------
         data: dict
             The product data from the Hypixel bazaar API endpoint.
+        buy_summary: t.Optional[t.List[dict]]
+            The sell offers of the product from the endpoint, parsed into `buy_book` once accessed.
+        sell_summary: t.Optional[t.List[dict]]
+            The buy orders of the product from the endpoint, parsed into `sell_book` once accessed.
         """
         self.product_id = data["productId"]
 
@@ -18,6 +48,28 @@ class SkyblockBazaarItem:
         self.buy_moving_week = data["buyMovingWeek"]
         self.buy_orders = data["buyOrders"]
 
+        # The order book, parsed lazily since most of the products aren't looked at
+        self._buy_summary = buy_summary
+        self._sell_summary = sell_summary
+        self._buy_book: t.Optional[BazaarOrderBook] = None
+        self._sell_book: t.Optional[BazaarOrderBook] = None
+
+    @property
+    def buy_book(self) -> t.Optional[BazaarOrderBook]:
+        """The sell offers, which are filled when instantly buying, from the cheapest."""
+        if self._buy_book is None and self._buy_summary is not None:
+            self._buy_book, self._buy_summary = BazaarOrderBook(self._buy_summary), None
+
+        return self._buy_book
+
+    @property
+    def sell_book(self) -> t.Optional[BazaarOrderBook]:
+        """The buy orders, which are filled when instantly selling, from the most expensive."""
+        if self._sell_book is None and self._sell_summary is not None:
+            self._sell_book, self._sell_summary = BazaarOrderBook(self._sell_summary), None
+
+        return self._sell_book
+
     def __str__(self) -> str:
         return self.product_id
 
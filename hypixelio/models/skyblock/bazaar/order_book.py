@@ -0,0 +1,116 @@
+import typing as t
+from array import array
+from bisect import bisect_left
+
+
+class BazaarOrderBook:
+    def __init__(self, summary: t.List[dict]) -> None:
+        """
+        One side of the order book of a bazaar product, with the price levels from the best price.
+
+        Parameters
+        ----------
+        summary: t.List[dict]
+            The `buy_summary` or `sell_summary` of the product from the Hypixel bazaar API endpoint.
+        """
+        self.prices = array("d", [level["pricePerUnit"] for level in summary])
+        self.amounts = array("q", [level["amount"] for level in summary])
+        self.orders = array("I", [level["orders"] for level in summary])
+
+        # The running totals of the amounts and costs, to look up the fills by bisecting
+        self._cumulative_amounts = array("q")
+        self._cumulative_costs = array("d")
+
+        amount, cost = 0, 0.0
+        for price, level_amount in zip(self.prices, self.amounts):
+            amount += level_amount
+            cost += price * level_amount
+
+            self._cumulative_amounts.append(amount)
+            self._cumulative_costs.append(cost)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} levels={len(self)} best_price={self.best_price}>"
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __getitem__(self, level: int) -> t.Tuple[float, int, int]:
+        return self.prices[level], self.amounts[level], self.orders[level]
+
+    def __iter__(self) -> t.Iterator[t.Tuple[float, int, int]]:
+        return zip(self.prices, self.amounts, self.orders)
+
+    @property
+    def best_price(self) -> t.Optional[float]:
+        return self.prices[0] if self.prices else None
+
+    @property
+    def total_amount(self) -> int:
+        return self._cumulative_amounts[-1] if self._cumulative_amounts else 0
+
+    def _fill_level(self, units: int) -> t.Optional[int]:
+        if units <= 0:
+            raise ValueError("The units to fill should be positive")
+
+        level = bisect_left(self._cumulative_amounts, units)
+        return level if level < len(self) else None
+
+    def depth(self, units: int) -> t.Optional[float]:
+        """
+        Get the worst price reached when filling an amount of units against this side of the order book.
+
+        Parameters
+        ----------
+        units: int
+            The amount of units to fill.
+
+        Returns
+        -------
+        t.Optional[float]
+            The price of the last level needed, or None if the listed orders can't fill the units.
+        """
+        level = self._fill_level(units)
+        return self.prices[level] if level is not None else None
+
+    def fill_cost(self, units: int) -> t.Optional[float]:
+        """
+        Get the total cost of filling an amount of units against this side of the order book.
+
+        Parameters
+        ----------
+        units: int
+            The amount of units to fill.
+
+        Returns
+        -------
+        t.Optional[float]
+            The total cost, or None if the listed orders can't fill the units.
+        """
+        level = self._fill_level(units)
+        if level is None:
+            return None
+
+        if level == 0:
+            return units * self.prices[0]
+
+        # The levels before are filled completely, and the rest of the units from the last level
+        filled = self._cumulative_amounts[level - 1]
+        return self._cumulative_costs[level - 1] + (units - filled) * self.prices[level]
+
+    def average_price(self, units: int) -> t.Optional[float]:
+        """
+        Get the weighted average price per unit when filling an amount of units against this side of the order book.
+
+        Parameters
+        ----------
+        units: int
+            The amount of units to fill.
+
+        Returns
+        -------
+        t.Optional[float]
+            The average price, or None if the listed orders can't fill the units.
+        """
+        cost = self.fill_cost(units)
+        return cost / units if cost is not None else None
@@ -1,6 +1,46 @@
+import typing as t
+
 from .bazaar_item import SkyblockBazaarItem
 
 
+class BazaarProducts(t.Mapping[str, SkyblockBazaarItem]):
+    def __init__(self, data: dict) -> None:
+        """
+        Mapping of the product IDs to the bazaar products, which are only parsed once accessed.
+
+        Parameters
+        ----------
+        data: dict
+            The products from the Hypixel bazaar API endpoint.
+        """
+        self._data = data
+        self._items: t.Dict[str, SkyblockBazaarItem] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} products={len(self)} parsed={len(self._items)}>"
+
+    def __getitem__(self, product_id: str) -> SkyblockBazaarItem:
+        item = self._items.get(product_id)
+
+        if item is None:
+            product = self._data[product_id]
+            item = self._items[product_id] = SkyblockBazaarItem(
+                product["quick_status"], product.get("buy_summary"), product.get("sell_summary")
+            )
+
+        return item
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def quick_statuses(self) -> t.Iterator[dict]:
+        """Iterate the raw quick status of every product, without parsing the products."""
+        return (product["quick_status"] for product in self._data.values())
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._data)
+
+
 class SkyblockBazaar:
     def __init__(self, data: dict) -> None:
         """
@@ -10,8 +50,4 @@ class SkyblockBazaar:
             The data from the Hypixel API endpoint.
         """
         self.last_updated = data["lastUpdated"]
-        self.products = {}
-
-        for key, value in data["products"].items():
-            bazaar_item_object = SkyblockBazaarItem(value["quick_status"])
-            self.products[key] = bazaar_item_object
+        self.products = BazaarProducts(data["products"])
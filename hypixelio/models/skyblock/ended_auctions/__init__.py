@@ -0,0 +1 @@
+from .ended_auctions import SkyblockEndedAuction, SkyblockEndedAuctions
@@ -0,0 +1,58 @@
+import typing as t
+
+
+class SkyblockEndedAuction:
+    __slots__ = ("auction_id", "seller", "seller_profile", "buyer", "timestamp", "price", "bin", "item_bytes")
+
+    def __init__(self, auction_data: dict) -> None:
+        """
+        Parameters
+        ----------
+        auction_data: dict
+            The ended auction JSON model to be parsed.
+        """
+        self.auction_id = auction_data["auction_id"]
+
+        self.seller = auction_data["seller"]
+        self.seller_profile = auction_data["seller_profile"]
+        self.buyer = auction_data["buyer"]
+
+        self.timestamp = auction_data["timestamp"]
+        self.price = auction_data["price"]
+        self.bin = auction_data.get("bin", False)
+
+        self.item_bytes = auction_data.get("item_bytes")
+
+    def __str__(self) -> str:
+        return self.auction_id
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} auction_id="{self.auction_id}" price={self.price}>'
+
+    def __hash__(self) -> int:
+        return hash(self.auction_id)
+
+    def __eq__(self, other: "SkyblockEndedAuction") -> bool:
+        return self.auction_id == other.auction_id
+
+
+class SkyblockEndedAuctions:
+    def __init__(self, data: dict) -> None:
+        """
+        Parameters
+        ----------
+        data: dict
+            The data from the Hypixel API endpoint.
+        """
+        self.last_updated = data["lastUpdated"]
+
+        self.auctions = [SkyblockEndedAuction(auction) for auction in data["auctions"]]
+
+    def __len__(self) -> int:
+        return len(self.auctions)
+
+    def __getitem__(self, key: int) -> SkyblockEndedAuction:
+        return self.auctions[key]
+
+    def __iter__(self) -> t.Iterator:
+        return iter(self.auctions)
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 
 @dataclass
 class NewsItem:
+    __slots__ = ("title", "text", "link", "item")
+
     title: str
     text: str
     link: str
@@ -0,0 +1,106 @@
+"""Ratelimit accounting for the Hypixel API keys."""
+__all__ = ("KeyRatelimit", "get_retry_after")
+
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Union
+
+# The timestamp used when no ratelimit information is known yet.
+NEVER = datetime(1998, 1, 1)
+
+
+class KeyRatelimit:
+    """
+    The ratelimit state of a single Hypixel API key, as reported by the ratelimit headers of its responses.
+
+    Every key has its own budget of requests, so the state is tracked separately for each of them. The budget
+    works as a token bucket, holding `RateLimit-Limit` tokens which are refilled once the window resets after
+    `RateLimit-Reset` seconds.
+    """
+
+    def __init__(self, key: str) -> None:
+        """
+        Parameters
+        ----------
+        key: str
+            The Hypixel API key whose ratelimit is tracked.
+        """
+        self.key = key
+
+        self.requests_remaining = -1
+        self.total_requests = 0
+        self.reset = NEVER
+        self.retry_after = NEVER
+
+        # The length of the ratelimit window in seconds, as seen from the headers.
+        self.window = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__qualname__} requests_remaining={self.requests_remaining} total_requests="
+            f"{self.total_requests} reset={self.reset} retry_after={self.retry_after}>"
+        )
+
+    def update(self, resp_headers: Dict[str, Any]) -> None:
+        """Update the state using the ratelimit headers of a response sent using this key."""
+        self.total_requests = int(resp_headers["RateLimit-Limit"])
+        self.requests_remaining = int(resp_headers["RateLimit-Remaining"])
+
+        reset = int(resp_headers["RateLimit-Reset"])
+        self.reset = datetime.now() + timedelta(seconds=reset)
+        self.window = max(self.window, reset)
+
+    def hit(self, retry_after: int) -> None:
+        """Mark the key as ratelimited for `retry_after` seconds, after a 429 response."""
+        self.requests_remaining = 0
+        self.retry_after = datetime.now() + timedelta(seconds=retry_after)
+
+        # The budget is refilled once the key can be used again.
+        self.reset = self.retry_after
+
+    def reserve(self) -> None:
+        """Spend a request from the known budget before sending it."""
+        now = datetime.now()
+
+        if self.reset <= now and self.total_requests:
+            # The window has been reset, so the budget has been refilled until the next one is reported.
+            self.requests_remaining = self.total_requests
+            self.reset = now + timedelta(seconds=self.window)
+
+        if self.requests_remaining > 0:
+            self.requests_remaining -= 1
+
+    def budget(self) -> Union[int, float]:
+        """The amount of requests that can be sent using this key right now."""
+        now = datetime.now()
+
+        if self.retry_after > now:
+            return 0
+
+        if self.requests_remaining == -1:
+            # Nothing is known about the key yet, so prefer it to spread the load.
+            return math.inf
+
+        if self.reset <= now:
+            return self.total_requests or math.inf
+
+        return self.requests_remaining
+
+    @property
+    def available_at(self) -> datetime:
+        """When the key can be used again, which is in the past if the key is usable right now."""
+        if self.budget() > 0:
+            return NEVER
+
+        return max(self.retry_after, self.reset)
+
+
+def get_retry_after(resp_headers: Dict[str, Any]) -> Optional[int]:
+    """Get the seconds to wait before retrying from the response headers, if specified."""
+    for header in ("Retry-After", "RateLimit-Reset"):
+        try:
+            return int(resp_headers[header])
+        except (KeyError, ValueError):
+            continue
+
+    return None
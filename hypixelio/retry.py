@@ -0,0 +1,129 @@
+"""Retrying of the failed requests to the Hypixel API."""
+__all__ = ("RetryPolicy",)
+
+import random
+from typing import Dict, FrozenSet, Optional, Union
+
+# The retries allowed for every status code, by default.
+RETRY_STATUSES = {429: 3, 500: 2, 502: 3, 503: 3, 504: 3}
+
+# Methods which are safe to send again, since they don't change anything on the server.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RetryPolicy:
+    """
+    The policy used to decide if and when a failed request is retried.
+
+    Failed requests are retried using exponential backoff with full jitter, waiting for `Retry-After` when the
+    API specifies it. Only idempotent methods are retried, which includes all the Hypixel API endpoints.
+
+    Examples
+    --------
+    Retry 5xx errors and timeouts, but never the ratelimits.
+
+        >>> policy = RetryPolicy(statuses={500: 2, 502: 3, 503: 3, 504: 3})
+        >>> client = hypixelio.Client(api_key="123-456-789", retry_policy=policy)
+
+    Disable retrying completely.
+
+        >>> client = hypixelio.Client(api_key="123-456-789", retry_policy=RetryPolicy(max_attempts=1))
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        statuses: Optional[Dict[int, int]] = None,
+        retry_on_timeout: bool = True,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        methods: FrozenSet[str] = IDEMPOTENT_METHODS,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_attempts: int
+            The maximum attempts for a request, including the first one. Defaults to 4.
+        statuses: Optional[Dict[int, int]]
+            The retries allowed for every status code. Defaults to 429, 500, 502, 503 and 504.
+        retry_on_timeout: bool
+            If timeouts and connection errors should be retried. Defaults to True.
+        backoff_factor: float
+            The base delay in seconds, doubled for every attempt. Defaults to 0.5.
+        max_backoff: float
+            The maximum delay in seconds between the attempts. Defaults to 30.
+        jitter: bool
+            Randomize the delays, so that the clients don't retry together. Defaults to True.
+        respect_retry_after: bool
+            Wait for the `Retry-After` header when present, giving up if it is longer than `max_backoff`.
+            Defaults to True.
+        methods: FrozenSet[str]
+            The HTTP methods which are safe to retry. Defaults to the idempotent methods.
+        """
+        self.max_attempts = max_attempts
+        self.statuses = RETRY_STATUSES if statuses is None else statuses
+        self.retry_on_timeout = retry_on_timeout
+
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__qualname__} max_attempts={self.max_attempts} statuses={self.statuses} "
+            f"retry_on_timeout={self.retry_on_timeout}>"
+        )
+
+    def should_retry(self, attempt: int, status: Optional[int] = None, method: str = "GET") -> bool:
+        """
+        Check if a request should be attempted again.
+
+        Parameters
+        ----------
+        attempt: int
+            The attempts made so far, including the failed one.
+        status: Optional[int]
+            The status code of the failed response, or None if it timed out or the connection failed.
+        method: str
+            The HTTP method of the request. Defaults to GET.
+
+        Returns
+        -------
+        bool
+            If the request should be retried.
+        """
+        if method.upper() not in self.methods or attempt >= self.max_attempts:
+            return False
+
+        if status is None:
+            return self.retry_on_timeout
+
+        return attempt <= self.statuses.get(status, 0)
+
+    def backoff(self, attempt: int, retry_after: Optional[Union[int, float]] = None) -> Optional[float]:
+        """
+        Get the seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt: int
+            The attempts made so far, including the failed one.
+        retry_after: Optional[Union[int, float]]
+            The seconds from the `Retry-After` header of the failed response, if any.
+
+        Returns
+        -------
+        Optional[float]
+            The delay in seconds, or None if the `Retry-After` is too long to wait for.
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return float(retry_after) if retry_after <= self.max_backoff else None
+
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+
+        return random.uniform(0, delay) if self.jitter else delay
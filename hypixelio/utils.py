@@ -18,6 +18,20 @@ def form_url(main_url: str, url: str, data: Optional[Dict[str, Any]] = None) ->
     return url
 
 
+# Minecraft formatting codes, and the stars added to the names of the upgraded skyblock items
+FORMATTING_CODE = re.compile(r"§.")
+ITEM_STARS = re.compile(r"[✪➊➋➌➍➎]")
+
+
+def strip_formatting(text: str) -> str:
+    return FORMATTING_CODE.sub("", text)
+
+
+# Normalize item names, so that the same items with different formatting or stars match
+def normalize_item_name(item_name: str) -> str:
+    return " ".join(ITEM_STARS.sub("", strip_formatting(item_name)).split()).lower()
+
+
 # Convert unix time to datetime
 def unix_time_to_datetime(unix_time: int) -> datetime:
     return datetime.fromtimestamp(float(unix_time) / 1000)
@@ -62,7 +76,7 @@ def get_rank(
     real_rank = None
 
     if prefix_raw:
-        prefix = re.sub(r"§.", "", prefix_raw)[1:-1]
+        prefix = strip_formatting(prefix_raw)[1:-1]
         real_rank = RANKS.get(prefix, prefix)
     elif rank and rank != "NORMAL" and not real_rank:
         real_rank = RANKS.get(rank, rank)
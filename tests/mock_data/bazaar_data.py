@@ -0,0 +1,29 @@
+BAZAAR_MOCK = {
+    "success": True,
+    "lastUpdated": 1639000000000,
+    "products": {
+        "ENCHANTED_DIAMOND": {
+            "product_id": "ENCHANTED_DIAMOND",
+            "sell_summary": [
+                {"amount": 100, "pricePerUnit": 1200.0, "orders": 2},
+                {"amount": 300, "pricePerUnit": 1190.5, "orders": 4},
+            ],
+            "buy_summary": [
+                {"amount": 50, "pricePerUnit": 1250.0, "orders": 1},
+                {"amount": 150, "pricePerUnit": 1260.0, "orders": 3},
+                {"amount": 800, "pricePerUnit": 1300.0, "orders": 9},
+            ],
+            "quick_status": {
+                "productId": "ENCHANTED_DIAMOND",
+                "sellPrice": 1200.0,
+                "sellVolume": 400,
+                "sellMovingWeek": 1000000,
+                "sellOrders": 6,
+                "buyPrice": 1250.0,
+                "buyVolume": 1000,
+                "buyMovingWeek": 900000,
+                "buyOrders": 13,
+            },
+        },
+    },
+}
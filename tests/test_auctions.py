@@ -0,0 +1,176 @@
+import contextlib
+import unittest
+from unittest import mock
+
+from hypixelio import AuctionSearchIndex, AuctionTable, AuctionTracker, PriceIndex
+from hypixelio import auctions
+from hypixelio.models.skyblock.auction import SkyblockAuction
+from hypixelio.models.skyblock.ended_auctions import SkyblockEndedAuction
+
+
+def make_auction_data(uuid: str, highest_bid: int = 0, **fields) -> dict:
+    return {
+        "_id": uuid,
+        "uuid": uuid,
+        "auctioneer": "5e22209be5864a088761aa6bde56a090",
+        "item_name": "Aspect of the End",
+        "item_lore": "",
+        "category": "weapon",
+        "tier": "RARE",
+        "starting_bid": 100,
+        "highest_bid_amount": highest_bid,
+        **fields,
+    }
+
+
+def make_auction(uuid: str, highest_bid: int = 0) -> SkyblockAuction:
+    return SkyblockAuction(make_auction_data(uuid, highest_bid))
+
+
+def make_ended_auction(uuid: str, price: int) -> SkyblockEndedAuction:
+    return SkyblockEndedAuction(
+        {
+            "auction_id": uuid,
+            "seller": "seller",
+            "seller_profile": "profile",
+            "buyer": "buyer",
+            "timestamp": 0,
+            "price": price,
+            "bin": True,
+        }
+    )
+
+
+class TestAuctionTracker(unittest.TestCase):
+    """Tests for the diffing of the auction house snapshots."""
+
+    def test_snapshot_diff(self) -> None:
+        tracker = AuctionTracker()
+
+        diff = tracker.update([make_auction("a"), make_auction("b"), make_auction("c")])
+        self.assertEqual(len(diff.added), 3)
+
+        diff = tracker.update([make_auction("a"), make_auction("b", 150), make_auction("d")])
+        self.assertEqual([auction.uuid for auction in diff.added], ["d"])
+        self.assertEqual([auction.uuid for auction in diff.updated], ["b"])
+        self.assertEqual(diff.ended, ["c"])
+
+    def test_ended_feed(self) -> None:
+        tracker = AuctionTracker()
+        tracker.update([make_auction("a"), make_auction("b")])
+
+        sold = make_ended_auction("a", 500)
+        diff = tracker.apply_ended([sold])
+
+        self.assertEqual(diff.ended, ["a"])
+        self.assertEqual(diff.sold, [sold])
+        self.assertNotIn("a", tracker)
+        self.assertEqual(len(tracker.apply_ended([sold])), 0)
+
+    def test_sold_in_snapshot(self) -> None:
+        tracker, prices, search = AuctionTracker(), PriceIndex(), AuctionSearchIndex()
+
+        def crawl(auctions, ended=None) -> None:
+            diff = tracker.update(auctions, ended)
+            prices.apply(diff)
+            search.apply(diff)
+
+        crawl([SkyblockAuction(make_auction_data("a", starting_bid=50, bin=True))])
+
+        # The auctions were bought after they were crawled, but before the ended auctions feed was fetched
+        cheap = SkyblockAuction(make_auction_data("b", starting_bid=10, bin=True, item_lore="Cheap"))
+        crawl([make_auction("a", 60), cheap], [make_ended_auction("a", 60), make_ended_auction("b", 10)])
+        crawl([])
+
+        self.assertEqual(len(tracker), 0)
+        self.assertIsNone(prices.lowest("Aspect of the End"))
+        self.assertEqual(search.search("cheap"), set())
+
+
+class TestAuctionTable(unittest.TestCase):
+    """Tests for the columnar storage of the auction house snapshots."""
+
+    def setUp(self) -> None:
+        self.table = AuctionTable.from_pages(
+            [
+                {
+                    "auctions": [
+                        make_auction_data("a" * 32, tier="LEGENDARY", bin=True, starting_bid=500),
+                        make_auction_data("b" * 32, 300, tier="LEGENDARY"),
+                        make_auction_data("c" * 32, tier="LEGENDARY", bin=True, starting_bid=200),
+                    ]
+                },
+                {"auctions": [make_auction_data("d" * 32, bin=True)]},
+            ]
+        )
+
+    def test_views(self) -> None:
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(self.table[1].uuid, "b" * 32)
+        self.assertEqual(self.table[1].highest_bid, 300)
+        self.assertEqual(self.table[-1].tier, "RARE")
+
+    def test_filter_and_sort(self) -> None:
+        table = self.table.filter(tier="LEGENDARY", bin=True).sort("price")
+
+        self.assertEqual([auction.uuid for auction in table], ["c" * 32, "a" * 32])
+        self.assertEqual(len(self.table.filter(tier="MYTHIC")), 0)
+        self.assertEqual(list(self.table.prices), [500, 300, 200, 100])
+
+    def test_rows(self) -> None:
+        # With the NumPy masks, and with the loops used without NumPy
+        for patch in (contextlib.nullcontext(), mock.patch.object(auctions, "_import_numpy", return_value=None)):
+            with self.subTest(numpy=isinstance(patch, contextlib.nullcontext)), patch:
+                self.assertEqual(list(self.table.rows()), [0, 1, 2, 3])
+                self.assertEqual(self.table.rows(bin=False), [1])
+                self.assertEqual(self.table.rows(min_price=200, max_price=300), [1, 2])
+                self.assertEqual(self.table.rows(tier="LEGENDARY", max_price=300), [1, 2])
+                self.assertEqual(self.table.rows(tier="LEGENDARY", bin=True, min_price=300), [0])
+                self.assertEqual(self.table.rows(item_name="Unknown"), [])
+                self.assertEqual(self.table.rows(ending_before=1, category="weapon"), [0, 1, 2, 3])
+
+
+class TestPriceIndex(unittest.TestCase):
+    """Tests for the index of the auction prices."""
+
+    def test_queries(self) -> None:
+        auctions = (
+            (300, "RARE", "§6Heroic Hyperion ✪✪"),
+            (100, "EPIC", "Heroic Hyperion"),
+            (200, "RARE", "heroic hyperion"),
+            (50, "RARE", "Dirt"),
+        )
+        index = PriceIndex.from_auctions(
+            SkyblockAuction(make_auction_data(str(price), starting_bid=price, bin=True, tier=tier, item_name=name))
+            for price, tier, name in auctions
+        )
+
+        self.assertEqual(index.lowest("Heroic Hyperion"), 100)
+        self.assertEqual(index.lowest("Heroic Hyperion", tier="RARE"), 200)
+        self.assertEqual([price for price, _ in index.cheapest("heroic hyperion", 2)], [100, 200])
+        self.assertEqual(index.percentile("Heroic Hyperion", 50), 200)
+
+        index.remove("100")
+        self.assertEqual(index.lowest("Heroic Hyperion"), 200)
+        self.assertIsNone(index.lowest("Heroic Hyperion", tier="EPIC"))
+
+
+class TestAuctionSearchIndex(unittest.TestCase):
+    """Tests for the search index of the auction item names and lores."""
+
+    def test_search(self) -> None:
+        index = AuctionSearchIndex.from_auctions(
+            [
+                make_auction("a"),
+                SkyblockAuction(make_auction_data("b", item_lore="§9Ultimate Wise V", tier="LEGENDARY")),
+                SkyblockAuction(make_auction_data("c", item_lore="§9Ultimate Legion I\n§7Sharpness V")),
+            ]
+        )
+
+        self.assertEqual(index.search("ultimate"), {"b", "c"})
+        self.assertEqual(index.search("Ultimate Wise"), {"b"})
+        self.assertEqual(index.search("wise legion", match_all=False), {"b", "c"})
+        self.assertEqual(index.search("aspect ultimate", tier="LEGENDARY"), {"b"})
+
+        index.remove("b")
+        self.assertEqual(index.search("wise"), set())
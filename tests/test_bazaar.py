@@ -0,0 +1,131 @@
+import copy
+import os
+import tempfile
+import time
+import unittest
+
+from hypixelio import BazaarArrays, BazaarRecorder
+from hypixelio.models.skyblock import SkyblockBazaar
+from tests.mock_data.bazaar_data import BAZAAR_MOCK
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestBazaar(unittest.TestCase):
+    """Tests for the bazaar models and the order books."""
+
+    def setUp(self) -> None:
+        self.bazaar = SkyblockBazaar(BAZAAR_MOCK)
+
+    def test_lazy_products(self) -> None:
+        self.assertEqual(len(self.bazaar.products), 1)
+        self.assertIn("ENCHANTED_DIAMOND", self.bazaar.products)
+
+        item = self.bazaar.products["ENCHANTED_DIAMOND"]
+        self.assertIs(item, self.bazaar.products["ENCHANTED_DIAMOND"])
+        self.assertEqual(item.buy_price, 1250.0)
+
+    def test_order_book(self) -> None:
+        item = self.bazaar.products["ENCHANTED_DIAMOND"]
+
+        self.assertEqual(item.buy_book.best_price, 1250.0)
+        self.assertEqual(item.buy_book.total_amount, 1000)
+        self.assertEqual(item.buy_book.depth(200), 1260.0)
+        self.assertEqual(item.buy_book.fill_cost(250), 50 * 1250.0 + 150 * 1260.0 + 50 * 1300.0)
+        self.assertIsNone(item.buy_book.average_price(1001))
+
+        self.assertEqual(item.sell_book[1], (1190.5, 300, 4))
+        self.assertEqual(item.sell_book.average_price(100), 1200.0)
+
+
+def make_bazaar(last_updated: int, buy_price: float) -> SkyblockBazaar:
+    data = copy.deepcopy(BAZAAR_MOCK)
+    data["lastUpdated"] = last_updated
+    data["products"]["ENCHANTED_DIAMOND"]["quick_status"]["buyPrice"] = buy_price
+
+    return SkyblockBazaar(data)
+
+
+class TestBazaarRecorder(unittest.TestCase):
+    """Tests for the recording of the bazaar history."""
+
+    def setUp(self) -> None:
+        self.recorder = BazaarRecorder(capacity=3, interval=60)
+
+        for minute, price in enumerate((100, 110, 120, 130)):
+            self.recorder.record(make_bazaar(minute * 60000, price))
+
+    def test_ring_buffer(self) -> None:
+        self.assertFalse(self.recorder.record(make_bazaar(180000, 500)))
+        self.assertFalse(self.recorder.record(make_bazaar(200000, 500)))
+
+        self.assertEqual(len(self.recorder), 3)
+        self.assertEqual(
+            self.recorder.history("ENCHANTED_DIAMOND"), [(60000, 110.0), (120000, 120.0), (180000, 130.0)]
+        )
+        self.assertEqual(self.recorder.average("ENCHANTED_DIAMOND", window=60), 125.0)
+        self.assertEqual(self.recorder.delta("ENCHANTED_DIAMOND"), 20.0)
+        self.assertEqual(self.recorder.maximum("ENCHANTED_DIAMOND", "sell_volume"), 400.0)
+
+    def test_products_not_parsed(self) -> None:
+        bazaar = make_bazaar(240000, 140)
+
+        self.assertTrue(self.recorder.record(bazaar))
+        self.assertEqual(bazaar.products._items, {})
+        self.assertEqual(self.recorder.history("ENCHANTED_DIAMOND")[-1], (240000, 140.0))
+
+    def test_next_poll_waits_for_interval(self) -> None:
+        recorder = BazaarRecorder(interval=300)
+        now = int(time.time() * 1000)
+
+        self.assertTrue(recorder.record(make_bazaar(now - 10000, 100)))
+        self.assertFalse(recorder.record(make_bazaar(now, 100)))
+
+        # Updated every 10 seconds, but the next one worth recording is 290 seconds away
+        self.assertAlmostEqual(recorder.next_poll_in(), 291, delta=2)
+
+    def test_persistence(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bazaar.bin")
+
+            self.recorder.save(path)
+            recorder = BazaarRecorder.load(path)
+
+        self.assertEqual(recorder.history("ENCHANTED_DIAMOND"), self.recorder.history("ENCHANTED_DIAMOND"))
+        self.assertTrue(recorder.record(make_bazaar(240000, 140)))
+        self.assertEqual(recorder.minimum("ENCHANTED_DIAMOND"), 120.0)
+
+
+@unittest.skipIf(np is None, "NumPy isn't installed")
+class TestBazaarArrays(unittest.TestCase):
+    """Tests for the vectorized bazaar analytics."""
+
+    def setUp(self) -> None:
+        data = copy.deepcopy(BAZAAR_MOCK)
+        product = data["products"]["ENCHANTED_DIAMOND"]
+
+        for product_id, buy_price, sell_price in (("ENCHANTED_GOLD", 10.0, 9.0), ("WHEAT", 5.0, 1.0)):
+            data["products"][product_id] = {
+                **product,
+                "quick_status": {
+                    **product["quick_status"], "productId": product_id, "buyPrice": buy_price, "sellPrice": sell_price
+                },
+            }
+
+        self.arrays = BazaarArrays(SkyblockBazaar(data))
+
+    def test_ranking(self) -> None:
+        self.assertEqual(list(self.arrays.product_ids), ["ENCHANTED_DIAMOND", "ENCHANTED_GOLD", "WHEAT"])
+        self.assertEqual(self.arrays.top(2), [("ENCHANTED_DIAMOND", 50.0), ("WHEAT", 4.0)])
+        self.assertEqual(self.arrays.top(1, by="buy_price", ascending=True), [("WHEAT", 5.0)])
+        self.assertAlmostEqual(self.arrays.margin(tax=0.1)[1], 0.0)
+
+    def test_change(self) -> None:
+        previous = BazaarArrays(make_bazaar(0, 1000.0))
+        change = self.arrays.change(previous)
+
+        self.assertAlmostEqual(change[0], 0.25)
+        self.assertTrue(np.isnan(change[1:]).all())
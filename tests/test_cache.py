@@ -0,0 +1,129 @@
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from hypixelio import ResponseCache, SQLiteCache
+from hypixelio.cache import CacheEntry, UUIDCache
+from hypixelio.exceptions import PlayerNotFoundError
+
+
+def make_entry(size: int, ttl: float = 60) -> CacheEntry:
+    now = time.time()
+    return CacheEntry({"success": True}, size, now, now + ttl)
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the in-memory LRU response cache."""
+
+    def test_key_ignores_param_order(self) -> None:
+        self.assertEqual(
+            ResponseCache.make_key("/guild", {"name": "a", "id": "b"}),
+            ResponseCache.make_key("/guild", {"id": "b", "name": "a"}),
+        )
+
+    def test_lru_eviction(self) -> None:
+        cache = ResponseCache(max_entries=2)
+
+        cache.set("first", make_entry(10))
+        cache.set("second", make_entry(10))
+        cache.get("first")
+        cache.set("third", make_entry(10))
+
+        self.assertIn("first", cache)
+        self.assertNotIn("second", cache)
+
+    def test_byte_eviction(self) -> None:
+        cache = ResponseCache(max_bytes=100)
+
+        cache.set("first", make_entry(60))
+        cache.set("second", make_entry(60))
+        cache.set("huge", make_entry(200))
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.total_bytes, 60)
+
+    def test_expiry(self) -> None:
+        cache = ResponseCache()
+        cache.set("expired", make_entry(10, ttl=-1))
+
+        self.assertIsNone(cache.get("expired"))
+
+
+class TestSQLiteCache(unittest.TestCase):
+    """Tests for the persistent SQLite response cache."""
+
+    def test_persistence(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "cache.sqlite3")
+            entry = make_entry(4, ttl=-1)
+            entry.body, entry.etag = b'{"success": true}', '"abc"'
+
+            cache = SQLiteCache(path)
+            cache.set("/resources/quests", entry)
+            cache.set("/player?uuid=abc", entry)
+            cache.close()
+
+            cache = SQLiteCache(path)
+            self.assertIsNone(cache.get("/resources/quests"))
+            self.assertIsNone(cache.get("/player?uuid=abc", allow_stale=True))
+
+            stale = cache.get("/resources/quests", allow_stale=True)
+            self.assertEqual(stale.data, {"success": True})
+            self.assertEqual(stale.revalidation_headers, {"If-None-Match": '"abc"'})
+            cache.close()
+
+    def test_locked_database(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "cache.sqlite3")
+            entry = make_entry(4)
+            entry.body = b'{"success": true}'
+
+            cache = SQLiteCache(path, timeout=0.1)
+
+            # Another worker holding the write lock
+            other = sqlite3.connect(path)
+            other.execute("BEGIN EXCLUSIVE")
+
+            cache.set("/resources/quests", entry)
+            self.assertIsNone(cache.get("/resources/quests"))
+
+            # Removing the entries fails quietly too, and the routes which aren't cached don't use the database
+            cache.delete("/resources/quests")
+            cache.delete("/skyblock/auctions?page=0")
+            cache.clear()
+
+            other.rollback()
+            other.close()
+
+            cache.set("/resources/quests", entry)
+            self.assertEqual(cache.get("/resources/quests").data, {"success": True})
+            cache.close()
+
+
+class TestUUIDCache(unittest.TestCase):
+    """Tests for the username and UUID conversion cache."""
+
+    def test_both_directions(self) -> None:
+        cache = UUIDCache()
+        cache.set("VSCode_", "2a13b3a34bf343fa9d8db0f87187da39")
+
+        self.assertEqual(cache.get_uuid("vscode_"), "2a13b3a34bf343fa9d8db0f87187da39")
+        self.assertEqual(cache.get_username("2a13b3a3-4bf3-43fa-9d8d-b0f87187da39"), "VSCode_")
+
+    def test_negative_caching(self) -> None:
+        cache = UUIDCache(negative_ttl=60)
+        cache.set_missing("ewdijenwmim")
+
+        with self.assertRaises(PlayerNotFoundError):
+            cache.get_uuid("ewdijenwmim")
+
+    def test_bounded(self) -> None:
+        cache = UUIDCache(max_entries=2)
+
+        for index in range(3):
+            cache.set(f"player{index}", f"uuid{index}")
+
+        self.assertIsNone(cache.get_uuid("player0"))
+        self.assertEqual(cache.get_uuid("player2"), "uuid2")
@@ -0,0 +1,478 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from unittest import mock
+from urllib.parse import parse_qsl, urlsplit
+
+from hypixelio import AsyncClient, Client, ResponseCache, SQLiteCache
+from hypixelio._async.client import _LargePayload
+from hypixelio._async.session import SessionRegistry
+from hypixelio.exceptions import HypixelAPIError, PlayerNotFoundError, RateLimitError
+from hypixelio.models.player import Player
+from tests.mock_data.player_data import PLAYER_MOCK
+
+# The responses of a route to its parameters, as the status, the JSON payload and the headers
+Route = Callable[[Dict[str, str]], Tuple[int, Dict[str, Any], Dict[str, str]]]
+
+
+class FakeResponse:
+    """Response of the fake API, working like the responses of both `requests` and `aiohttp`."""
+
+    def __init__(self, api: "FakeAPI", status: int, payload: Dict[str, Any], headers: Dict[str, str]) -> None:
+        self.api = api
+        self.status = self.status_code = status
+        self.content = json.dumps(payload).encode()
+        self.headers = headers
+
+    def __enter__(self) -> "FakeResponse":
+        time.sleep(self.api.delay)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.api.finish()
+
+    async def __aenter__(self) -> "FakeResponse":
+        await asyncio.sleep(self.api.delay)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.api.finish()
+
+    async def read(self) -> bytes:
+        return self.content
+
+
+class FakeAPI:
+    """Session answering the requests of the clients using the routes given, and recording them."""
+
+    def __init__(self, routes: Dict[str, Route], delay: float = 0.01) -> None:
+        self.routes = routes
+        self.delay = delay
+
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self.headers: List[Dict[str, str]] = []
+
+        # The requests being answered, and the most answered at once
+        self.in_flight = self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> FakeResponse:
+        parts = urlsplit(url)
+        params = dict(parse_qsl(parts.query))
+
+        with self._lock:
+            self.requests.append((parts.path, params))
+            self.headers.append(dict(headers or {}))
+
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            return FakeResponse(self, *self.routes[parts.path](params))
+        except BaseException:
+            self.finish()
+            raise
+
+    def finish(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def close(self) -> None:
+        pass
+
+    def client(self, api_key: Union[str, List[str]] = "key", **kwargs: Any) -> Client:
+        client = Client(api_key=api_key, **kwargs)
+        client._session = self  # type: ignore[assignment]
+
+        return client
+
+    def async_client(self, **kwargs: Any) -> AsyncClient:
+        return AsyncClient(api_key="key", sessions=FakeSessions(self), **kwargs)
+
+
+class FakeSessions(SessionRegistry):
+    """Registry giving the fake API as the session of every API."""
+
+    def __init__(self, api: FakeAPI) -> None:
+        super().__init__()
+        self.api = api
+
+    def get(self, name: str) -> Any:
+        return self.api
+
+    async def close(self) -> None:
+        pass
+
+
+def ok(payload: Dict[str, Any], headers: Dict[str, str] = {}) -> Route:
+    return lambda params: (200, {"success": True, **payload}, headers)
+
+
+def fetch_player(url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Give the player response for an UUID, or fail the way its name says."""
+    uuid = data["uuid"]
+
+    if uuid == "missing":
+        return {"success": True, "player": None}
+    if uuid == "malformed":
+        return {"success": True, "player": {"uuid": uuid}}
+    if uuid == "disconnected":
+        raise ConnectionError("Connection reset by peer")
+
+    return {"success": True, "player": dict(PLAYER_MOCK, uuid=uuid)}
+
+
+class TestBulkPlayers(unittest.TestCase):
+    """Tests for getting many players at once, without a failure stopping the others."""
+
+    uuids = ["first", "missing", "malformed", "disconnected", "second"]
+
+    def check_players(self, players: Dict[str, Any]) -> None:
+        self.assertEqual(list(players), self.uuids)
+
+        self.assertIsInstance(players["first"], Player)
+        self.assertIsInstance(players["second"], Player)
+        self.assertIsInstance(players["missing"], PlayerNotFoundError)
+        self.assertIsInstance(players["malformed"], KeyError)
+        self.assertIsInstance(players["disconnected"], ConnectionError)
+
+    def test_get_players(self) -> None:
+        client = Client(api_key="key")
+        client._fetch = fetch_player  # type: ignore[assignment]
+
+        self.check_players(client.get_players(self.uuids, concurrency=2))
+
+    def test_get_players_async(self) -> None:
+        async def fetch(url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+            await asyncio.sleep(0)
+            return fetch_player(url, data)
+
+        async def get_players() -> Dict[str, Any]:
+            async with AsyncClient(api_key="key") as client:
+                client._fetch = fetch  # type: ignore[assignment]
+                return await client.get_players(self.uuids, concurrency=2)
+
+        self.check_players(asyncio.run(get_players()))
+
+    def test_api_errors(self) -> None:
+        def fail(url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+            raise HypixelAPIError("Invalid API key")
+
+        client = Client(api_key="key")
+        client._fetch = fail  # type: ignore[assignment]
+
+        self.assertIsInstance(client.get_players(["first"])["first"], HypixelAPIError)
+
+
+class TestRatelimitedCache(unittest.TestCase):
+    """Tests for using the cached responses once the keys have been ratelimited."""
+
+    def setUp(self) -> None:
+        self.api = FakeAPI({"/resources/quests": ok({"quests": {}}), "/boosters": ok({"boosters": []})})
+
+    def test_cached_responses(self) -> None:
+        client = self.api.client(cache=ResponseCache())
+        client._fetch(client.url["quests"])
+
+        client._ratelimits["key"].hit(60)
+
+        self.assertEqual(client._fetch(client.url["quests"]), {"success": True, "quests": {}})
+        with self.assertRaises(RateLimitError):
+            client._fetch(client.url["boosters"])
+
+    def test_cached_responses_async(self) -> None:
+        async def fetch() -> None:
+            async with self.api.async_client(cache=ResponseCache()) as client:
+                await client._fetch(client.url["quests"])
+
+                client._ratelimits["key"].hit(60)
+
+                self.assertEqual(await client._fetch(client.url["quests"]), {"success": True, "quests": {}})
+                with self.assertRaises(RateLimitError):
+                    await client._fetch(client.url["boosters"])
+
+        asyncio.run(fetch())
+
+
+class RecordingCache(SQLiteCache):
+    """SQLite cache recording the threads it's used from."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.threads: List[str] = []
+
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        self.threads.append(threading.current_thread().name)
+        return super().get(*args, **kwargs)
+
+    def set(self, *args: Any, **kwargs: Any) -> None:
+        self.threads.append(threading.current_thread().name)
+        super().set(*args, **kwargs)
+
+    def delete(self, *args: Any, **kwargs: Any) -> None:
+        self.threads.append(threading.current_thread().name)
+        super().delete(*args, **kwargs)
+
+
+class TestOffloading(unittest.TestCase):
+    """Tests for handling the large responses and the SQLite cache off the event loop of the async client."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = RecordingCache(os.path.join(self.directory.name, "cache.sqlite3"))
+        self.api = FakeAPI({"/resources/achievements": ok({"achievements": {"one_time": {}}})})
+
+    def tearDown(self) -> None:
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_sqlite_cache(self) -> None:
+        async def fetch_twice() -> List[Any]:
+            async with self.api.async_client(cache=self.cache) as client:
+                return [await client._fetch(client.url["achievements"]) for _ in range(2)]
+
+        first, second = asyncio.run(fetch_twice())
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.api.requests), 1)
+        self.assertEqual(len(self.cache.threads), 3)
+        self.assertNotIn(threading.current_thread().name, self.cache.threads)
+
+    def test_large_responses(self) -> None:
+        executor = ThreadPoolExecutor(1)
+
+        async def fetch_twice() -> List[Any]:
+            async with self.api.async_client(cache=self.cache, executor=executor, offload_threshold=16) as client:
+                return [await client._fetch(client.url["achievements"]) for _ in range(2)]
+
+        with mock.patch.object(executor, "submit", wraps=executor.submit) as submit:
+            first, second = asyncio.run(fetch_twice())
+
+        executor.shutdown()
+
+        # Decoded in the executor, and marked so that the models are built there too, even once cached
+        self.assertEqual(submit.call_count, 1)
+        self.assertIsInstance(first, _LargePayload)
+        self.assertIsInstance(second, _LargePayload)
+
+
+class TestCoalescing(unittest.TestCase):
+    """Tests for sharing the response of an identical request already in-flight."""
+
+    def setUp(self) -> None:
+        self.api = FakeAPI(
+            {"/boosters": ok({"boosters": []}), "/watchdogstats": lambda params: (403, {"success": False}, {})},
+            delay=0.05,
+        )
+
+    def fetch_in_threads(self, client: Client, endpoint: str) -> List[Any]:
+        """Fetch an endpoint from many threads at once, giving the responses or the errors raised."""
+        barrier = threading.Barrier(8)
+
+        def fetch(_: int) -> Any:
+            barrier.wait()
+
+            try:
+                return client._fetch(client.url[endpoint])
+            except HypixelAPIError as exc:
+                return exc
+
+        with ThreadPoolExecutor(8) as executor:
+            return list(executor.map(fetch, range(8)))
+
+    def test_threads(self) -> None:
+        client = self.api.client()
+
+        self.assertEqual(self.fetch_in_threads(client, "boosters"), [{"success": True, "boosters": []}] * 8)
+        self.assertEqual(len(self.api.requests), 1)
+
+        failures = self.fetch_in_threads(client, "watchdog")
+        self.assertTrue(all(isinstance(failure, HypixelAPIError) for failure in failures))
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_tasks(self) -> None:
+        async def fetch() -> Tuple[List[Any], List[Any]]:
+            async with self.api.async_client() as client:
+                responses = await asyncio.gather(*[client._fetch(client.url["boosters"]) for _ in range(8)])
+                failures = await asyncio.gather(
+                    *[client._fetch(client.url["watchdog"]) for _ in range(8)], return_exceptions=True
+                )
+
+                return responses, failures
+
+        responses, failures = asyncio.run(fetch())
+
+        self.assertEqual(responses, [{"success": True, "boosters": []}] * 8)
+        self.assertTrue(all(isinstance(failure, HypixelAPIError) for failure in failures))
+        self.assertEqual(len(self.api.requests), 2)
+
+    def test_different_requests(self) -> None:
+        client = self.api.client()
+
+        with ThreadPoolExecutor(2) as executor:
+            list(executor.map(lambda decode: client._fetch(client.url["boosters"], decode=decode), (True, False)))
+
+        self.assertEqual(len(self.api.requests), 2)
+
+
+class AuctionHouse:
+    """Route of the fake auction house, which is updated after the requests given."""
+
+    def __init__(self, pages: int, updates: List[int]) -> None:
+        self.pages = pages
+        self.updates = updates
+        self.requests = 0
+
+        # The pages served, along with the update they're from
+        self.served: List[Tuple[int, int]] = []
+
+    def __call__(self, params: Dict[str, str]) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        self.requests += 1
+        last_updated = sum(self.requests > update for update in self.updates)
+        page = int(params["page"])
+        self.served.append((page, last_updated))
+
+        auction = {
+            "_id": f"{page}-{last_updated}",
+            "uuid": f"{page}-{last_updated}",
+            "auctioneer": "5e22209be5864a088761aa6bde56a090",
+            "item_name": "Aspect of the End",
+            "item_lore": "",
+            "category": "weapon",
+            "tier": "RARE",
+            "starting_bid": 100,
+            "highest_bid_amount": 0,
+        }
+        payload = {
+            "page": page,
+            "totalPages": self.pages,
+            "totalAuctions": self.pages,
+            "lastUpdated": last_updated,
+            "auctions": [auction],
+        }
+
+        return 200, {"success": True, **payload}, {}
+
+
+class TestAuctionCrawler(unittest.TestCase):
+    """Tests for crawling all the pages of the auction house as one snapshot."""
+
+    def test_restart(self) -> None:
+        # Updated while the third page is fetched, so the crawl is restarted
+        api = FakeAPI({"/skyblock/auctions": AuctionHouse(6, [2])})
+        auctions = api.client().fetch_all_active_auctions(concurrency=2)
+
+        self.assertEqual([auction.uuid for auction in auctions.auctions], [f"{page}-1" for page in range(6)])
+        self.assertLessEqual(api.max_in_flight, 2)
+
+    def test_restart_async(self) -> None:
+        api = FakeAPI({"/skyblock/auctions": AuctionHouse(6, [2])})
+
+        async def crawl() -> Any:
+            async with api.async_client() as client:
+                return await client.fetch_all_active_auctions(concurrency=2)
+
+        auctions = asyncio.run(crawl())
+
+        self.assertEqual([auction.uuid for auction in auctions.auctions], [f"{page}-1" for page in range(6)])
+        self.assertLessEqual(api.max_in_flight, 2)
+
+    def test_keeps_updating(self) -> None:
+        api = FakeAPI({"/skyblock/auctions": AuctionHouse(3, [1, 3, 5, 7, 9])})
+
+        with self.assertRaises(HypixelAPIError):
+            api.client().fetch_all_active_auctions(max_restarts=2)
+
+        self.assertEqual(len(api.requests), 3 * 3)
+
+    def test_outdated_pages_uncached(self) -> None:
+        auction_house = AuctionHouse(6, [2])
+        api = FakeAPI({"/skyblock/auctions": auction_house})
+
+        auctions = api.client(cache=ResponseCache()).fetch_all_active_auctions(concurrency=2)
+        self.assertEqual(auctions.last_updated, 1)
+
+        # The cached pages of the new snapshot are used, while the outdated ones are fetched again
+        for page in range(6):
+            self.assertEqual(auction_house.served.count((page, 1)), 1)
+
+
+class TestRawMode(unittest.TestCase):
+    """Tests for getting the JSON payloads or the response bodies, without building the models."""
+
+    def setUp(self) -> None:
+        self.api = FakeAPI(
+            {
+                "/boosters": ok({"boosters": [], "boosterState": {"decrementing": True}}),
+                "/resources/quests": ok({"lastUpdated": 1, "quests": {"bedwars": []}}),
+                "/watchdogstats": lambda params: (403, {"success": False}, {}),
+            }
+        )
+        self.boosters = {"success": True, "boosters": [], "boosterState": {"decrementing": True}}
+
+    def test_payloads(self) -> None:
+        client = self.api.client(raw=True)
+
+        self.assertEqual(client.get_boosters(), self.boosters)
+        self.assertEqual(client.get_resources_quests(), {"success": True, "lastUpdated": 1, "quests": {"bedwars": []}})
+        self.assertEqual(client.get_raw("boosters", decode=False), json.dumps(self.boosters).encode())
+
+        # The failures are still raised
+        with self.assertRaises(HypixelAPIError):
+            client.get_watchdog_info()
+
+    def test_payloads_async(self) -> None:
+        async def fetch() -> List[Any]:
+            async with self.api.async_client(raw=True) as client:
+                return [
+                    await client.get_boosters(),
+                    await client.get_resources_quests(),
+                    await client.get_raw("boosters", decode=False),
+                ]
+
+        boosters, quests, body = asyncio.run(fetch())
+
+        self.assertEqual(boosters, self.boosters)
+        self.assertEqual(quests["quests"], {"bedwars": []})
+        self.assertEqual(body, json.dumps(self.boosters).encode())
+
+    def test_models(self) -> None:
+        client = self.api.client()
+
+        self.assertEqual(client.get_resources_quests(), {"bedwars": []})
+        self.assertFalse(isinstance(client.get_boosters(), dict))
+
+
+class TestConcurrency(unittest.TestCase):
+    """Tests for sending the requests concurrently, within the limits of the clients."""
+
+    def setUp(self) -> None:
+        self.api = FakeAPI({"/player": lambda params: (200, fetch_player("/player", params), {})})
+        self.uuids = [f"player-{index}" for index in range(12)]
+
+    def test_async_pipeline(self) -> None:
+        async def fetch() -> List[Any]:
+            async with self.api.async_client(max_concurrency=4) as client:
+                return await asyncio.gather(*[client.get_player(uuid=uuid) for uuid in self.uuids])
+
+        players = asyncio.run(fetch())
+
+        self.assertEqual([player.uuid for player in players], self.uuids)
+        self.assertEqual(self.api.max_in_flight, 4)
+
+    def test_threads(self) -> None:
+        client = self.api.client(api_key=["first", "second"])
+        players = client.get_players(self.uuids, concurrency=4)
+
+        self.assertTrue(all(isinstance(player, Player) for player in players.values()))
+        self.assertEqual(self.api.max_in_flight, 4)
+
+        # Every request sends its own key, without sharing the headers of the client
+        self.assertEqual({headers["API-Key"] for headers in self.api.headers}, {"first", "second"})
+        self.assertNotIn("API-Key", client.headers)
@@ -1,6 +1,24 @@
+import asyncio
+import re
 import unittest
+from typing import List, Optional, Union
 
-from hypixelio import Converters as Conv
+from hypixelio import AsyncConverters, Converters as Conv
+from hypixelio.cache import UUIDCache
+from hypixelio.exceptions import MojangAPIError, PlayerNotFoundError
+
+PROFILES = {"janasunrise": "c8438cdd126043448cca9e28646efbe7", "vscode_": "2a13b3a34bf343fa9d8db0f87187da39"}
+
+
+def fetch_profiles(usernames: List[str], ratelimited: bool = False) -> list:
+    """Answer a bulk request like the Mojang API, failing for the badly formed usernames."""
+    if ratelimited:
+        raise MojangAPIError("An error occurred! Too many requests")
+
+    if any(not re.fullmatch(r"\w{1,16}", username) for username in usernames):
+        raise PlayerNotFoundError("Badly formed UUID error", None)
+
+    return [{"id": PROFILES[name.lower()], "name": name} for name in usernames if name.lower() in PROFILES]
 
 
 class TestUsernameToUUID(unittest.TestCase):
@@ -29,3 +47,75 @@ class TestUUIDToUsername(unittest.TestCase):
 
         for username, uuid in test_cases:
             self.assertEqual(username, Conv.uuid_to_username(uuid))
+
+
+class FakeConverters(Conv):
+    """Converters answering the bulk requests from the profiles given, without the Mojang API."""
+
+    cache = UUIDCache()
+    requests: List[List[str]] = []
+    ratelimited = False
+
+    @classmethod
+    def _fetch(cls, url: str, data: Optional[list] = None) -> Union[dict, list]:
+        cls.requests.append(data)
+        return fetch_profiles(data, cls.ratelimited)
+
+
+class FakeAsyncConverters(AsyncConverters):
+    """Async converters answering the bulk requests from the profiles given, without the Mojang API."""
+
+    cache = UUIDCache()
+
+    @classmethod
+    async def _fetch(cls, url: str, data: Optional[list] = None) -> Union[dict, list]:
+        await asyncio.sleep(0)
+        return fetch_profiles(data)
+
+
+class TestUsernamesToUUIDs(unittest.TestCase):
+    """Tests for the bulk conversion of the usernames to UUIDs."""
+
+    usernames = ["janaSunrise", "bad name!", "VSCode_", "missing"]
+    found = {"janaSunrise": PROFILES["janasunrise"], "VSCode_": PROFILES["vscode_"]}
+
+    def setUp(self) -> None:
+        FakeConverters.cache.clear()
+        FakeConverters.requests = []
+        FakeConverters.ratelimited = False
+        FakeAsyncConverters.cache.clear()
+
+    def test_batches(self) -> None:
+        usernames = ["janaSunrise", "VSCode_", "missing"] + [f"player{index}" for index in range(10)]
+        uuids = FakeConverters.usernames_to_uuids(usernames)
+
+        self.assertEqual(
+            uuids, {"janaSunrise": "c8438cdd126043448cca9e28646efbe7", "VSCode_": "2a13b3a34bf343fa9d8db0f87187da39"}
+        )
+        self.assertEqual([len(batch) for batch in FakeConverters.requests], [10, 3])
+
+        # Cached, including the usernames which weren't found
+        FakeConverters.usernames_to_uuids(usernames)
+        self.assertEqual(len(FakeConverters.requests), 2)
+
+    def test_badly_formed_username(self) -> None:
+        self.assertEqual(FakeConverters.usernames_to_uuids(self.usernames), self.found)
+
+        # Only the badly formed username is missed, and cached as not found
+        with self.assertRaises(PlayerNotFoundError):
+            FakeConverters.cache.get_uuid("bad name!")
+
+    def test_badly_formed_username_async(self) -> None:
+        uuids = asyncio.run(FakeAsyncConverters.usernames_to_uuids(self.usernames))
+
+        self.assertEqual(uuids, self.found)
+        with self.assertRaises(PlayerNotFoundError):
+            FakeAsyncConverters.cache.get_uuid("bad name!")
+
+    def test_ratelimited(self) -> None:
+        FakeConverters.ratelimited = True
+        self.assertEqual(FakeConverters.usernames_to_uuids(self.usernames), {})
+
+        # The usernames might exist, so they're resolved on the next try
+        FakeConverters.ratelimited = False
+        self.assertEqual(FakeConverters.usernames_to_uuids(self.usernames), self.found)
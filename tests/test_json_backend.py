@@ -0,0 +1,26 @@
+import json
+import unittest
+
+from hypixelio import json_backend
+
+
+class TestJSONBackend(unittest.TestCase):
+    """Tests for the pluggable JSON backends."""
+
+    def tearDown(self) -> None:
+        json_backend.set_backend()
+
+    def test_backends_agree(self) -> None:
+        body = '{"success": true, "auctions": [{"item_name": "§6Hyperion", "highest_bid_amount": 900000000}]}'
+        expected = json.loads(body)
+
+        for name in json_backend._FUNCTIONS:
+            with self.subTest(backend=name):
+                json_backend.set_backend(name)
+
+                self.assertEqual(json_backend.loads(body.encode()), expected)
+                self.assertEqual(json_backend.loads(json_backend.dumps(expected)), expected)
+
+    def test_unknown_backend(self) -> None:
+        with self.assertRaises(ValueError):
+            json_backend.set_backend("simplejson")
@@ -0,0 +1,30 @@
+import unittest
+
+from hypixelio.models.player import FIELDS, LazyPlayer, Player
+from tests.mock_data.player_data import PLAYER_MOCK
+
+
+class TestLazyPlayer(unittest.TestCase):
+    """Tests for parsing the players upfront and on the first access to their fields."""
+
+    def test_same_fields(self) -> None:
+        player, lazy_player = Player(PLAYER_MOCK), LazyPlayer(PLAYER_MOCK)
+
+        self.assertEqual(list(vars(player)), list(FIELDS))
+        self.assertEqual(set(Player.__annotations__), set(FIELDS))
+
+        for field, value in vars(player).items():
+            self.assertEqual(getattr(lazy_player, field), value)
+
+        self.assertEqual(vars(lazy_player), {"_data": PLAYER_MOCK, **vars(player)})
+
+    def test_caching(self) -> None:
+        player = LazyPlayer(dict(PLAYER_MOCK))
+        self.assertNotIn("name", vars(player))
+
+        self.assertEqual(player.name, "TestPlayer123")
+        self.assertIn("name", vars(player))
+
+        player._data["displayname"] = "Renamed"
+        self.assertEqual(player.name, "TestPlayer123")
+        self.assertIs(player.social_media, player.social_media)
@@ -0,0 +1,33 @@
+import unittest
+
+from hypixelio import Client
+from hypixelio.exceptions import RateLimitError
+
+
+class TestKeyScheduling(unittest.TestCase):
+    """Tests for the per-key ratelimit accounting and key scheduling."""
+
+    def test_least_loaded_key(self) -> None:
+        client = Client(api_key=["first", "second"])
+
+        client._update_ratelimit(
+            "first", {"RateLimit-Limit": 120, "RateLimit-Remaining": 5, "RateLimit-Reset": 60}
+        )
+        client._update_ratelimit(
+            "second", {"RateLimit-Limit": 120, "RateLimit-Remaining": 50, "RateLimit-Reset": 60}
+        )
+
+        self.assertEqual(client._select_key(), "second")
+        self.assertEqual(client.requests_remaining, 54)
+
+    def test_exhausted_keys(self) -> None:
+        client = Client(api_key=["first", "second"])
+
+        for key in ("first", "second"):
+            client._update_ratelimit(
+                key, {"RateLimit-Limit": 120, "RateLimit-Remaining": 0, "RateLimit-Reset": 60}
+            )
+
+        self.assertTrue(client._is_ratelimit_hit())
+        with self.assertRaises(RateLimitError):
+            client._select_key()
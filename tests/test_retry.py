@@ -0,0 +1,71 @@
+import unittest
+
+from hypixelio import Client, RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Tests for deciding when and how long to wait before retrying the failed requests."""
+
+    def test_retries_per_status(self) -> None:
+        policy = RetryPolicy(max_attempts=10, statuses={500: 2})
+
+        self.assertTrue(policy.should_retry(1, 500))
+        self.assertTrue(policy.should_retry(2, 500))
+        self.assertFalse(policy.should_retry(3, 500))
+        self.assertFalse(policy.should_retry(1, 400))
+
+    def test_max_attempts(self) -> None:
+        policy = RetryPolicy(max_attempts=2, statuses={503: 5})
+
+        self.assertTrue(policy.should_retry(1, 503))
+        self.assertFalse(policy.should_retry(2, 503))
+
+    def test_non_idempotent_methods(self) -> None:
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.should_retry(1, 503, method="get"))
+        self.assertFalse(policy.should_retry(1, 503, method="POST"))
+
+    def test_timeouts(self) -> None:
+        self.assertTrue(RetryPolicy().should_retry(1))
+        self.assertFalse(RetryPolicy(retry_on_timeout=False).should_retry(1))
+
+    def test_backoff(self) -> None:
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+
+        self.assertEqual([policy.backoff(attempt) for attempt in range(1, 6)], [0.5, 1, 2, 3, 3])
+
+    def test_backoff_jitter(self) -> None:
+        policy = RetryPolicy(backoff_factor=1, max_backoff=30)
+
+        for _ in range(100):
+            self.assertTrue(0 <= policy.backoff(3) <= 4)
+
+    def test_retry_after(self) -> None:
+        policy = RetryPolicy(max_backoff=30)
+
+        self.assertEqual(policy.backoff(1, retry_after=12), 12.0)
+        self.assertIsNone(policy.backoff(1, retry_after=45))
+        self.assertEqual(RetryPolicy(respect_retry_after=False, jitter=False).backoff(1, retry_after=45), 0.5)
+
+
+class TestRetryDelay(unittest.TestCase):
+    """Tests for the delays of the clients before retrying the ratelimited requests."""
+
+    def test_keyless_ratelimit_backs_off(self) -> None:
+        client = Client(api_key=["first", "second"], retry_policy=RetryPolicy(jitter=False))
+
+        self.assertEqual(client._retry_delay(1, None, 429, {"Retry-After": "5"}), 5.0)
+        self.assertEqual(client._retry_delay(2, None, 429, {}), 1.0)
+
+    def test_switches_to_another_key(self) -> None:
+        client = Client(api_key=["first", "second"])
+
+        self.assertEqual(client._retry_delay(1, "first", 429, {"Retry-After": "5"}), 0.0)
+        self.assertEqual(client._select_key(), "second")
+
+    def test_waits_for_long_ratelimits(self) -> None:
+        headers = {"Retry-After": "45"}
+
+        self.assertIsNone(Client(api_key="first")._retry_delay(1, "first", 429, headers))
+        self.assertEqual(Client(api_key="first", wait_on_ratelimit=True)._retry_delay(1, "first", 429, headers), 0.0)